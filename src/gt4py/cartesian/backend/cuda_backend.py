@@ -117,6 +117,7 @@ class CudaBindingsCodegen(codegen.TemplatedGenerator):
             node,
             entry_params=entry_params,
             sid_params=sid_params,
+            release_gil=self.backend.builder.options.backend_opts.get("release_gil", True),
             **kwargs,
         )
 
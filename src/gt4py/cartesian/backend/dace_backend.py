@@ -725,6 +725,7 @@ class DaCeBindingsCodegen:
             module_name=module_name,
             entry_params=self.generate_entry_params(stencil_ir, sdfg),
             sid_params=self.generate_sid_params(sdfg),
+            release_gil=self.backend.builder.options.backend_opts.get("release_gil", True),
         )
 
     @classmethod
@@ -87,6 +87,7 @@ def bindings_main_template():
     return as_mako(
         """
         #include <chrono>
+        #include <tuple>
         #include <pybind11/pybind11.h>
         #include <pybind11/stl.h>
         #include <gridtools/storage/adapter/python_sid_adapter.hpp>
@@ -109,7 +110,15 @@ def bindings_main_template():
                             std::chrono::high_resolution_clock::now().time_since_epoch()).count())/1e9;
                 }
 
-                ${name}(domain)(${','.join(sid_params)});
+                // SIDs are created (and destroyed) while holding the GIL since they keep
+                // references to the Python buffers of the arguments
+                auto sids = std::make_tuple(${','.join(sid_params)});
+                {
+                    % if release_gil:
+                    py::gil_scoped_release release;
+                    % endif
+                    std::apply(${name}(domain), sids);
+                }
 
                 if (!exec_info.is(py::none()))
                 {
@@ -232,6 +241,7 @@ class BaseGTBackend(gt_backend.BasePyExtBackend, gt_backend.CLIBackendMixin):
         "debug_mode": {"versioning": True, "type": bool},
         "verbose": {"versioning": False, "type": bool},
         "oir_pipeline": {"versioning": True, "type": OirPipeline},
+        "release_gil": {"versioning": True, "type": bool},
     }
 
     GT_BACKEND_T: str
@@ -119,6 +119,7 @@ class GTCppBindingsCodegen(codegen.TemplatedGenerator):
             node,
             entry_params=entry_params,
             sid_params=sid_params,
+            release_gil=self.backend.builder.options.backend_opts.get("release_gil", True),
             **kwargs,
         )
 
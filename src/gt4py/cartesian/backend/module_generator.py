@@ -13,6 +13,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import abc
+import functools
 import numbers
 import sys
 from dataclasses import dataclass, field
@@ -118,6 +119,15 @@ def make_args_data_from_gtir(pipeline: GtirPipeline) -> ModuleData:
     return data
 
 
+@functools.lru_cache(maxsize=None)
+def _load_template(resource: str) -> jinja2.Template:
+    return jinja2.Template(
+        importlib_resources.files("gt4py.cartesian.backend.templates")
+        .joinpath(resource)
+        .read_text()
+    )
+
+
 class BaseModuleGenerator(abc.ABC):
     SOURCE_LINE_LENGTH = 120
     TEMPLATE_INDENT_SIZE = 4
@@ -134,11 +144,7 @@ class BaseModuleGenerator(abc.ABC):
     def __init__(self, builder: Optional["StencilBuilder"] = None):
         self._builder = builder
         self.args_data = ModuleData()
-        self.template = jinja2.Template(
-            importlib_resources.files("gt4py.cartesian.backend.templates")
-            .joinpath(self.TEMPLATE_RESOURCE)
-            .read_text()
-        )
+        self.template = _load_template(self.TEMPLATE_RESOURCE)
 
     def __call__(
         self,
@@ -173,6 +179,8 @@ class BaseModuleGenerator(abc.ABC):
             stencil_signature=self.generate_signature(),
             field_names=self.args_data.field_names,
             param_names=self.args_data.parameter_names,
+            run_field_names=list(self.args_data.field_info.keys()),
+            run_param_names=list(self.args_data.parameter_info.keys()),
             pre_run=self.generate_pre_run(),
             post_run=self.generate_post_run(),
             implementation=self.generate_implementation(),
@@ -56,6 +56,11 @@ class ModuleGenerator(BaseModuleGenerator):
         params.extend(["_domain_=_domain_", "_origin_=_origin_"])
         return f"computation.run({', '.join(params)})"
 
+    def generate_class_members(self) -> str:
+        res = super().generate_class_members()
+        res += "\n_temporary_pool = computation._temporary_pool_\n"
+        return res
+
     @property
     def backend(self) -> "NumpyBackend":
         return cast(NumpyBackend, self.builder.backend)
@@ -78,6 +78,31 @@ cache_settings: Dict[str, Any] = {
     "root_path": os.environ.get("GT_CACHE_ROOT", os.path.abspath(".")),
     "load_retries": int(os.environ.get("GT_CACHE_LOAD_RETRIES", 3)),
     "load_retry_delay": int(os.environ.get("GT_CACHE_LOAD_RETRY_DELAY", 100)),  # unit milliseconds
+    # max number of (domain, origin) pairs cached per stencil object ("none" means unbounded)
+    "domain_origin_cache_size": (
+        None
+        if os.environ.get("GT_DOMAIN_ORIGIN_CACHE_SIZE", "").lower() == "none"
+        else int(os.environ.get("GT_DOMAIN_ORIGIN_CACHE_SIZE", 1024))
+    ),
+    # max bytes of idle temporary buffers kept per numpy stencil ("none" means unbounded)
+    "temporary_pool_size": (
+        None
+        if os.environ.get("GT_TEMPORARY_POOL_SIZE", "").lower() == "none"
+        else int(os.environ.get("GT_TEMPORARY_POOL_SIZE", 512 * 1024**2))
+    ),
+    # max bytes of idle temporary buffers kept by all numpy stencils ("none" means unbounded)
+    "temporary_pool_total_size": (
+        None
+        if os.environ.get("GT_TEMPORARY_POOL_TOTAL_SIZE", "").lower() == "none"
+        else int(os.environ.get("GT_TEMPORARY_POOL_TOTAL_SIZE", 2 * 1024**3))
+    ),
+}
+
+storage_settings: Dict[str, Any] = {
+    # allocate large CPU storages on transparent huge pages (Linux only)
+    "huge_pages": bool(int(os.environ.get("GT_HUGE_PAGES", 0))),
+    # min bytes of the CPU storages allocated on huge pages
+    "huge_pages_min_size": int(os.environ.get("GT_HUGE_PAGES_MIN_SIZE", 32 * 1024**2)),
 }
 
 code_settings: Dict[str, Any] = {"root_package_name": "_GT_"}
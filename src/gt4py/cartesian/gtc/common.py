@@ -401,8 +401,12 @@ class AssignStmt(eve.GenericNode, Generic[TargetT, ExprT]):
     right: ExprT
 
 
-def _make_root_validator(impl: datamodels.RootValidator) -> datamodels.RootValidator:
-    return datamodels.root_validator(typing.cast(datamodels.RootValidator, classmethod(impl)))
+def _make_root_validator(
+    impl: datamodels.RootValidator, *, derives_data: bool = False
+) -> datamodels.RootValidator:
+    return datamodels.root_validator(
+        typing.cast(datamodels.RootValidator, classmethod(impl)), derives_data=derives_data
+    )
 
 
 def assign_stmt_dtype_validation(*, strict: bool) -> datamodels.RootValidator:
@@ -426,12 +430,12 @@ class UnaryOp(eve.GenericNode, Generic[ExprT]):
     op: UnaryOperator
     expr: ExprT
 
-    @datamodels.root_validator
+    @datamodels.root_validator(derives_data=True)
     @classmethod
     def dtype_propagation(cls: Type[UnaryOp], instance: UnaryOp) -> None:
         instance.dtype = instance.expr.dtype  # type: ignore[attr-defined]
 
-    @datamodels.root_validator
+    @datamodels.root_validator(derives_data=True)
     @classmethod
     def kind_propagation(cls: Type[UnaryOp], instance: UnaryOp) -> None:
         instance.kind = instance.expr.kind  # type: ignore[attr-defined]
@@ -463,7 +467,7 @@ class BinaryOp(eve.GenericNode, Generic[ExprT]):
     left: ExprT
     right: ExprT
 
-    @datamodels.root_validator
+    @datamodels.root_validator(derives_data=True)
     @classmethod
     def kind_propagation(cls: Type[BinaryOp], instance: BinaryOp) -> None:
         instance.kind = compute_kind(instance.left, instance.right)  # type: ignore[attr-defined]
@@ -489,7 +493,7 @@ def binary_op_dtype_propagation(*, strict: bool) -> datamodels.RootValidator:
             elif isinstance(instance.op, ComparisonOperator):
                 instance.dtype = DataType.BOOL  # type: ignore[attr-defined]
 
-    return _make_root_validator(_impl)
+    return _make_root_validator(_impl, derives_data=True)
 
 
 class TernaryOp(eve.GenericNode, Generic[ExprT]):
@@ -511,7 +515,7 @@ class TernaryOp(eve.GenericNode, Generic[ExprT]):
     def condition_is_boolean(self, attribute: datamodels.Attribute, value: Expr) -> None:
         return verify_condition_is_boolean(self, value)
 
-    @datamodels.root_validator
+    @datamodels.root_validator(derives_data=True)
     @classmethod
     def kind_propagation(cls: Type[TernaryOp], instance: TernaryOp) -> None:
         instance.kind = compute_kind(instance.true_expr, instance.false_expr)  # type: ignore[attr-defined]
@@ -525,14 +529,14 @@ def ternary_op_dtype_propagation(*, strict: bool) -> datamodels.RootValidator:
         if common_dtype:
             instance.dtype = common_dtype  # type: ignore[attr-defined]
 
-    return _make_root_validator(_impl)
+    return _make_root_validator(_impl, derives_data=True)
 
 
 class Cast(eve.GenericNode, Generic[ExprT]):
     dtype: DataType
     expr: ExprT
 
-    @datamodels.root_validator
+    @datamodels.root_validator(derives_data=True)
     @classmethod
     def kind_propagation(cls: Type[Cast], instance: Cast) -> None:
         instance.kind = compute_kind(instance.expr)  # type: ignore[attr-defined]
@@ -550,7 +554,7 @@ class NativeFuncCall(eve.GenericNode, Generic[ExprT]):
                 f"{instance.func} accepts {instance.func.arity} arguments, {len(instance.args)} where passed."
             )
 
-    @datamodels.root_validator
+    @datamodels.root_validator(derives_data=True)
     @classmethod
     def kind_propagation(cls: Type[NativeFuncCall], instance: NativeFuncCall) -> None:
         instance.kind = compute_kind(*instance.args)  # type: ignore[attr-defined]
@@ -566,7 +570,7 @@ def native_func_call_dtype_propagation(*, strict: bool = True) -> datamodels.Roo
             if common_dtype:
                 instance.dtype = common_dtype  # type: ignore[attr-defined]
 
-    return _make_root_validator(_impl)
+    return _make_root_validator(_impl, derives_data=True)
 
 
 def validate_dtype_is_set() -> datamodels.RootValidator:
@@ -23,6 +23,9 @@ class FuseKernels(NodeTranslator):
     Fuse kernels that are directly translated from OIR vertical loops into separate kernels if no synchronization is required.
     """
 
+    # the vertical loops of the visited kernels are extended in place
+    REUSE_UNCHANGED_NODES = False
+
     def visit_Program(self, node: cuir.Program) -> cuir.Program:
         def is_parallel(kernel: cuir.Kernel) -> bool:
             parallel = [
@@ -95,8 +95,10 @@ ORIGIN_CORRECTED_VIEW_CLASS = textwrap.dedent(
             self.offsets = offsets
 
         @classmethod
-        def empty(cls, shape, dtype, offset):
-            return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+        def empty(cls, shape, dtype, offset, temporaries=None):
+            if temporaries is None:
+                return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+            return cls(temporaries.empty(shape, dtype), offset, (True, True, True))
 
         def shim_key(self, key):
             new_args = []
@@ -161,10 +163,10 @@ class NpirCodegen(codegen.TemplatedGenerator, eve.VisitorWithSymbolTableTrait):
         ]
         offset = [str(off) for off in node.offset] + ["0"] * (1 + len(node.data_dims))
         dtype = self.visit(node.dtype, **kwargs)
-        return f"{node.name} = Field.empty(({', '.join(shape)}), {dtype}, ({', '.join(offset)}))"
+        return f"{node.name} = Field.empty(({', '.join(shape)}), {dtype}, ({', '.join(offset)}), _temporaries_)"
 
     LocalScalarDecl = as_fmt(
-        "{name} = Field.empty((_dI_ + {upper[0] + lower[0]}, _dJ_ + {upper[1] + lower[1]}, {ksize}), {dtype}, ({', '.join(str(l) for l in lower)}, 0))"
+        "{name} = Field.empty((_dI_ + {upper[0] + lower[0]}, _dJ_ + {upper[1] + lower[1]}, {ksize}), {dtype}, ({', '.join(str(l) for l in lower)}, 0), _temporaries_)"
     )
 
     VarKOffset = as_fmt("lk + {k}")
@@ -389,9 +391,12 @@ class NpirCodegen(codegen.TemplatedGenerator, eve.VisitorWithSymbolTableTrait):
 
             import numpy as np
             from gt4py.cartesian.gtc import ufuncs
+            from gt4py.cartesian.gtc.numpy.temporary_pool import TemporaryBufferPool
 
             {{ data_view_class }}
 
+            _temporary_pool_ = TemporaryBufferPool.from_config()
+
             def run({{ signature }}):
 
                 # --- begin domain boundary shortcuts ---
@@ -401,20 +406,23 @@ class NpirCodegen(codegen.TemplatedGenerator, eve.VisitorWithSymbolTableTrait):
 
                 {% for decl in api_field_decls %}{{ decl | indent(4) }}
                 {% endfor %}
-                {% for decl in temp_decls %}{{ decl | indent(4) }}
-                {% endfor %}
 
-                {% if ignore_np_errstate -%}
-                with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
-                {%- else -%}
-                with np.errstate():
-                {%- endif %}
+                with _temporary_pool_.lease() as _temporaries_:
 
-                {% for pass in vertical_passes %}
-                {{ pass | indent(8) }}
-                {% else %}
-                    pass
-                {% endfor %}
+                    {% for decl in temp_decls %}{{ decl | indent(8) }}
+                    {% endfor %}
+
+                    {% if ignore_np_errstate -%}
+                    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+                    {%- else -%}
+                    with np.errstate():
+                    {%- endif %}
+
+                    {% for pass in vertical_passes %}
+                    {{ pass | indent(12) }}
+                    {% else %}
+                        pass
+                    {% endfor %}
             """
         )
     )
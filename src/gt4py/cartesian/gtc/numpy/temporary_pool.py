@@ -0,0 +1,201 @@
+# GT4Py - GridTools Framework
+#
+# Copyright (c) 2014-2023, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Pool of temporary buffers reused across calls of stencils generated by the numpy backend."""
+
+from __future__ import annotations
+
+import collections
+import threading
+from typing import Hashable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from gt4py.cartesian import config as gt_config
+
+
+class TemporaryPoolInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxbytes: Optional[int]
+    currbytes: int
+
+
+class TemporaryPoolBudget:
+    """Byte budget shared by several pools, bounding the total size of their idle buffers.
+
+    A `maxbytes` of `None` means unbounded.
+    """
+
+    def __init__(self, maxbytes: Optional[int]) -> None:
+        if maxbytes is not None and maxbytes < 0:
+            raise ValueError(f"Invalid 'maxbytes' value ({maxbytes})")
+        self.maxbytes = maxbytes
+        self.currbytes = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def process_wide(cls) -> TemporaryPoolBudget:
+        """Return the budget of all pools created by :meth:`TemporaryBufferPool.from_config`."""
+        global _process_budget
+        with _process_budget_lock:
+            if _process_budget is None:
+                _process_budget = cls(
+                    maxbytes=gt_config.cache_settings["temporary_pool_total_size"]
+                )
+            return _process_budget
+
+    def reserve(self, nbytes: int) -> bool:
+        with self._lock:
+            if self.maxbytes is not None and self.currbytes + nbytes > self.maxbytes:
+                return False
+            self.currbytes += nbytes
+            return True
+
+    def free(self, nbytes: int) -> None:
+        with self._lock:
+            self.currbytes -= nbytes
+
+
+class TemporaryBufferPool:
+    """Bounded LRU pool of uninitialized buffers keyed by shape and dtype.
+
+    Buffers are checked out for the duration of a stencil call with :meth:`lease`,
+    so concurrent calls never share buffers. At most `maxbytes` bytes of idle
+    buffers are kept: a `maxbytes` of `None` means unbounded and `0` disables
+    pooling, following the :class:`gt4py.cartesian.stencil_object.DomainOriginCache`
+    convention. If a `budget` is passed, idle buffers are also only kept as long as
+    they fit in the budget shared with other pools.
+    """
+
+    def __init__(
+        self, maxbytes: Optional[int], *, budget: Optional[TemporaryPoolBudget] = None
+    ) -> None:
+        if maxbytes is not None and maxbytes < 0:
+            raise ValueError(f"Invalid 'maxbytes' value ({maxbytes})")
+        self.maxbytes = maxbytes
+        self.budget = budget
+        self._free: collections.OrderedDict[Hashable, List[np.ndarray]] = collections.OrderedDict()
+        self._currbytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_config(cls) -> TemporaryBufferPool:
+        """Create a pool bounded by the ``temporary_pool_size`` cache setting.
+
+        All these pools share the process-wide ``temporary_pool_total_size`` budget.
+        """
+        return cls(
+            maxbytes=gt_config.cache_settings["temporary_pool_size"],
+            budget=TemporaryPoolBudget.process_wide(),
+        )
+
+    def acquire(self, shape: Tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+        key = (tuple(shape), np.dtype(dtype))
+        with self._lock:
+            buffers = self._free.get(key)
+            if buffers:
+                buffer = buffers.pop()
+                if not buffers:
+                    del self._free[key]
+                self._currbytes -= buffer.nbytes
+                if self.budget is not None:
+                    self.budget.free(buffer.nbytes)
+                self.hits += 1
+                return buffer
+            self.misses += 1
+        return np.empty(shape, dtype=dtype)
+
+    def release(self, buffers: List[np.ndarray]) -> None:
+        if self.maxbytes == 0:
+            return
+        with self._lock:
+            for buffer in buffers:
+                if self.budget is not None:
+                    # make room in the shared budget by evicting own buffers, else drop the buffer
+                    while not (reserved := self.budget.reserve(buffer.nbytes)) and self._free:
+                        self._evict_oldest()
+                    if not reserved:
+                        self.evictions += 1
+                        continue
+                key = (buffer.shape, buffer.dtype)
+                self._free.setdefault(key, []).append(buffer)
+                self._free.move_to_end(key)
+                self._currbytes += buffer.nbytes
+            if self.maxbytes is not None:
+                while self._currbytes > self.maxbytes:
+                    self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        key, idle = next(iter(self._free.items()))
+        nbytes = idle.pop().nbytes
+        if not idle:
+            del self._free[key]
+        self._currbytes -= nbytes
+        if self.budget is not None:
+            self.budget.free(nbytes)
+        self.evictions += 1
+
+    def __del__(self) -> None:
+        # give the idle buffers of dropped pools (e.g. of rebuilt stencils) back to the budget
+        if getattr(self, "budget", None) is not None:
+            self.budget.free(self._currbytes)
+
+    def lease(self) -> TemporaryLease:
+        return TemporaryLease(self)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._free.clear()
+            if self.budget is not None:
+                self.budget.free(self._currbytes)
+            self._currbytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> TemporaryPoolInfo:
+        return TemporaryPoolInfo(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            maxbytes=self.maxbytes,
+            currbytes=self._currbytes,
+        )
+
+
+class TemporaryLease:
+    """Buffers taken from a :class:`TemporaryBufferPool`, given back when the context exits."""
+
+    def __init__(self, pool: TemporaryBufferPool) -> None:
+        self.pool = pool
+        self.buffers: List[np.ndarray] = []
+
+    def empty(self, shape: Tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+        buffer = self.pool.acquire(shape, dtype)
+        self.buffers.append(buffer)
+        return buffer
+
+    def __enter__(self) -> TemporaryLease:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.pool.release(self.buffers)
+        self.buffers = []
+
+
+_process_budget: Optional[TemporaryPoolBudget] = None
+_process_budget_lock = threading.Lock()
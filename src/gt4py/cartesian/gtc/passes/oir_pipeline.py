@@ -37,6 +37,7 @@ from gt4py.cartesian.gtc.passes.oir_optimizations.temporaries import (
     WriteBeforeReadTemporariesToScalars,
 )
 from gt4py.cartesian.gtc.passes.oir_optimizations.vertical_loop_merging import AdjacentLoopMerging
+from gt4py.eve import instrumentation
 from gt4py.eve.visitors import NodeVisitor
 
 
@@ -104,7 +105,7 @@ class DefaultPipeline(OirPipeline):
     def run(self, oir: oir.Stencil) -> oir.Stencil:
         for step in self.steps:
             if isinstance(step, type) and issubclass(step, NodeVisitor):
-                oir = step().visit(oir)
+                oir = instrumentation.run_pass("oir", step.__name__, step().visit, oir)
             else:
-                oir = step(oir)
+                oir = instrumentation.run_pass("oir", step.__name__, step, oir)
         return oir
@@ -15,21 +15,35 @@
 from __future__ import annotations
 
 import abc
+import collections
 import collections.abc
 import sys
 import time
 from dataclasses import dataclass
 from numbers import Number
-from pickle import dumps
-from typing import Any, Callable, ClassVar, Dict, Literal, Optional, Tuple, Union, cast
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Hashable,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 import numpy as np
 
 import gt4py.cartesian.gtc.utils as gtc_utils
 import gt4py.storage.cartesian.utils as storage_utils
 from gt4py import cartesian as gt4pyc
+from gt4py.cartesian import config as gt_config
 from gt4py.cartesian.definitions import AccessKind, DomainInfo, FieldInfo, ParameterInfo
 from gt4py.cartesian.gtc.definitions import Index, Shape
+from gt4py.cartesian.gtc.numpy.temporary_pool import TemporaryBufferPool, TemporaryPoolInfo
 
 
 try:
@@ -41,18 +55,94 @@ FieldType = Union["cp.ndarray", np.ndarray]
 OriginType = Union[Tuple[int, int, int], Dict[str, Tuple[int, ...]]]
 
 
+def _make_hashable(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        # Keys are converted to `str` because DaCe passes `StringLiteral` keys (see `_make_origin_dict`)
+        return tuple((str(k), _make_hashable(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_make_hashable(v) for v in value)
+    return value
+
+
 def _compute_domain_origin_cache_key(
     field_args_info: Dict[str, Optional[ArgsInfo]],
     parameter_args: Dict[str, Optional[Number]],
     domain: Optional[Tuple[int, ...]],
     origin: Optional[OriginType],
-) -> int:
+) -> Hashable:
     field_data = tuple(
-        (name, arg.array.shape, arg.origin or (0, 0, 0))
+        (name, arg.array.shape, arg.array.dtype, arg.dimensions, arg.origin or (0, 0, 0))
         for name, arg in field_args_info.items()
         if arg is not None
     )
-    return hash((field_data, *parameter_args.keys(), dumps(domain), dumps(origin)))
+    parameter_data = tuple((name, type(value)) for name, value in parameter_args.items())
+    return (field_data, parameter_data, _make_hashable(domain), _make_hashable(origin))
+
+
+class DomainOriginCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class DomainOriginCache:
+    """Bounded LRU mapping from call argument signatures to normalized `(domain, origin)` pairs.
+
+    A `maxsize` of `None` means the cache can grow without bound and a `maxsize`
+    of `0` disables caching, following the :func:`functools.lru_cache` convention.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128) -> None:
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f"Invalid 'maxsize' value ({maxsize})")
+        self.maxsize = maxsize
+        self._data: collections.OrderedDict[
+            Hashable, Tuple[Tuple[int, ...], Dict[str, Tuple[int, ...]]]
+        ] = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable) -> Optional[Tuple[Tuple[int, ...], Dict[str, Tuple[int, ...]]]]:
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Tuple[Tuple[int, ...], Dict[str, Tuple[int, ...]]]) -> None:
+        if self.maxsize == 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> DomainOriginCacheInfo:
+        return DomainOriginCacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            maxsize=self.maxsize,
+            currsize=len(self._data),
+        )
 
 
 @dataclass
@@ -91,6 +181,19 @@ def _extract_array_infos(
     return array_infos
 
 
+def _is_fast_call_compatible(
+    field_args: Dict[str, Optional[FieldType]], device: Literal["cpu", "gpu"]
+) -> bool:
+    """Check if the arrays can be passed to `run` as they are (no conversion, transposition or origin)."""
+    if device == "cpu":
+        array_type = np.ndarray
+    elif storage_utils.cp is not None:
+        array_type = storage_utils.cp.ndarray
+    else:
+        return False
+    return all(arg is None or type(arg) is array_type for arg in field_args.values())
+
+
 def _extract_stencil_arrays(
     array_infos: Dict[str, Optional[ArgsInfo]]
 ) -> Dict[str, Optional[FieldType]]:
@@ -195,13 +298,24 @@ class StencilObject(abc.ABC):
     _gt_id_: str
     definition_func: Callable[..., Any]
 
-    _domain_origin_cache: ClassVar[Dict[int, Tuple[Tuple[int, ...], Dict[str, Tuple[int, ...]]]]]
-    """Stores domain/origin pairs that have been used by hash."""
+    _domain_origin_cache: ClassVar[DomainOriginCache]
+    """Stores domain/origin pairs that have been used by argument signature."""
+
+    _fast_call_cache: ClassVar[DomainOriginCache]
+    """Stores domain/origin pairs of validated calls with plain array arguments (used by the generated `__call__`)."""
+
+    _temporary_pool: ClassVar[Optional[TemporaryBufferPool]] = None
+    """Reuses temporary buffers across calls (only set by backends allocating temporaries in Python)."""
 
     def __new__(cls, *args, **kwargs):
         if getattr(cls, "_instance", None) is None:
             cls._instance = object.__new__(cls)
-            cls._domain_origin_cache = {}
+            cls._domain_origin_cache = DomainOriginCache(
+                maxsize=gt_config.cache_settings["domain_origin_cache_size"]
+            )
+            cls._fast_call_cache = DomainOriginCache(
+                maxsize=gt_config.cache_settings["domain_origin_cache_size"]
+            )
         return cls._instance
 
     def __setattr__(self, key, value) -> None:
@@ -533,6 +647,7 @@ class StencilObject(abc.ABC):
         *,
         validate_args: bool = True,
         exec_info: Optional[Dict[str, Any]] = None,
+        fast_call_key: Optional[Hashable] = None,
     ) -> None:
         """Check and preprocess the provided arguments (called by :class:`StencilObject` subclasses).
 
@@ -551,6 +666,11 @@ class StencilObject(abc.ABC):
                 This parameter encapsulates `**kwargs` in the actual stencil subclass
                 by doing: `{name: value for name, value in kwargs.items()}`
 
+            fast_call_key: `hashable`, optional
+                Signature key computed by the generated `__call__`. If all field arguments
+                are plain arrays of the backend device, the resulting `(domain, origin)` pair
+                is stored under this key so that following calls can bypass this method.
+
         Check :class:`StencilObject` for a full specification of the `domain`,
         `origin` and `exec_info` keyword arguments.
 
@@ -571,7 +691,8 @@ class StencilObject(abc.ABC):
         array_infos = _extract_array_infos(field_args, device)
 
         cache_key = _compute_domain_origin_cache_key(array_infos, parameter_args, domain, origin)
-        if cache_key not in self._domain_origin_cache:
+        cached_domain_origin = self._domain_origin_cache.get(cache_key)
+        if cached_domain_origin is None:
             origin = self._normalize_origins(array_infos, self.field_info, origin)
 
             if domain is None:
@@ -582,9 +703,12 @@ class StencilObject(abc.ABC):
             if validate_args:
                 self._validate_args(array_infos, parameter_args, domain, origin)
 
-            type(self)._domain_origin_cache[cache_key] = (domain, origin)
+            self._domain_origin_cache.put(cache_key, (domain, origin))
         else:
-            domain, origin = type(self)._domain_origin_cache[cache_key]
+            domain, origin = cached_domain_origin
+
+        if fast_call_key is not None and _is_fast_call_compatible(field_args, device):
+            self._fast_call_cache.put(fast_call_key, (domain, origin))
 
         permuted_arrays = _extract_stencil_arrays(array_infos)
         self.run(
@@ -634,6 +758,44 @@ class StencilObject(abc.ABC):
             None
         """
         type(self)._domain_origin_cache.clear()
+        type(self)._fast_call_cache.clear()
+
+    def call_args_cache_info(self: "StencilObject") -> DomainOriginCacheInfo:
+        """Return hit/miss/eviction statistics of the argument cache.
+
+        Calls taking the fast path of the generated ``__call__`` (plain arrays without
+        ``exec_info``) are counted as hits. The maximum size of the cache can be
+        configured with the ``GT_DOMAIN_ORIGIN_CACHE_SIZE`` environment variable.
+
+        Returns
+        -------
+            `DomainOriginCacheInfo`
+        """
+        info = type(self)._domain_origin_cache.info()
+        return info._replace(hits=info.hits + type(self)._fast_call_cache.hits)
+
+    def clean_temporary_pool(self: "StencilObject") -> None:
+        """Release the temporary buffers kept for reuse in later calls of this stencil.
+
+        Returns
+        -------
+            None
+        """
+        if self._temporary_pool is not None:
+            self._temporary_pool.clear()
+
+    def temporary_pool_info(self: "StencilObject") -> Optional[TemporaryPoolInfo]:
+        """Return hit/miss/eviction statistics and the size of the temporary buffer pool.
+
+        The maximum number of bytes of idle buffers kept by the pool of this stencil and by the
+        pools of all stencils together can be configured with the ``GT_TEMPORARY_POOL_SIZE`` and
+        ``GT_TEMPORARY_POOL_TOTAL_SIZE`` environment variables.
+
+        Returns
+        -------
+            `TemporaryPoolInfo` or `None` if the backend does not pool temporaries
+        """
+        return self._temporary_pool.info() if self._temporary_pool is not None else None
 
     def __deepcopy__(self, memodict=None):
         # StencilObjects are singletons.
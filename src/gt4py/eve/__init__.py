@@ -26,7 +26,7 @@ on some of the previous ones):
   6. concepts
   7. visitors
   8. traits
-  9. codegen
+  9. codegen, instrumentation
 
 """
 
@@ -45,6 +45,7 @@ from .concepts import (
     SymbolName,
     SymbolRef,
     VType,
+    cache_node_hash,
     register_annex_user,
 )
 from .datamodels import (
@@ -89,6 +90,7 @@ __all__ = [
     "SymbolName",
     "SymbolRef",
     "VType",
+    "cache_node_hash",
     "register_annex_user",
     "# datamodels" "Coerced",
     "DataModel",
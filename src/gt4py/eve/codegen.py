@@ -18,8 +18,11 @@
 from __future__ import annotations
 
 import abc
+import collections
 import collections.abc
 import contextlib
+import functools
+import hashlib
 import inspect
 import os
 import re
@@ -27,6 +30,7 @@ import string
 import subprocess
 import sys
 import textwrap
+import threading
 import types
 
 import black
@@ -175,12 +179,44 @@ if _CLANG_FORMAT_EXECUTABLE is not None:
         return formatted_source
 
 
+FORMAT_SOURCE_CACHE_SIZE = 256
+"""Maximum number of formatted sources kept by :func:`format_source`."""
+
+_formatted_sources: collections.OrderedDict[Tuple[Any, ...], str] = collections.OrderedDict()
+_formatted_sources_lock = threading.Lock()
+
+
 def format_source(language: str, source: str, *, skip_errors: bool = True, **kwargs: Any) -> str:
-    """Format source code if a formatter exists for the specific language."""
+    """Format source code if a formatter exists for the specific language.
+
+    Successfully formatted sources are cached (keyed by the hash of the source and the
+    formatter options), so generating the same code again does not run the formatter.
+    """
     formatter = SOURCE_FORMATTERS.get(language, None)
     try:
         if formatter:
-            return formatter(source, **kwargs)
+            try:
+                key: Optional[Tuple[Any, ...]] = (
+                    formatter,
+                    hashlib.sha256(source.encode()).digest(),
+                    frozenset(kwargs.items()),
+                )
+                hash(key)
+            except TypeError:
+                key = None  # unhashable formatter options
+            if key is not None:
+                with _formatted_sources_lock:
+                    if key in _formatted_sources:
+                        _formatted_sources.move_to_end(key)
+                        return _formatted_sources[key]
+
+            formatted_source = formatter(source, **kwargs)
+            if key is not None:
+                with _formatted_sources_lock:
+                    _formatted_sources[key] = formatted_source
+                    if len(_formatted_sources) > FORMAT_SOURCE_CACHE_SIZE:
+                        _formatted_sources.popitem(last=False)
+            return formatted_source
         else:
             raise FormattingError(f"Missing formatter for '{language}' language")
     except Exception as e:
@@ -436,14 +472,19 @@ class FormatTemplate(BaseTemplate):
     """Template adapter to render regular strings as fully-featured f-strings."""
 
     definition: str
+    _code: Optional[types.CodeType]
 
     def __init__(self, definition: str, **kwargs: Any) -> None:
         super().__init__()
         self.definition = f'(f"""{definition}""")'
+        self._code = None
 
     def render_values(self, **kwargs: Any) -> str:
         try:
-            result = eval(self.definition, {}, kwargs or {})
+            # Compiled at the first rendering to report syntax errors as rendering errors
+            if self._code is None:
+                self._code = compile(self.definition, "<FormatTemplate>", "eval")
+            result = eval(self._code, {}, kwargs or {})
             assert isinstance(result, str)
             return result
         except Exception as e:
@@ -483,6 +524,23 @@ class StringTemplate(BaseTemplate):
             raise TemplateRenderingError(message, template=self) from e
 
 
+# Templates created from the same source (e.g. by functions building a template at every
+# call) share the compiled template, which is never modified by the rendering.
+@functools.lru_cache(maxsize=256)
+def _compile_jinja_template(env: jinja2.Environment, source: str) -> jinja2.Template:
+    return env.from_string(source)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_mako_template(source: str) -> mako_tpl.Template:
+    return mako_tpl.Template(source)
+
+
+@functools.cache
+def _is_hashable_node_class(cls: type) -> bool:
+    return issubclass(cls, Node) and cls.__hash__ is not None
+
+
 class JinjaTemplate(BaseTemplate):
     """Template adapter for `jinja2.Template`."""
 
@@ -494,7 +552,7 @@ class JinjaTemplate(BaseTemplate):
         super().__init__()
         try:
             if isinstance(definition, str):
-                definition = self.__jinja_env__.from_string(definition)
+                definition = _compile_jinja_template(self.__jinja_env__, definition)
             assert isinstance(definition, jinja2.Template)
             self.definition = definition
         except Exception as e:
@@ -533,7 +591,7 @@ class MakoTemplate(BaseTemplate):
         super().__init__()
         try:
             if isinstance(definition, str):
-                definition = mako_tpl.Template(definition)
+                definition = _compile_mako_template(definition)
             assert isinstance(definition, mako_tpl.Template)
             self.definition = definition
         except Exception as e:
@@ -610,9 +668,20 @@ class TemplatedGenerator(NodeVisitor):
     :meth:`generic_visit()` at the end with additional keyword arguments which will
     be forwarded to the node template.
 
+    Generators setting the :attr:`MEMOIZE_RENDERS` class variable reuse the code
+    generated for a node for all the equal nodes visited with the same keyword
+    arguments, which saves the rendering of repeated subtrees. This is only correct
+    if the generated code does not depend on anything else (e.g. annex contents or
+    generator state modified during the visit), and it is only efficient for node
+    classes with cached hashes (see :func:`eve.concepts.cache_node_hash`).
+
     """
 
+    #: Reuse the generated code of equal nodes visited with the same keyword arguments.
+    MEMOIZE_RENDERS: ClassVar[bool] = False
+
     __templates__: ClassVar[Mapping[str, Template]]
+    _template_cache_: ClassVar[Dict[type, Tuple[Optional[Template], Optional[str]]]]
 
     @classmethod
     def __init_subclass__(cls, *, inherit_templates: bool = True, **kwargs: Any) -> None:
@@ -638,6 +707,8 @@ class TemplatedGenerator(NodeVisitor):
         )
 
         cls.__templates__ = types.MappingProxyType(templates)
+        # Templates found by `get_template()`, keyed by node class
+        cls._template_cache_ = {}
 
     @overload
     @classmethod
@@ -677,6 +748,22 @@ class TemplatedGenerator(NodeVisitor):
         """
         return str(node)
 
+    def visit(self, node: RootNode, **kwargs: Any) -> Any:
+        if not (self.MEMOIZE_RENDERS and _is_hashable_node_class(node.__class__)):
+            return super().visit(node, **kwargs)
+
+        try:
+            key = (node.__class__, node, frozenset(kwargs.items()) if kwargs else None)
+            hash(key)
+        except TypeError:
+            return super().visit(node, **kwargs)  # unhashable keyword arguments
+
+        rendered_nodes = self.__dict__.setdefault("_rendered_nodes_", {})
+        if key in rendered_nodes:
+            return rendered_nodes[key]
+        result = rendered_nodes[key] = super().visit(node, **kwargs)
+        return result
+
     def generic_visit(self, node: RootNode, **kwargs: Any) -> Union[str, Collection[str]]:
         if isinstance(node, Node):
             template, key = self.get_template(node)
@@ -709,6 +796,11 @@ class TemplatedGenerator(NodeVisitor):
 
     def get_template(self, node: RootNode) -> Tuple[Optional[Template], Optional[str]]:
         """Get a template for a node instance (see class documentation)."""
+        try:
+            return self._template_cache_[node.__class__]
+        except KeyError:
+            pass
+
         template: Optional[Template] = None
         template_key = None
         if isinstance(node, Node):
@@ -718,7 +810,11 @@ class TemplatedGenerator(NodeVisitor):
                 if template is not None or node_class is Node:
                     break
 
-        return template, None if template is None else template_key
+        result = self._template_cache_[node.__class__] = (
+            template,
+            None if template is None else template_key,
+        )
+        return result
 
     def render_template(
         self,
@@ -41,6 +41,7 @@ from .type_definitions import ConstrainedStr, IntEnum, StrEnum
 
 
 _SYMBOL_NAME_RE: Final = re.compile(r"^[a-zA-Z_]\w*$")
+_NODE_HASH_ATTR: Final = "__node_hash__"
 
 
 class SymbolName(ConstrainedStr, regex=_SYMBOL_NAME_RE):
@@ -121,6 +122,10 @@ _T = TypeVar("_T")
 class AnnexManager:
     register: ClassVar[Dict[str, Any]] = {}
 
+    #: Annex keys whose values only depend on the subtree of the node, i.e. stay valid
+    #: as long as the node is not modified (see :class:`eve.visitors.NodeTranslator`).
+    structural_keys: ClassVar[Set[str]] = set()
+
     @classmethod
     def register_user(
         cls: Type[AnnexManager],
@@ -128,6 +133,7 @@ class AnnexManager:
         type_hint: xtyping.TypeAnnotation,
         *,
         shared: bool = False,
+        structural: bool = False,
     ) -> Callable[[_T], _T]:
         assert isinstance(key, str)
 
@@ -152,6 +158,8 @@ class AnnexManager:
                 owners = []
 
             cls.register[key] = (shared, type_hint, [*owners, owner])
+            if structural:
+                cls.structural_keys.add(key)
 
             return owner
 
@@ -185,7 +193,9 @@ class Node(datamodels.DataModel, trees.Tree, kw_only=True):  # type: ignore[call
     (re)compute the annex on node construction (see e.g.
     :class:`SymbolTableTrait`) or add the parts of the annex that should be
     preserved to the `PRESERVED_ANNEX_ATTRS` attribute in the
-    :class:`NodeTranslator` class..
+    :class:`NodeTranslator` class. Unchanged nodes are reused by the
+    :class:`NodeTranslator` only if their annex just contains preserved or
+    `structural` (see :meth:`AnnexManager.register_user`) attributes.
     """
 
     __slots__ = ()
@@ -216,6 +226,13 @@ class Node(datamodels.DataModel, trees.Tree, kw_only=True):  # type: ignore[call
     walk_items = trees.walk_items
     walk_values = trees.walk_values
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Cached hashes are not valid in other interpreter sessions (string hashes
+        # are salted) and not copied, since copies are usually modified afterwards
+        state = dict(self.__dict__)
+        state.pop(_NODE_HASH_ATTR, None)
+        return state
+
     def copy(self: _T, update: Dict[str, Any]) -> _T:
         new_node = copy.deepcopy(self)
         for k, v in update.items():
@@ -251,8 +268,56 @@ CollectionNode = Union[List[LeafNode], Dict[Any, LeafNode], Set[LeafNode]]
 RootNode = Union[NodeT, CollectionNode]
 
 
+def cache_node_hash(
+    node_class: Type[NodeT], hash_func: Optional[Callable[[NodeT], int]] = None
+) -> Type[NodeT]:
+    """Cache the hash of the instances of a node class and use it to speed up comparisons.
+
+    The hash (computed by ``hash_func``, by default the ``__hash__`` method of the class)
+    is stored in the instance after its first computation. Equality comparisons are
+    short-circuited for identical instances and for instances with different cached
+    hashes, otherwise the ``__eq__`` method of the class is used. Note that this is only
+    correct if the instances (and their children) are not modified in place after they
+    have been hashed for the first time.
+    """
+    hash_func = hash_func or node_class.__hash__
+    assert hash_func is not None
+    eq_func = node_class.__eq__
+
+    def __hash__(self: NodeT) -> int:
+        result = self.__dict__.get(_NODE_HASH_ATTR, None)
+        if result is None:
+            result = hash_func(self)  # type: ignore[misc]  # hash_func is not None
+            self.__dict__[_NODE_HASH_ATTR] = result
+        return result
+
+    def __eq__(self: NodeT, other: Any) -> bool:
+        if self is other:
+            return True
+        if (
+            other.__class__ is self.__class__
+            and (self_hash := self.__dict__.get(_NODE_HASH_ATTR, None)) is not None
+            and (other_hash := other.__dict__.get(_NODE_HASH_ATTR, None)) is not None
+            and self_hash != other_hash
+        ):
+            return False
+        return eq_func(self, other)
+
+    node_class.__hash__ = __hash__  # type: ignore[assignment]  # method assignment
+    node_class.__eq__ = __eq__  # type: ignore[assignment]  # method assignment
+
+    return node_class
+
+
 class FrozenNode(Node, frozen=True):  # type: ignore[call-arg]  # frozen from DataModel
-    ...
+    """Immutable node with a cached hash (see :func:`cache_node_hash`)."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cache_node_hash(cls)
+
+
+cache_node_hash(FrozenNode)
 
 
 class GenericNode(datamodels.GenericDataModel, Node, kw_only=True):  # type: ignore[call-arg]  # kw_only from DataModel
@@ -19,6 +19,8 @@ Check :mod:`eve.datamodels` for additional information.
 
 from __future__ import annotations
 
+import contextlib
+import contextvars
 import dataclasses
 import functools
 import sys
@@ -45,9 +47,11 @@ from ..extended_typing import (
     Final,
     ForwardRef,
     Generator,
+    Iterator,
     List,
     Literal,
     Mapping,
+    NamedTuple,
     Optional,
     Protocol,
     Sequence,
@@ -96,6 +100,9 @@ class DataModelTP(_AttrsClassTP, xtyping.DevToolsPrettyPrintable, Protocol):
     __datamodel_root_validators__: ClassVar[
         Tuple[xtyping.NonDataDescriptor[DataModelTP, BoundRootValidator], ...]
     ] = ()
+    __datamodel_deriving_root_validators__: ClassVar[
+        Tuple[xtyping.NonDataDescriptor[DataModelTP, BoundRootValidator], ...]
+    ] = ()
     # Optional
     __auto_init__: ClassVar[Callable[..., None]] = cast(Callable[..., None], None)
     __pre_init__: ClassVar[Callable[[DataModelTP], None]] = cast(
@@ -139,6 +146,7 @@ TypeConverter = Callable[[Any], _T]
 _DATAMODEL_TAG: Final = "__DATAMODEL_TAG"
 _FIELD_VALIDATOR_TAG: Final = "__DATAMODEL_FIELD_VALIDATOR_TAG"
 _ROOT_VALIDATOR_TAG: Final = "__DATAMODEL_ROOT_VALIDATOR_TAG"
+_DERIVES_DATA_TAG: Final = "__DATAMODEL_DERIVES_DATA_TAG"
 _COERCED_TYPE_TAG: Final = "__DATAMODEL_COERCED_TYPE_TAG"
 _UNCHECKED_TYPE_TAG: Final = "__DATAMODEL_UNCHECKED_TYPE_TAG"
 
@@ -148,6 +156,7 @@ _GENERIC_DATAMODEL_ROOT_DM_OPT: Final = "_GENERIC_DATAMODEL_ROOT_DM_OPT"
 MODEL_FIELD_DEFINITIONS_ATTR: Final = "__datamodel_fields__"
 MODEL_PARAM_DEFINITIONS_ATTR: Final = "__datamodel_params__"
 MODEL_ROOT_VALIDATORS_ATTR: Final = "__datamodel_root_validators__"
+MODEL_DERIVING_ROOT_VALIDATORS_ATTR: Final = "__datamodel_deriving_root_validators__"
 
 
 Coerced = xtyping.Annotated[_T, _COERCED_TYPE_TAG]
@@ -179,6 +188,8 @@ class ForwardRefValidator:
     """Actual type validator created after resolving the forward references."""
 
     def __call__(self, instance: DataModel, attribute: Attribute, value: Any) -> None:
+        if not _validation_settings.get().field_types:
+            return
         if self.validator is NOTHING:
             model_cls = instance.__class__
             update_forward_refs(model_cls)
@@ -199,7 +210,8 @@ class ValidatorAdapter:
     description: str
 
     def __call__(self, _instance: DataModel, _attribute: Attribute, value: Any) -> None:
-        self.validator(value)
+        if _validation_settings.get().field_types:
+            self.validator(value)
 
     def __repr__(self) -> str:
         return self.description
@@ -238,6 +250,92 @@ DefaultFieldTypeValidatorFactory: Final[Optional[FieldTypeValidatorFactory]] = (
 )
 """Default type validator factory used by datamodels classes. `None` by default if running in optimized mode."""
 
+
+class ValidationSettings(NamedTuple):
+    """Runtime validation switches of datamodel instances.
+
+    Attributes:
+        field_types: Run the automatic field type validators (created by
+            :func:`field_type_validator_factory`). Type validators are never generated
+            when Python runs in optimized mode (``-O``), independently of this switch.
+            Initialized from the ``GT4PY_EVE_FIELD_TYPE_VALIDATION`` environment variable.
+        root_validators: Run the :func:`root_validator` methods which only check the
+            instance. Root validators deriving data (``derives_data=True``) always run.
+            Initialized from the ``GT4PY_EVE_ROOT_VALIDATION`` environment variable.
+
+    Custom field validators (:func:`validator`) are not affected by these switches. All
+    validators are skipped when ``attrs`` validators are globally disabled
+    (:func:`attrs.validators.set_disabled`).
+    """
+
+    field_types: bool
+    root_validators: bool
+
+
+_validation_settings: Final[contextvars.ContextVar[ValidationSettings]] = contextvars.ContextVar(
+    "validation_settings",
+    default=ValidationSettings(
+        field_types=utils.env_flag_to_bool("GT4PY_EVE_FIELD_TYPE_VALIDATION", True),
+        root_validators=utils.env_flag_to_bool("GT4PY_EVE_ROOT_VALIDATION", True),
+    ),
+)
+
+
+def get_validation_settings() -> ValidationSettings:
+    """Return the runtime validation switches of the current context."""
+    return _validation_settings.get()
+
+
+def set_validation_settings(
+    *, field_types: Optional[bool] = None, root_validators: Optional[bool] = None
+) -> ValidationSettings:
+    """Update the runtime validation switches of the current context and return the previous ones.
+
+    The switches are context-local (see :mod:`contextvars`): they only apply to the current
+    thread or asynchronous task, and new threads start with the values from the environment.
+    Switches set to ``None`` are left unchanged. Instances created while the validation
+    is disabled are not retroactively validated when it is enabled again.
+    """
+    previous = _validation_settings.get()
+    _validation_settings.set(_updated_validation_settings(previous, field_types, root_validators))
+    return previous
+
+
+def _updated_validation_settings(
+    settings: ValidationSettings, field_types: Optional[bool], root_validators: Optional[bool]
+) -> ValidationSettings:
+    return ValidationSettings(
+        field_types=settings.field_types if field_types is None else bool(field_types),
+        root_validators=(
+            settings.root_validators if root_validators is None else bool(root_validators)
+        ),
+    )
+
+
+@contextlib.contextmanager
+def validation_settings(
+    *, field_types: Optional[bool] = None, root_validators: Optional[bool] = None
+) -> Iterator[ValidationSettings]:
+    """Context manager to temporarily change the runtime validation switches of the current context.
+
+    Examples:
+        >>> @datamodel
+        ... class Model:
+        ...     value: int
+
+        >>> with validation_settings(field_types=False):
+        ...     Model(value="not an int")
+        Model(value='not an int')
+    """
+    token = _validation_settings.set(
+        _updated_validation_settings(_validation_settings.get(), field_types, root_validators)
+    )
+    try:
+        yield _validation_settings.get()
+    finally:
+        _validation_settings.reset(token)
+
+
 _REPR_DEFAULT: Final = True
 _EQ_DEFAULT: Final = True
 _ORDER_DEFAULT: Final = False
@@ -626,16 +724,41 @@ def validator(name: str) -> Callable[[FieldValidator], FieldValidator]:
 _RV = TypeVar("_RV", bound=RootValidator)
 
 
-def root_validator(cls_method: _RV, /) -> _RV:
+@overload
+def root_validator(cls_method: _RV, /, *, derives_data: bool = False) -> _RV:
+    ...
+
+
+@overload
+def root_validator(  # noqa: F811  # redefinion of unused symbol
+    *, derives_data: bool = False
+) -> Callable[[_RV], _RV]:
+    ...
+
+
+def root_validator(  # noqa: F811  # redefinion of unused symbol
+    cls_method: Optional[_RV] = None, /, *, derives_data: bool = False
+) -> Union[_RV, Callable[[_RV], _RV]]:
     """Define a custom root validator (decorator function).
 
     The decorated functions should have the following signature:
     ``def _root_validator_function(cls, instance):``
     where ``cls`` will be the class of the model and ``instance`` the
     actual instance being validated.
+
+    Root validators which do not only check the instance, but also derive data
+    from it (e.g. store it in the node annex) have to be defined with
+    ``derives_data=True``: they still run if the root validation is disabled
+    (see :func:`validation_settings`).
     """
-    setattr(cls_method, _ROOT_VALIDATOR_TAG, None)
-    return cls_method
+
+    def _root_validator_maker(cls_method: _RV) -> _RV:
+        setattr(cls_method, _ROOT_VALIDATOR_TAG, None)
+        if derives_data:
+            setattr(cls_method, _DERIVES_DATA_TAG, True)
+        return cls_method
+
+    return _root_validator_maker if cls_method is None else _root_validator_maker(cls_method)
 
 
 # -- Utils --
@@ -930,7 +1053,11 @@ def _make_post_init(has_post_init: bool) -> Callable[[DataModel], None]:
 
         def __attrs_post_init__(self: DataModel) -> None:
             if attr._config._run_validators is True:  # type: ignore[attr-defined]  # attr._config is not visible for mypy
-                for validator in self.__datamodel_root_validators__:
+                for validator in (
+                    self.__datamodel_root_validators__
+                    if _validation_settings.get().root_validators
+                    else self.__datamodel_deriving_root_validators__
+                ):
                     validator.__get__(self)(self)
 
             self.__post_init__()
@@ -939,7 +1066,11 @@ def _make_post_init(has_post_init: bool) -> Callable[[DataModel], None]:
 
         def __attrs_post_init__(self: DataModel) -> None:
             if attr._config._run_validators is True:  # type: ignore[attr-defined]  # attr._config is not visible for mypy
-                for validator in type(self).__datamodel_root_validators__:
+                for validator in (
+                    type(self).__datamodel_root_validators__
+                    if _validation_settings.get().root_validators
+                    else type(self).__datamodel_deriving_root_validators__
+                ):
                     validator.__get__(self)(self)
 
     setattr(__attrs_post_init__, _DATAMODEL_TAG, True)
@@ -1194,6 +1325,11 @@ def _make_datamodel(  # noqa: C901  # too complex but still readable and documen
         field_c_attr.validator(field_validator)
 
     setattr(cls, MODEL_ROOT_VALIDATORS_ATTR, tuple(root_validators))
+    setattr(
+        cls,
+        MODEL_DERIVING_ROOT_VALIDATORS_ATTR,
+        tuple(v for v in root_validators if getattr(v, _DERIVES_DATA_TAG, False)),
+    )
 
     # Apply attrs.define() to enhance the class once all datamodels features
     # have been converted into attrs options
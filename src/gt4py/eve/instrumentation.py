@@ -0,0 +1,232 @@
+# GT4Py - GridTools Framework
+#
+# Copyright (c) 2014-2023, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Instrumentation of IR pass pipelines: wall time and IR size of every pass.
+
+Passes run through :func:`run_pass` are only recorded while a :class:`PassProfile` is
+active, either inside a :func:`profile_passes` context or for the whole session if the
+``GT4PY_EVE_PASS_PROFILE`` environment variable is set to the path of the output file
+(written at exit, as JSON or as a Chrome trace if ``GT4PY_EVE_PASS_PROFILE_FORMAT`` is
+``chrome``). Otherwise :func:`run_pass` just calls the pass.
+"""
+
+
+from __future__ import annotations
+
+import atexit
+import collections
+import contextlib
+import contextvars
+import dataclasses
+import json
+import os
+import pathlib
+import time
+from typing import Callable, Final, Iterator, Literal, Optional, TypeVar, Union
+
+from . import concepts, trees
+from .extended_typing import Any
+
+
+_T = TypeVar("_T")
+
+ProfileFormat = Literal["json", "chrome"]
+
+
+def count_nodes(tree: Any) -> int:
+    """Count the nodes in a tree (or in a collection of trees)."""
+    return sum(1 for _ in trees.pre_walk_values(tree).if_isinstance(concepts.Node))
+
+
+@dataclasses.dataclass
+class PassRecord:
+    """Measurements of a single pass run."""
+
+    #: Pipeline or IR the pass belongs to, e.g. ``"itir"``.
+    category: str
+    name: str
+    #: Start time in seconds since the creation of the profile.
+    start: float
+    #: Wall time in seconds.
+    duration: float
+    nodes_before: Optional[int] = None
+    nodes_after: Optional[int] = None
+    #: Iteration of the enclosing fixed-point loop (if any).
+    iteration: Optional[int] = None
+
+
+@dataclasses.dataclass
+class PassProfile:
+    """
+    Collection of pass measurements.
+
+    Attributes:
+        count_nodes: Count the IR nodes before and after every pass (which takes
+            about as long as a cheap pass).
+        records: The pass runs in the order they were started.
+        iterations: Number of iterations of each run of a fixed-point loop,
+            keyed by ``"<category>:<loop name>"``.
+    """
+
+    count_nodes: bool = True
+    records: list[PassRecord] = dataclasses.field(default_factory=list)
+    iterations: dict[str, list[int]] = dataclasses.field(
+        default_factory=lambda: collections.defaultdict(list)
+    )
+    _origin: float = dataclasses.field(default_factory=time.perf_counter, repr=False)
+
+    def run(
+        self,
+        category: str,
+        name: str,
+        transform: Callable[[Any], _T],
+        node: Any,
+        *,
+        iteration: Optional[int] = None,
+    ) -> _T:
+        nodes_before = count_nodes(node) if self.count_nodes else None
+        start = time.perf_counter()
+        result = transform(node)
+        end = time.perf_counter()
+        self.records.append(
+            PassRecord(
+                category=category,
+                name=name,
+                start=start - self._origin,
+                duration=end - start,
+                nodes_before=nodes_before,
+                nodes_after=count_nodes(result) if self.count_nodes else None,
+                iteration=iteration,
+            )
+        )
+        return result
+
+    def summary(self) -> list[dict[str, Any]]:
+        """Total time and number of runs of each pass, slowest first."""
+        totals: dict[tuple[str, str], dict[str, Any]] = {}
+        for record in self.records:
+            entry = totals.setdefault(
+                (record.category, record.name),
+                {"category": record.category, "name": record.name, "calls": 0, "time": 0.0},
+            )
+            entry["calls"] += 1
+            entry["time"] += record.duration
+        return sorted(totals.values(), key=lambda entry: entry["time"], reverse=True)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "summary": self.summary(),
+            "iterations": dict(self.iterations),
+            "passes": [dataclasses.asdict(record) for record in self.records],
+        }
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Convert to the Chrome trace event format (``chrome://tracing``, Perfetto)."""
+        pid = os.getpid()
+        events = [
+            {
+                "name": record.name,
+                "cat": record.category,
+                "ph": "X",
+                "ts": record.start * 1e6,
+                "dur": record.duration * 1e6,
+                "pid": pid,
+                "tid": 0,
+                "args": {
+                    key: value
+                    for key in ("nodes_before", "nodes_after", "iteration")
+                    if (value := getattr(record, key)) is not None
+                },
+            }
+            for record in self.records
+        ]
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"iterations": dict(self.iterations)},
+        }
+
+    def dump(self, path: Union[str, os.PathLike], format: ProfileFormat = "json") -> None:
+        """Write the profile to a JSON file, either as :meth:`to_dict` or as a Chrome trace."""
+        if format not in ("json", "chrome"):
+            raise ValueError(f"Invalid pass profile format '{format}' (valid: 'json', 'chrome').")
+        data = self.to_chrome_trace() if format == "chrome" else self.to_dict()
+        pathlib.Path(path).write_text(json.dumps(data, indent=1))
+
+
+def _profile_from_env() -> Optional[PassProfile]:
+    path = os.environ.get("GT4PY_EVE_PASS_PROFILE")
+    if not path:
+        return None
+    format = os.environ.get("GT4PY_EVE_PASS_PROFILE_FORMAT", "json").lower()
+    if format not in ("json", "chrome"):
+        raise ValueError(
+            f"Invalid value '{format}' for the 'GT4PY_EVE_PASS_PROFILE_FORMAT' environment "
+            "variable (valid values: json, chrome)."
+        )
+    profile = PassProfile()
+    atexit.register(profile.dump, path, format)
+    return profile
+
+
+# The session profile (if any) is the default, so it also records the passes of new threads
+_active_profile: Final[contextvars.ContextVar[Optional[PassProfile]]] = contextvars.ContextVar(
+    "active_profile", default=_profile_from_env()
+)
+
+
+def active_profile() -> Optional[PassProfile]:
+    """Return the profile recording the passes (if any)."""
+    return _active_profile.get()
+
+
+@contextlib.contextmanager
+def profile_passes(*, count_nodes: bool = True) -> Iterator[PassProfile]:
+    """
+    Record the passes run in this context (i.e. not the passes of other threads).
+
+    Examples:
+        >>> with profile_passes() as profile:
+        ...     result = run_pass("example", "increment", lambda x: x + 1, 1)
+        >>> [(record.name, record.nodes_before, record.nodes_after) for record in profile.records]
+        [('increment', 0, 0)]
+    """
+    profile = PassProfile(count_nodes=count_nodes)
+    token = _active_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _active_profile.reset(token)
+
+
+def run_pass(
+    category: str,
+    name: str,
+    transform: Callable[[Any], _T],
+    node: Any,
+    *,
+    iteration: Optional[int] = None,
+) -> _T:
+    """Apply `transform` to `node` and record it in the active profile (if any)."""
+    profile = _active_profile.get()
+    if profile is None:
+        return transform(node)
+    return profile.run(category, name, transform, node, iteration=iteration)
+
+
+def record_iterations(category: str, loop: str, iterations: int) -> None:
+    """Record the number of iterations of a run of a fixed-point loop in the active profile."""
+    profile = _active_profile.get()
+    if profile is not None:
+        profile.iterations[f"{category}:{loop}"].append(iterations)
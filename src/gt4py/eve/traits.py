@@ -24,7 +24,7 @@ from .extended_typing import Any, Dict, Set, Type, no_type_check
 
 
 # ---  Node Traits ---
-@concepts.register_annex_user("symtable", Dict[str, concepts.Node], shared=True)
+@concepts.register_annex_user("symtable", Dict[str, concepts.Node], shared=True, structural=True)
 @datamodels.datamodel
 class SymbolTableTrait:
     """Node trait adding an automatically created symbol table to the parent node.
@@ -37,7 +37,7 @@ class SymbolTableTrait:
     __slots__ = ()
 
     @no_type_check
-    @datamodels.root_validator
+    @datamodels.root_validator(derives_data=True)
     @classmethod
     def _collect_symbol_names(cls: Type[SymbolTableTrait], instance: concepts.Node) -> None:
         collected_symbols = cls.SymbolsCollector.apply(instance)
@@ -88,7 +88,7 @@ class SymbolTableTrait:
             return collector.collected_symbols
 
 
-@concepts.register_annex_user("symtable", Dict[str, concepts.Node], shared=True)
+@concepts.register_annex_user("symtable", Dict[str, concepts.Node], shared=True, structural=True)
 @datamodels.datamodel
 class SymbolRefsValidatorTrait:
     """Node trait adding automatic validation of symbol references appearing the node tree.
@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 import abc
+import collections
 import collections.abc
 import functools
 
@@ -26,8 +27,9 @@ from .extended_typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Deque,
     Iterable,
-    List,
+    Iterator,
     Optional,
     Protocol,
     Tuple,
@@ -124,20 +126,35 @@ class TraversalOrder(Enum):
     BFS_ORDER = "bfs"
 
 
+# The traversals below keep their own explicit stacks or queues instead of recursing
+# (`yield from`) on every tree level, which would create a chain of nested generators
+# as deep as the tree and may even exhaust the Python recursion limit.
 def _pre_walk_items(
     node: TreeLike, *, __key__: Optional[TreeKey] = None
 ) -> Iterable[Tuple[Optional[TreeKey], Any]]:
     """Create a pre-order tree traversal iterator of (key, value) pairs."""
     yield __key__, node
-    for key, child in iter_children_items(node):
-        yield from _pre_walk_items(child, __key__=key)
+    stack = [iter(iter_children_items(node))]
+    while stack:
+        for key, child in stack[-1]:
+            yield key, child
+            stack.append(iter(iter_children_items(child)))
+            break
+        else:
+            stack.pop()
 
 
 def _pre_walk_values(node: TreeLike) -> Iterable[Tuple[Any]]:
     """Create a pre-order tree traversal iterator of values."""
     yield node
-    for child in iter_children_values(node):
-        yield from _pre_walk_values(child)
+    stack = [iter(iter_children_values(node))]
+    while stack:
+        for child in stack[-1]:
+            yield child
+            stack.append(iter(iter_children_values(child)))
+            break
+        else:
+            stack.pop()
 
 
 pre_walk_items = utils.as_xiter(_pre_walk_items)
@@ -148,17 +165,33 @@ def _post_walk_items(
     node: TreeLike, *, __key__: Optional[TreeKey] = None
 ) -> Iterable[Tuple[Optional[TreeKey], Any]]:
     """Create a post-order tree traversal iterator of (key, value) pairs."""
-    for key, child in iter_children_items(node):
-        yield from _post_walk_items(child, __key__=key)
-    yield __key__, node
+    stack = [(__key__, node, iter(iter_children_items(node)))]
+    while stack:
+        key, node, children = stack[-1]
+        for child_key, child in children:
+            stack.append((child_key, child, iter(iter_children_items(child))))
+            break
+        else:
+            stack.pop()
+            yield key, node
 
 
 def _post_walk_values(node: TreeLike) -> Iterable[Tuple[Any]]:
     """Create a post-order tree traversal iterator of values."""
-    if (iter_children_values := getattr(node, "iter_children_values", None)) is not None:
-        for child in iter_children_values():
-            yield from _post_walk_values(child)
-    yield node
+
+    def _children(node: TreeLike) -> Iterator:
+        iter_children_values = getattr(node, "iter_children_values", None)
+        return iter(()) if iter_children_values is None else iter(iter_children_values())
+
+    stack = [(node, _children(node))]
+    while stack:
+        node, children = stack[-1]
+        for child in children:
+            stack.append((child, _children(child)))
+            break
+        else:
+            stack.pop()
+            yield node
 
 
 post_walk_items = utils.as_xiter(_post_walk_items)
@@ -166,28 +199,24 @@ post_walk_values = utils.as_xiter(_post_walk_values)
 
 
 def _bfs_walk_items(
-    node: TreeLike, *, __key__: Optional[TreeKey] = None, __queue__: Optional[List] = None
+    node: TreeLike, *, __key__: Optional[TreeKey] = None
 ) -> Iterable[Tuple[Optional[TreeKey], Any]]:
     """Create a tree traversal iterator of (key, value) pairs by tree levels (Breadth-First Search)."""
-    __queue__ = __queue__ or []
-    yield __key__, node
-    __queue__.extend(iter_children_items(node))
-    if __queue__:
-        key, child = __queue__.pop(0)
-        yield from _bfs_walk_items(child, __key__=key, __queue__=__queue__)
+    queue: Deque[Tuple[Optional[TreeKey], Any]] = collections.deque([(__key__, node)])
+    while queue:
+        key, node = queue.popleft()
+        yield key, node
+        queue.extend(iter_children_items(node))
 
 
-def _bfs_walk_values(
-    node: TreeLike, *, __queue__: Optional[List] = None
-) -> Iterable[Tuple[TreeKey, Any]]:
+def _bfs_walk_values(node: TreeLike) -> Iterable[Tuple[TreeKey, Any]]:
     """Create a tree traversal iterator of values by tree levels (Breadth-First Search)."""
-    __queue__ = __queue__ or []
-    yield node
-    if (iter_children_values := getattr(node, "iter_children_values", None)) is not None:
-        __queue__.extend(iter_children_values())
-    if __queue__:
-        child = __queue__.pop(0)
-        yield from _bfs_walk_values(child, __queue__=__queue__)
+    queue: Deque[Any] = collections.deque([node])
+    while queue:
+        node = queue.popleft()
+        yield node
+        if (iter_children_values := getattr(node, "iter_children_values", None)) is not None:
+            queue.extend(iter_children_values())
 
 
 bfs_walk_items = utils.as_xiter(_bfs_walk_items)
@@ -24,6 +24,7 @@ import functools
 import hashlib
 import itertools
 import operator
+import os
 import pickle
 import pprint
 import re
@@ -395,6 +396,21 @@ def is_noninstantiable(cls: Type[_T]) -> bool:
     return "__noninstantiable__" in cls.__dict__
 
 
+def env_flag_to_bool(name: str, default: bool) -> bool:
+    """Convert the value of a boolean flag environment variable (case insensitive)."""
+    value = os.environ.get(name, "").lower()
+    if not value:
+        return default
+    if value in ("0", "false", "off"):
+        return False
+    if value in ("1", "true", "on"):
+        return True
+    raise ValueError(
+        f"Invalid value '{os.environ[name]}' for the '{name}' environment variable "
+        "(valid values: 0, false, off, 1, true, on; case insensitive)."
+    )
+
+
 def content_hash(*args: Any, hash_algorithm: str | xtyping.HashlibAlgorithm | None = None) -> str:
     """Stable content-based hash function using instance serialization data.
 
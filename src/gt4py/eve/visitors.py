@@ -19,14 +19,63 @@ from __future__ import annotations
 
 import collections.abc
 import copy
-from typing import ClassVar
+import enum
+from typing import ClassVar, Optional
 
 from . import concepts, trees
 from .extended_typing import Any
 from .type_definitions import NOTHING
 
 
-class NodeVisitor:
+_MUTABLE_CONTAINERS = (list, dict, set)
+
+_immutable_leaf_types: dict[type, bool] = {}
+
+
+def _is_immutable_leaf(value: Any) -> bool:
+    """Check if `value` is an atomic value or a frozen dataclass/datamodel (by its type)."""
+    value_type = value.__class__
+    try:
+        return _immutable_leaf_types[value_type]
+    except KeyError:
+        params = getattr(value_type, "__dataclass_params__", None) or getattr(
+            value_type, "__datamodel_params__", None
+        )
+        result = issubclass(
+            value_type, (type(None), bool, int, float, complex, str, bytes, enum.Enum)
+        ) or bool(params and params.frozen)
+        _immutable_leaf_types[value_type] = result
+        return result
+
+
+def _all_identical(
+    new_items: collections.abc.Collection, items: collections.abc.Collection
+) -> bool:
+    return len(new_items) == len(items) and all(new is old for new, old in zip(new_items, items))
+
+
+class _NodeVisitorMeta(type):
+    """Metaclass of node visitors, invalidating their dispatch caches if visitor methods change."""
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name.startswith("visit_"):
+            cls._clear_dispatch_caches()
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        if name.startswith("visit_"):
+            cls._clear_dispatch_caches()
+
+    def _clear_dispatch_caches(cls) -> None:
+        pending = [cls]
+        while pending:
+            visitor_class = pending.pop()
+            visitor_class.__dict__.get("_dispatch_cache_", {}).clear()
+            pending.extend(visitor_class.__subclasses__())
+
+
+class NodeVisitor(metaclass=_NodeVisitorMeta):
     """Simple node visitor class based on :class:`ast.NodeVisitor`.
 
     A NodeVisitor instance walks a node tree and calls a visitor
@@ -94,31 +143,34 @@ class NodeVisitor:
 
     """
 
-    def visit(self, node: concepts.RootNode, **kwargs: Any) -> Any:
-        visitor = self.generic_visit
-
-        class_name = node.__class__.__name__
-        if "__" in class_name:
-            # For concretized data model classes, use the generic name
-            class_name = class_name[: class_name.find("__")]
-        method_name = "visit_" + class_name
-
-        if hasattr(self, method_name):
-            visitor = getattr(self, method_name)
-        elif isinstance(node, concepts.Node):
-            for node_class in node.__class__.__mro__[1:]:
-                class_name = node_class.__name__
-                if "__" in class_name:
-                    class_name = class_name[: class_name.find("__")]
-                method_name = "visit_" + class_name
-
-                if hasattr(self, method_name):
-                    visitor = getattr(self, method_name)
-                    break
-
-                if node_class is concepts.Node:
-                    break
+    _dispatch_cache_: ClassVar[dict[type, Optional[str]]] = {}
+    _has_instance_visitors_: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Visitor method names resolved by `visit()`, keyed by node class
+        # (cleared by the metaclass if visitor methods are added to the class later)
+        cls._dispatch_cache_ = {}
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("visit_"):
+            # Visitor methods of the instance are not in the cache of the class
+            object.__setattr__(self, "_has_instance_visitors_", True)
+        super().__setattr__(name, value)
+
+    def visit(self, node: concepts.RootNode, **kwargs: Any) -> Any:
+        node_class = node.__class__
+        if self._has_instance_visitors_:
+            method_name = _resolve_visitor_name(self, node_class)
+        else:
+            try:
+                method_name = self._dispatch_cache_[node_class]
+            except KeyError:
+                method_name = self._dispatch_cache_[node_class] = _resolve_visitor_name(
+                    self.__class__, node_class
+                )
+
+        visitor = self.generic_visit if method_name is None else getattr(self, method_name)
         return visitor(node, **kwargs)
 
     def generic_visit(self, node: concepts.RootNode, **kwargs: Any) -> Any:
@@ -128,6 +180,35 @@ class NodeVisitor:
         return None
 
 
+def _resolve_visitor_name(visitor: Any, node_class: type) -> Optional[str]:
+    """Find the name of the visitor method for `node_class` (`None` means `generic_visit`).
+
+    The `visitor` can be a visitor class (for the cached dispatch) or a visitor instance.
+    """
+    class_name = node_class.__name__
+    if "__" in class_name:
+        # For concretized data model classes, use the generic name
+        class_name = class_name[: class_name.find("__")]
+    method_name = "visit_" + class_name
+
+    if hasattr(visitor, method_name):
+        return method_name
+    elif issubclass(node_class, concepts.Node):
+        for base_class in node_class.__mro__[1:]:
+            class_name = base_class.__name__
+            if "__" in class_name:
+                class_name = class_name[: class_name.find("__")]
+            method_name = "visit_" + class_name
+
+            if hasattr(visitor, method_name):
+                return method_name
+
+            if base_class is concepts.Node:
+                break
+
+    return None
+
+
 class NodeTranslator(NodeVisitor):
     """Special `NodeVisitor` to translate nodes and trees.
 
@@ -136,8 +217,12 @@ class NodeTranslator(NodeVisitor):
     values of the visitor methods. If the return value is :obj:`eve.NOTHING`,
     the node will be removed from its location in the output tree,
     otherwise it will be replaced with this new value. The default visitor
-    method (:meth:`generic_visit`) returns a `deepcopy` of the original
-    node.
+    method (:meth:`generic_visit`) returns a new node with the visited children
+    or, if no child has changed, the original node itself (structural sharing),
+    unless its annex contains attributes which would be dropped in a new node
+    (see :attr:`PRESERVED_ANNEX_ATTRS`). Immutable leaf values are not copied.
+    Translators relying on fresh copies of all nodes can set
+    :attr:`REUSE_UNCHANGED_NODES` to ``False`` to always get a deep copy.
 
     Keep in mind that if the node you're operating on has child nodes
     you must either transform the child nodes yourself or call the
@@ -154,17 +239,40 @@ class NodeTranslator(NodeVisitor):
 
     PRESERVED_ANNEX_ATTRS: ClassVar[tuple[str, ...]] = ()
 
+    REUSE_UNCHANGED_NODES: ClassVar[bool] = True
+
+    def _is_reusable_annex(self, node: concepts.Node) -> bool:
+        # A reused node keeps its whole annex, which is only correct if a new node would
+        # get the same one (preserved attributes or attributes derived from the subtree)
+        annex = getattr(node, "__node_annex__", None)
+        return annex is None or all(
+            key in self.PRESERVED_ANNEX_ATTRS or key in concepts.AnnexManager.structural_keys
+            for key in annex.__dict__
+        )
+
     def generic_visit(self, node: concepts.RootNode, **kwargs: Any) -> Any:
         memo = kwargs.get("__memo__", None)
 
         if isinstance(node, concepts.Node):
-            new_node = node.__class__(  # type: ignore
-                **{
-                    name: new_child
-                    for name, child in node.iter_children_items()
-                    if (new_child := self.visit(child, **kwargs)) is not NOTHING
-                },
-            )
+            changed = not self.REUSE_UNCHANGED_NODES
+            new_children = {}
+            for name, child in node.iter_children_items():
+                new_child = self.visit(child, **kwargs)
+                if new_child is not child:
+                    changed = True
+                if new_child is not NOTHING:
+                    new_children[name] = new_child
+
+            if not changed and self._is_reusable_annex(node):
+                # Structural sharing: the whole (unchanged) subtree is reused
+                return node
+
+            for name, new_child in new_children.items():
+                if new_child is getattr(node, name) and isinstance(new_child, _MUTABLE_CONTAINERS):
+                    # Never share mutable containers between the old and the new node
+                    new_children[name] = new_child.__class__(new_child)
+
+            new_node = node.__class__(**new_children)  # type: ignore
             if self.PRESERVED_ANNEX_ATTRS and (old_annex := getattr(node, "__node_annex__", None)):
                 # access to `new_node.annex` implicitly creates the `__node_annex__` attribute in the property getter
                 new_annex_dict = new_node.annex.__dict__
@@ -175,24 +283,32 @@ class NodeTranslator(NodeVisitor):
 
             return new_node
 
+        if _is_immutable_leaf(node):
+            # Immutable values are never copied (as `copy.deepcopy` would do for atomic values)
+            return node
+
         if isinstance(node, (list, tuple, set, collections.abc.Set)) or (
             isinstance(node, collections.abc.Sequence) and not isinstance(node, (str, bytes))
         ):
             # Sequence or set: create a new container instance with the new values
-            return node.__class__(  # type: ignore
+            new_items = [
                 new_child
                 for child in trees.iter_children_values(node)
                 if (new_child := self.visit(child, **kwargs)) is not NOTHING
-            )
+            ]
+            if self.REUSE_UNCHANGED_NODES and _all_identical(new_items, node):
+                return node
+            return node.__class__(new_items)  # type: ignore
 
         if isinstance(node, (dict, collections.abc.Mapping)):
             # Mapping: create a new mapping instance with the new values
-            return node.__class__(  # type: ignore[call-arg]
-                {
-                    name: new_child
-                    for name, child in trees.iter_children_items(node)
-                    if (new_child := self.visit(child, **kwargs)) is not NOTHING
-                }
-            )
+            new_mapping = {
+                name: new_child
+                for name, child in trees.iter_children_items(node)
+                if (new_child := self.visit(child, **kwargs)) is not NOTHING
+            }
+            if self.REUSE_UNCHANGED_NODES and _all_identical(new_mapping.values(), node.values()):
+                return node
+            return node.__class__(new_mapping)  # type: ignore[call-arg]
 
         return copy.deepcopy(node, memo=memo)
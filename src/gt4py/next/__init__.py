@@ -23,7 +23,7 @@ to create a streamlined user experience. `from module import *` can be used but
 module in question is a submodule, defines `__all__` and exports many public API objects.
 """
 
-from . import common, ffront, iterator, program_processors, type_inference
+from . import common, ffront, iterator, program_processors, serialization, type_inference
 from .common import Dimension, DimensionKind, Domain, Field, GridType, UnitRange, domain, unit_range
 from .constructors import as_connectivity, as_field, empty, full, ones, zeros
 from .embedded import (  # Just for registering field implementations
@@ -39,6 +39,7 @@ from .iterator.embedded import (
     index_field,
     np_as_located_field,
 )
+from .serialization import load_field, save_field
 
 
 __all__ = [
@@ -47,6 +48,7 @@ __all__ = [
     "ffront",
     "iterator",
     "program_processors",
+    "serialization",
     "type_inference",
     # from common
     "Dimension",
@@ -64,6 +66,9 @@ __all__ = [
     "full",
     "as_field",
     "as_connectivity",
+    # from serialization
+    "save_field",
+    "load_field",
     # from iterator
     "NeighborTableOffsetProvider",
     "StridedNeighborOffsetProvider",
@@ -14,6 +14,7 @@
 
 import abc
 import dataclasses
+import os
 
 import numpy as np
 
@@ -31,6 +32,7 @@ from gt4py.eve.extended_typing import (
     Sequence,
     TypeAlias,
     TypeGuard,
+    Union,
     cast,
 )
 
@@ -158,6 +160,11 @@ class BaseFieldBufferAllocator(FieldBufferAllocatorProtocol[core_defs.DeviceType
     def __gt_device_type__(self) -> core_defs.DeviceTypeT:
         return self.device_type
 
+    @property
+    def buffer_allocator(self) -> core_allocators.BufferAllocator[core_defs.DeviceTypeT]:
+        """Allocator of the field buffers."""
+        return core_allocators.NDArrayBufferAllocator(self.device_type, self.array_ns)
+
     def __gt_allocate__(
         self,
         domain: common.Domain,
@@ -170,11 +177,70 @@ class BaseFieldBufferAllocator(FieldBufferAllocatorProtocol[core_defs.DeviceType
         # TODO(egparedes): add support for non-empty aligned index values
         assert aligned_index is None
 
-        return core_allocators.NDArrayBufferAllocator(self.device_type, self.array_ns).allocate(
+        return self.buffer_allocator.allocate(
             shape, dtype, device_id, layout_map, self.byte_alignment, aligned_index
         )
 
 
+@dataclasses.dataclass(frozen=True, eq=False)
+class PoolingFieldBufferAllocator(BaseFieldBufferAllocator[core_defs.DeviceTypeT]):
+    """
+    Field buffer allocator reusing the buffers of fields which are not used anymore.
+
+    See :class:`gt4py.storage.allocators.PoolingBufferAllocator` for details.
+
+    Examples:
+        >>> allocator = PoolingFieldBufferAllocator.from_allocator(
+        ...     StandardCPUFieldBufferAllocator(), max_pool_bytes=2**30
+        ... )
+        >>> allocator.pool.statistics.bytes_held
+        0
+    """
+
+    max_pool_bytes: Optional[int] = None
+    pool: core_allocators.PoolingBufferAllocator[core_defs.DeviceTypeT] = dataclasses.field(
+        init=False, repr=False
+    )
+
+    # Every pool is a different allocator
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "pool",
+            core_allocators.PoolingBufferAllocator(
+                core_allocators.NDArrayBufferAllocator(self.device_type, self.array_ns),
+                max_bytes=self.max_pool_bytes,
+            ),
+        )
+
+    @classmethod
+    def from_allocator(
+        cls,
+        allocator: BaseFieldBufferAllocator[core_defs.DeviceTypeT],
+        *,
+        max_pool_bytes: Optional[int] = None,
+    ) -> "PoolingFieldBufferAllocator[core_defs.DeviceTypeT]":
+        """Create a pooling allocator with the same settings as another allocator."""
+        return cls(
+            device_type=allocator.device_type,
+            array_ns=allocator.array_ns,
+            layout_mapper=allocator.layout_mapper,
+            byte_alignment=allocator.byte_alignment,
+            max_pool_bytes=max_pool_bytes,
+        )
+
+    @property
+    def buffer_allocator(self) -> core_allocators.BufferAllocator[core_defs.DeviceTypeT]:
+        return self.pool
+
+    def release(self, buffer: Union[core_allocators.TensorBuffer, core_defs.NDArrayObject]) -> None:
+        """Return the memory of a buffer immediately (see :meth:`PoolingBufferAllocator.release`)."""
+        self.pool.release(buffer)
+
+
 if TYPE_CHECKING:
     __TensorFieldAllocatorAsFieldAllocatorInterfaceT: type[
         FieldBufferAllocatorProtocol
@@ -232,6 +298,41 @@ device_allocators[core_defs.DeviceType.CPU] = StandardCPUFieldBufferAllocator()
 assert is_field_allocator(device_allocators[core_defs.DeviceType.CPU])
 
 
+@dataclasses.dataclass(frozen=True, init=False)
+class MMapFieldBufferAllocator(BaseFieldBufferAllocator[core_defs.CPUDeviceTyping]):
+    """
+    A field buffer allocator for CPU devices mapping the buffer to a file.
+
+    Other processes can attach to the buffer of a field by allocating a field with
+    the same domain and dtype from the same file in mode ``"r+"`` or ``"r"`` (see
+    :class:`gt4py.storage.allocators.MMapBufferAllocator`).
+    """
+
+    path: str
+    mode: core_allocators.MMapMode
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        mode: core_allocators.MMapMode = "w+",
+        *,
+        layout_mapper: FieldLayoutMapper = horizontal_first_layout_mapper,
+        byte_alignment: int = 64,
+    ) -> None:
+        super().__init__(
+            device_type=core_defs.DeviceType.CPU,
+            array_ns=np_alloc_ns,
+            layout_mapper=layout_mapper,
+            byte_alignment=byte_alignment,
+        )
+        object.__setattr__(self, "path", os.fspath(path))
+        object.__setattr__(self, "mode", mode)
+
+    @property
+    def buffer_allocator(self) -> core_allocators.BufferAllocator[core_defs.CPUDeviceTyping]:
+        return core_allocators.MMapBufferAllocator(self.path, self.mode)
+
+
 @dataclasses.dataclass(frozen=True)
 class InvalidFieldBufferAllocator(FieldBufferAllocatorProtocol[core_defs.DeviceTypeT]):
     """A field buffer allocator that always raises an exception."""
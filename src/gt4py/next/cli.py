@@ -0,0 +1,112 @@
+# GT4Py - GridTools Framework
+#
+# Copyright (c) 2014-2023, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Command line interface of `gt4py.next`."""
+
+from __future__ import annotations
+
+import datetime
+import pathlib
+from typing import Optional
+
+import click
+import tabulate
+
+from gt4py.next import config
+from gt4py.next.otf.compilation import cache
+
+
+def _format_size(size: int) -> str:
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024  # type: ignore[assignment]
+    return f"{size:.1f} TiB"
+
+
+def _size_option(value: Optional[str]) -> Optional[int]:
+    if value is None:
+        return None
+    try:
+        return config.size_to_bytes(value)
+    except ValueError as error:
+        raise click.BadParameter(str(error)) from None
+
+
+@click.group()
+def main() -> None:
+    """GT4Py (GridTools for Python) next utilities."""
+
+
+@main.group(name="cache")
+def cache_group() -> None:
+    """Inspect and prune the persistent build cache."""
+
+
+@cache_group.command()
+@click.option("--verbose", "-v", is_flag=True, help="list all the cache entries")
+def info(verbose: bool) -> None:
+    """Show the location, size and content of the build cache."""
+    root = cache.get_cache_root(cache.Strategy.PERSISTENT)
+    entries = cache.list_entries(root)
+    max_size = config.BUILD_CACHE_MAX_SIZE
+    click.echo(f"Location: {root}")
+    click.echo(f"Entries: {len(entries)}")
+    click.echo(f"Size: {_format_size(sum(entry.size for entry in entries))}")
+    click.echo(f"Maximum size: {_format_size(max_size) if max_size else 'unbounded'}")
+    if verbose and entries:
+        rows = [
+            [
+                entry.path.name,
+                _format_size(entry.size),
+                datetime.datetime.fromtimestamp(entry.last_used).isoformat(" ", "seconds"),
+                "shared" if entry.is_shared else entry.status.name if entry.status else "-",
+            ]
+            for entry in reversed(entries)
+        ]
+        click.echo("\n" + tabulate.tabulate(rows, headers=["entry", "size", "last used", "status"]))
+
+
+@cache_group.command()
+@click.option(
+    "--max-size",
+    callback=lambda ctx, param, value: _size_option(value),
+    help="evict least recently used entries down to this size (e.g. 500M, 2G), "
+    "defaults to GT4PY_BUILD_CACHE_MAX_SIZE",
+)
+@click.option("--all", "remove_all", is_flag=True, help="remove all the (unlocked) entries")
+@click.option("--dry-run", "-n", is_flag=True, help="only list the entries which would be removed")
+def prune(max_size: Optional[int], remove_all: bool, dry_run: bool) -> None:
+    """Evict least recently used entries from the build cache."""
+    if remove_all:
+        max_size = 0
+    elif max_size is None:
+        max_size = config.BUILD_CACHE_MAX_SIZE
+        if not max_size:
+            raise click.UsageError(
+                "No size limit: use '--max-size', '--all' or set GT4PY_BUILD_CACHE_MAX_SIZE."
+            )
+
+    root: pathlib.Path = cache.get_cache_root(cache.Strategy.PERSISTENT)
+    removed = cache.prune(max_size, root=root, dry_run=dry_run)
+    if remove_all and not dry_run:
+        # the shared build configurations are only removed on request
+        removed += [entry for entry in cache.list_entries(root) if cache.remove_entry(entry)]
+
+    for entry in removed:
+        click.echo(f"{'Would remove' if dry_run else 'Removed'} {entry.path.name}")
+    click.echo(
+        f"{'Would free' if dry_run else 'Freed'} "
+        f"{_format_size(sum(entry.size for entry in removed))} in {len(removed)} entries."
+    )
@@ -0,0 +1,68 @@
+# GT4Py - GridTools Framework
+#
+# Copyright (c) 2014-2023, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Global configuration of `gt4py.next`, initialized from environment variables."""
+
+from __future__ import annotations
+
+import getpass
+import os
+import pathlib
+import tempfile
+
+from gt4py.eve.utils import env_flag_to_bool
+
+
+def size_to_bytes(size: str) -> int:
+    """Convert a size like `'512'`, `'100k'`, `'20M'` or `'1.5G'` (binary units) to bytes."""
+    units = {"k": 2**10, "m": 2**20, "g": 2**30, "t": 2**40}
+    value = size.strip().lower().removesuffix("b").removesuffix("i")
+    try:
+        if value and value[-1] in units:
+            return int(float(value[:-1]) * units[value[-1]])
+        return int(value)
+    except ValueError:
+        raise ValueError(f"Invalid size '{size}'.") from None
+
+
+#: Defer parsing and type deduction of `@field_operator`, `@scan_operator` and
+#: `@program` definitions until their first use.
+LAZY_PARSING: bool = env_flag_to_bool("GT4PY_LAZY_PARSING", default=False)
+
+
+def _default_cache_dir() -> pathlib.Path:
+    """Per-user cache folder: `$XDG_CACHE_HOME/gt4py` or `~/.cache/gt4py`."""
+    if xdg_cache_home := os.environ.get("XDG_CACHE_HOME"):
+        return pathlib.Path(xdg_cache_home) / "gt4py"
+    try:
+        return pathlib.Path.home() / ".cache" / "gt4py"
+    except RuntimeError:  # the home folder can not be determined
+        return pathlib.Path(tempfile.gettempdir()) / f"gt4py_cache_{getpass.getuser()}"
+
+
+#: Root folder of the persistent caches. It is not shared between users, since the
+#: cached objects are unpickled and imported.
+CACHE_DIR: pathlib.Path = pathlib.Path(os.environ.get("GT4PY_CACHE_DIR", _default_cache_dir()))
+
+#: Store the frontend ASTs (FOAST, PAST), the lowered ITIR and the transformed ITIR
+#: on disk (in `CACHE_DIR`) and reuse them in later sessions.
+PERSISTENT_IR_CACHE: bool = env_flag_to_bool("GT4PY_PERSISTENT_IR_CACHE", default=False)
+
+#: Maximum size (in bytes) of the persistent build cache in `CACHE_DIR`. The least recently
+#: used builds are evicted after new ones have been added. Zero means unbounded.
+BUILD_CACHE_MAX_SIZE: int = size_to_bytes(os.environ.get("GT4PY_BUILD_CACHE_MAX_SIZE", "0"))
+
+#: Entries of the persistent build cache used less than this many seconds ago are not
+#: evicted, since other processes may be about to import them.
+BUILD_CACHE_MIN_AGE: float = float(os.environ.get("GT4PY_BUILD_CACHE_MIN_AGE", "600"))
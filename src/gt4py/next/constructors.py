@@ -23,6 +23,7 @@ import gt4py.eve.extended_typing as xtyping
 import gt4py.next.allocators as next_allocators
 import gt4py.next.common as common
 import gt4py.next.embedded.nd_array_field as nd_array_field
+import gt4py.storage.allocators as core_allocators
 import gt4py.storage.cartesian.utils as storage_utils
 
 
@@ -101,6 +102,7 @@ def zeros(
     aligned_index: Optional[Sequence[common.NamedIndex]] = None,
     allocator: Optional[next_allocators.FieldBufferAllocatorProtocol] = None,
     device: Optional[core_defs.Device] = None,
+    parallel_first_touch: bool | int = False,
 ) -> nd_array_field.NdArrayField:
     """Create a Field containing all zeros using the given (or device-default) allocator.
 
@@ -121,7 +123,9 @@ def zeros(
         allocator=allocator,
         device=device,
     )
-    field[...] = field.dtype.scalar_type(0)
+    core_allocators.fill(
+        field.ndarray, field.dtype.scalar_type(0), parallel_first_touch=parallel_first_touch
+    )
     return field
 
 
@@ -133,6 +137,7 @@ def ones(
     aligned_index: Optional[Sequence[common.NamedIndex]] = None,
     allocator: Optional[next_allocators.FieldBufferAllocatorProtocol] = None,
     device: Optional[core_defs.Device] = None,
+    parallel_first_touch: bool | int = False,
 ) -> nd_array_field.NdArrayField:
     """Create a Field containing all ones using the given (or device-default) allocator.
 
@@ -153,7 +158,9 @@ def ones(
         allocator=allocator,
         device=device,
     )
-    field[...] = field.dtype.scalar_type(1)
+    core_allocators.fill(
+        field.ndarray, field.dtype.scalar_type(1), parallel_first_touch=parallel_first_touch
+    )
     return field
 
 
@@ -166,6 +173,7 @@ def full(
     aligned_index: Optional[Sequence[common.NamedIndex]] = None,
     allocator: Optional[next_allocators.FieldBufferAllocatorProtocol] = None,
     device: Optional[core_defs.Device] = None,
+    parallel_first_touch: bool | int = False,
 ) -> nd_array_field.NdArrayField:
     """Create a Field where all values are set to `fill_value` using the given (or device-default) allocator.
 
@@ -177,6 +185,12 @@ def full(
         fill_value: Each point in the field will be initialized to this value.
         dtype: Definition of the data type of the field. Defaults to the dtype of `fill_value`.
 
+    Keyword Arguments:
+        parallel_first_touch: Initialize the buffer from several threads (`True` for as many as
+            OpenMP would use, or a number of threads) to place the memory pages on the NUMA nodes
+            of the CPUs processing them (see :func:`gt4py.storage.allocators.first_touch_fill`).
+            Also available in :func:`zeros` and :func:`ones`.
+
     Examples:
         >>> from gt4py import next as gtx
         >>> from gt4py.next.program_processors.runners import roundtrip
@@ -191,7 +205,11 @@ def full(
         allocator=allocator,
         device=device,
     )
-    field[...] = field.dtype.scalar_type(fill_value)
+    core_allocators.fill(
+        field.ndarray,
+        field.dtype.scalar_type(fill_value),
+        parallel_first_touch=parallel_first_touch,
+    )
     return field
 
 
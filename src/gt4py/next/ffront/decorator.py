@@ -18,9 +18,14 @@
 
 from __future__ import annotations
 
+import ast
 import collections
 import dataclasses
 import functools
+import inspect
+import marshal
+import pickle
+import threading
 import types
 import typing
 import warnings
@@ -32,7 +37,7 @@ from devtools import debug
 from gt4py._core import definitions as core_defs
 from gt4py.eve import utils as eve_utils
 from gt4py.eve.extended_typing import Any, Optional
-from gt4py.next import allocators as next_allocators, common, embedded as next_embedded
+from gt4py.next import allocators as next_allocators, common, config, embedded as next_embedded
 from gt4py.next.common import Dimension, DimensionKind, GridType
 from gt4py.next.ffront import (
     dialect_ast_enums,
@@ -54,6 +59,7 @@ from gt4py.next.ffront.past_to_itir import ProgramLowering
 from gt4py.next.ffront.source_utils import SourceDefinition, get_closure_vars_from_function
 from gt4py.next.iterator import ir as itir
 from gt4py.next.iterator.ir_makers import literal_from_value, promote_to_const_iterator, ref, sym
+from gt4py.next.otf import ir_cache
 from gt4py.next.program_processors import processor_interface as ppi
 from gt4py.next.program_processors.runners import roundtrip
 from gt4py.next.type_system import type_info, type_specifications as ts, type_translation
@@ -93,6 +99,89 @@ def _filter_closure_vars_by_type(closure_vars: dict[str, Any], *types: type) ->
     return {name: value for name, value in closure_vars.items() if isinstance(value, types)}
 
 
+@functools.lru_cache(maxsize=None)
+def _type_source(value: type) -> Optional[str]:
+    try:
+        return inspect.getsource(value)
+    except (OSError, TypeError):  # builtin or extension types
+        return None
+
+
+def _closure_var_fingerprint(value: Any) -> Any:
+    if isinstance(value, (Program, FieldOperator, _LazyDefinition)):
+        if (key := value.ir_cache_key) is None:
+            raise TypeError(f"'{value}' can not be cached persistently.")
+        return key
+    if isinstance(value, types.ModuleType):
+        raise TypeError(f"Module '{value.__name__}' can not be cached persistently.")
+    if isinstance(value, types.FunctionType):
+        # the code object changes with the function body, unlike its name
+        return f"{value.__module__}.{value.__qualname__}", marshal.dumps(value.__code__)
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}", _type_source(value)
+    if isinstance(value, types.BuiltinFunctionType):
+        return f"{value.__module__}.{value.__qualname__}"
+    return pickle.dumps(value)
+
+
+def _module_attribute_fingerprints(
+    tree: ast.AST, name: str, module: types.ModuleType
+) -> dict[str, Any]:
+    """
+    Compute the fingerprints of the attributes of `module` accessed as `name.<attr>` in `tree`.
+
+    Nested modules are followed, e.g. `name.linalg.norm` is fingerprinted as `linalg.norm`.
+    Raises :class:`TypeError` if the module is used in any other way.
+    """
+    fingerprints: dict[str, Any] = {}
+    accessed_names: set[int] = set()
+    for node in ast.walk(tree):
+        attrs: list[str] = []
+        while isinstance(node, ast.Attribute):
+            attrs.insert(0, node.attr)
+            node = node.value
+        if not (attrs and isinstance(node, ast.Name) and node.id == name):
+            continue
+        accessed_names.add(id(node))
+        value: Any = module
+        for i, attr in enumerate(attrs):
+            value = getattr(value, attr)
+            if not isinstance(value, types.ModuleType):
+                fingerprints[".".join(attrs[: i + 1])] = _closure_var_fingerprint(value)
+                break
+
+    if any(
+        isinstance(node, ast.Name) and node.id == name and id(node) not in accessed_names
+        for node in ast.walk(tree)
+    ):
+        raise TypeError(f"Module '{module.__name__}' can not be cached persistently.")
+    return fingerprints
+
+
+def _make_ir_cache_key(
+    source_def: SourceDefinition,
+    closure_vars: dict[str, Any],
+    annotations: dict[str, Any],
+    *args: Any,
+) -> Optional[str]:
+    """Compute the persistent IR cache key of a definition or `None` if it can not be cached."""
+    if not config.PERSISTENT_IR_CACHE:
+        return None
+    try:
+        closure_var_fingerprints = {}
+        tree = None
+        for name, value in closure_vars.items():
+            if isinstance(value, types.ModuleType):
+                tree = tree or ast.parse(source_def.source)
+                closure_var_fingerprints[name] = _module_attribute_fingerprints(tree, name, value)
+            else:
+                closure_var_fingerprints[name] = _closure_var_fingerprint(value)
+        # type hints are not picklable, but their representation is stable
+        return ir_cache.make_key(source_def, closure_var_fingerprints, repr(annotations), *args)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+
+
 def _deduce_grid_type(
     requested_grid_type: Optional[GridType],
     offsets_and_dimensions: Iterable[FieldOffset | Dimension],
@@ -166,6 +255,8 @@ class Program:
         definition: The Python function object corresponding to the PAST node.
         grid_type: The grid type (cartesian or unstructured) to be used. If not explicitly given
             it will be deduced from actually occurring dimensions.
+        ir_cache_key: Key of the program in the persistent IR cache (see
+            :data:`gt4py.next.config.PERSISTENT_IR_CACHE`), `None` if it is not cached.
     """
 
     past_node: past.Program
@@ -173,6 +264,7 @@ class Program:
     definition: Optional[types.FunctionType] = None
     backend: Optional[ppi.ProgramExecutor] = DEFAULT_BACKEND
     grid_type: Optional[GridType] = None
+    ir_cache_key: Optional[str] = dataclasses.field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_function(
@@ -184,13 +276,17 @@ class Program:
         source_def = SourceDefinition.from_function(definition)
         closure_vars = get_closure_vars_from_function(definition)
         annotations = typing.get_type_hints(definition)
-        past_node = ProgramParser.apply(source_def, closure_vars, annotations)
+        ir_cache_key = _make_ir_cache_key(source_def, closure_vars, annotations, "past")
+        past_node = ir_cache.cached(
+            ir_cache_key, lambda: ProgramParser.apply(source_def, closure_vars, annotations)
+        )
         return cls(
             past_node=past_node,
             closure_vars=closure_vars,
             backend=backend,
             definition=definition,
             grid_type=grid_type,
+            ir_cache_key=ir_cache_key,
         )
 
     def __post_init__(self):
@@ -270,6 +366,14 @@ class Program:
 
     @functools.cached_property
     def itir(self) -> itir.FencilDefinition:
+        return ir_cache.cached(
+            None
+            if self.ir_cache_key is None
+            else ir_cache.make_key(self.ir_cache_key, self.grid_type),
+            self._lower_to_itir,
+        )
+
+    def _lower_to_itir(self) -> itir.FencilDefinition:
         offsets_and_dimensions = _filter_closure_vars_by_type(
             self._all_closure_vars, FieldOffset, Dimension
         )
@@ -510,6 +614,13 @@ def program(
     """
 
     def program_inner(definition: types.FunctionType) -> Program:
+        if config.LAZY_PARSING:
+            return typing.cast(
+                Program,
+                LazyProgram(
+                    Program.from_function, definition, backend=backend, grid_type=grid_type
+                ),
+            )
         return Program.from_function(definition, backend, grid_type)
 
     return program_inner if definition is None else program_inner(definition)
@@ -538,6 +649,8 @@ class FieldOperator(GTCallable, Generic[OperatorNodeT]):
             was created from.
         grid_type: The grid type (cartesian or unstructured) to be used. If not explicitly given
             it will be deduced from actually occurring dimensions.
+        ir_cache_key: Key of the field operator in the persistent IR cache (see
+            :data:`gt4py.next.config.PERSISTENT_IR_CACHE`), `None` if it is not cached.
     """
 
     foast_node: OperatorNodeT
@@ -545,6 +658,7 @@ class FieldOperator(GTCallable, Generic[OperatorNodeT]):
     definition: Optional[types.FunctionType] = None
     backend: Optional[ppi.ProgramExecutor] = DEFAULT_BACKEND
     grid_type: Optional[GridType] = None
+    ir_cache_key: Optional[str] = dataclasses.field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_function(
@@ -561,25 +675,34 @@ class FieldOperator(GTCallable, Generic[OperatorNodeT]):
         source_def = SourceDefinition.from_function(definition)
         closure_vars = get_closure_vars_from_function(definition)
         annotations = typing.get_type_hints(definition)
-        foast_definition_node = FieldOperatorParser.apply(source_def, closure_vars, annotations)
-        loc = foast_definition_node.location
-        operator_attribute_nodes = {
-            key: foast.Constant(value=value, type=type_translation.from_value(value), location=loc)
-            for key, value in operator_attributes.items()
-        }
-        untyped_foast_node = operator_node_cls(
-            id=foast_definition_node.id,
-            definition=foast_definition_node,
-            location=loc,
-            **operator_attribute_nodes,
+
+        def parse() -> OperatorNodeT:
+            foast_definition_node = FieldOperatorParser.apply(source_def, closure_vars, annotations)
+            loc = foast_definition_node.location
+            operator_attribute_nodes = {
+                key: foast.Constant(
+                    value=value, type=type_translation.from_value(value), location=loc
+                )
+                for key, value in operator_attributes.items()
+            }
+            untyped_foast_node = operator_node_cls(
+                id=foast_definition_node.id,
+                definition=foast_definition_node,
+                location=loc,
+                **operator_attribute_nodes,
+            )
+            return FieldOperatorTypeDeduction.apply(untyped_foast_node)
+
+        ir_cache_key = _make_ir_cache_key(
+            source_def, closure_vars, annotations, operator_node_cls.__name__, operator_attributes
         )
-        foast_node = FieldOperatorTypeDeduction.apply(untyped_foast_node)
         return cls(
-            foast_node=foast_node,
+            foast_node=ir_cache.cached(ir_cache_key, parse),
             closure_vars=closure_vars,
             definition=definition,
             backend=backend,
             grid_type=grid_type,
+            ir_cache_key=ir_cache_key,
         )
 
     def __gt_type__(self) -> ts.CallableType:
@@ -597,7 +720,10 @@ class FieldOperator(GTCallable, Generic[OperatorNodeT]):
         if hasattr(self, "__cached_itir"):
             return getattr(self, "__cached_itir")  # noqa: B009
 
-        itir_node: itir.FunctionDefinition = FieldOperatorLowering.apply(self.foast_node)
+        itir_node: itir.FunctionDefinition = ir_cache.cached(
+            None if self.ir_cache_key is None else ir_cache.make_key(self.ir_cache_key, "itir"),
+            lambda: FieldOperatorLowering.apply(self.foast_node),
+        )
 
         object.__setattr__(self, "__cached_itir", itir_node)
 
@@ -606,8 +732,35 @@ class FieldOperator(GTCallable, Generic[OperatorNodeT]):
     def __gt_closure_vars__(self) -> dict[str, Any]:
         return self.closure_vars
 
+    @functools.cached_property
+    def _program_cache(self) -> dict[str, Program]:
+        return {}
+
+    @property
+    def program_lowering_count(self) -> int:
+        """
+        Number of programs generated by :meth:`as_program` which have been lowered to ITIR.
+
+        Each of them is lowered (at most) once, later calls with the same argument types
+        reuse the cached program.
+        """
+        return sum("itir" in program.__dict__ for program in self._program_cache.values())
+
     def as_program(
         self, arg_types: list[ts.TypeSpec], kwarg_types: dict[str, ts.TypeSpec]
+    ) -> Program:
+        # The type specifications contain lists and are therefore not hashable, see
+        # `compilation_hash` in the gtfn runner for the same workaround. The backend and
+        # grid type are fixed for each instance (`with_backend` returns a new one).
+        cache_key = eve_utils.content_hash(arg_types, kwarg_types)
+        try:
+            return self._program_cache[cache_key]
+        except KeyError:
+            program = self._program_cache[cache_key] = self._make_program(arg_types, kwarg_types)
+            return program
+
+    def _make_program(
+        self, arg_types: list[ts.TypeSpec], kwarg_types: dict[str, ts.TypeSpec]
     ) -> Program:
         # TODO(tehrengruber): implement mechanism to deduce default values
         #  of arg and kwarg types
@@ -742,6 +895,86 @@ def _tuple_assign_field(
         target[domain] = source[domain]
 
 
+_DefinitionT = TypeVar("_DefinitionT", Program, FieldOperator)
+
+
+class _LazyDefinition(Generic[_DefinitionT]):
+    """
+    Thread-safe proxy deferring the construction of a decorated definition until first use.
+
+    Parsing and type deduction are only run when the wrapped object is needed, e.g. when
+    it is called or when its type or ITIR are requested. Any other attribute access is
+    forwarded to the wrapped object, except for special (dunder) attributes, so that
+    protocol checks like ``isinstance(obj, GTCallable)`` do not trigger the parsing.
+    """
+
+    __slots__ = ("_factory", "_definition", "_kwargs", "_lock", "_wrapped")
+
+    def __init__(
+        self,
+        factory: Callable[..., _DefinitionT],
+        definition: types.FunctionType,
+        **kwargs: Any,
+    ) -> None:
+        self._factory = factory
+        self._definition = definition
+        self._kwargs = kwargs
+        self._lock = threading.Lock()
+        self._wrapped: Optional[_DefinitionT] = None
+
+    def _resolve(self) -> _DefinitionT:
+        if self._wrapped is None:
+            with self._lock:
+                if self._wrapped is None:
+                    self._wrapped = self._factory(self._definition, **self._kwargs)
+        return self._wrapped
+
+    @property
+    def definition(self) -> types.FunctionType:
+        return self._definition
+
+    def with_backend(self, backend: ppi.ProgramExecutor) -> _LazyDefinition[_DefinitionT]:
+        return type(self)(self._factory, self._definition, **{**self._kwargs, "backend": backend})
+
+    def with_grid_type(self, grid_type: GridType) -> _LazyDefinition[_DefinitionT]:
+        return type(self)(
+            self._factory, self._definition, **{**self._kwargs, "grid_type": grid_type}
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        if name in _LazyDefinition.__slots__ or (name.startswith("__") and name.endswith("__")):
+            raise AttributeError(name)
+        return getattr(self._resolve(), name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        state = "parsed" if self._wrapped is not None else "not parsed yet"
+        return f"{type(self).__name__}({self._definition.__qualname__}, {state})"
+
+
+class LazyProgram(_LazyDefinition[Program]):
+    """Lazily parsed :class:`Program` (see :data:`gt4py.next.config.LAZY_PARSING`)."""
+
+    __slots__ = ()
+
+
+class LazyFieldOperator(_LazyDefinition[FieldOperator], GTCallable):
+    """Lazily parsed :class:`FieldOperator` (see :data:`gt4py.next.config.LAZY_PARSING`)."""
+
+    __slots__ = ()
+
+    def __gt_type__(self) -> ts.CallableType:
+        return self._resolve().__gt_type__()
+
+    def __gt_itir__(self) -> itir.FunctionDefinition:
+        return self._resolve().__gt_itir__()
+
+    def __gt_closure_vars__(self) -> dict[str, Any]:
+        return self._resolve().__gt_closure_vars__()
+
+
 @typing.overload
 def field_operator(
     definition: types.FunctionType, *, backend: Optional[ppi.ProgramExecutor]
@@ -774,6 +1007,13 @@ def field_operator(definition=None, *, backend=None, grid_type=None):
     """
 
     def field_operator_inner(definition: types.FunctionType) -> FieldOperator[foast.FieldOperator]:
+        if config.LAZY_PARSING:
+            return typing.cast(
+                FieldOperator[foast.FieldOperator],
+                LazyFieldOperator(
+                    FieldOperator.from_function, definition, backend=backend, grid_type=grid_type
+                ),
+            )
         return FieldOperator.from_function(definition, backend, grid_type)
 
     return field_operator_inner if definition is None else field_operator_inner(definition)
@@ -843,11 +1083,16 @@ def scan_operator(
     #  the above doctest fails when executed using `pytest --doctest-modules`.
 
     def scan_operator_inner(definition: types.FunctionType) -> FieldOperator:
-        return FieldOperator.from_function(
-            definition,
-            backend,
+        scan_kwargs: dict[str, Any] = dict(
+            backend=backend,
             operator_node_cls=foast.ScanOperator,
             operator_attributes={"axis": axis, "forward": forward, "init": init},
         )
+        if config.LAZY_PARSING:
+            return typing.cast(
+                FieldOperator,
+                LazyFieldOperator(FieldOperator.from_function, definition, **scan_kwargs),
+            )
+        return FieldOperator.from_function(definition, **scan_kwargs)
 
     return scan_operator_inner if definition is None else scan_operator_inner(definition)
@@ -184,7 +184,7 @@ class IfStmt(Stmt):
     true_branch: BlockStmt
     false_branch: BlockStmt
 
-    @datamodels.root_validator
+    @datamodels.root_validator(derives_data=True)
     @classmethod
     def _collect_common_symbols(cls: type[IfStmt], instance: IfStmt) -> None:
         common_symbol_names = (
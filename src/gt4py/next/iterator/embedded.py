@@ -20,6 +20,7 @@ import abc
 import contextvars as cvars
 import copy
 import dataclasses
+import functools
 import itertools
 import math
 import sys
@@ -106,6 +107,15 @@ class NeighborTableOffsetProvider:
     ) -> common.IntIndex:
         return self.table[(primary, neighbor_idx)]
 
+    @functools.cached_property
+    def fingerprint(self) -> tuple[Any, ...]:
+        return connectivity_fingerprint(self)
+
+    @functools.cached_property
+    def domain_sizes(self) -> tuple[int, int]:
+        """Number of origin elements and largest neighbor index, as used for temporaries."""
+        return self.table.shape[0], int(self.table.max()) if self.table.size else 0
+
 
 class StridedNeighborOffsetProvider:
     def __init__(
@@ -126,6 +136,57 @@ class StridedNeighborOffsetProvider:
     ) -> common.IntIndex:
         return primary * self.max_neighbors + neighbor_idx
 
+    @functools.cached_property
+    def fingerprint(self) -> tuple[Any, ...]:
+        return connectivity_fingerprint(self)
+
+
+def connectivity_fingerprint(connectivity: common.Connectivity) -> tuple[Any, ...]:
+    """Hashable summary of the connectivity properties relevant for code generation.
+
+    The actual neighbor table values are not part of the fingerprint, since they are
+    passed to the generated code as regular arguments.
+    """
+    return (
+        "NeighborTable" if isinstance(connectivity, common.NeighborTable) else "Connectivity",
+        connectivity.origin_axis,
+        connectivity.neighbor_axis,
+        connectivity.max_neighbors,
+        connectivity.has_skip_values,
+        np.dtype(connectivity.index_type).str,
+    )
+
+
+def offset_provider_fingerprint(
+    offset_provider: common.OffsetProvider, *, with_domain_sizes: bool = False
+) -> tuple[Any, ...]:
+    """Hashable content-based fingerprint of an offset provider.
+
+    Equivalent offset providers (e.g. rebuilt on every time step or on every rank)
+    get the same fingerprint, so they can share compiled programs. The fingerprint
+    of :class:`NeighborTableOffsetProvider` instances is computed only once.
+
+    With `with_domain_sizes`, the horizontal domain sizes derived from the neighbor
+    tables are included, which is required when the generated code depends on them
+    (e.g. for the sizes of temporaries).
+    """
+    return tuple(
+        (
+            name,
+            elem.fingerprint
+            if isinstance(elem, (NeighborTableOffsetProvider, StridedNeighborOffsetProvider))
+            else connectivity_fingerprint(elem)
+            if isinstance(elem, common.Connectivity)
+            else elem,
+            *(
+                (elem.domain_sizes,)
+                if with_domain_sizes and isinstance(elem, NeighborTableOffsetProvider)
+                else ()
+            ),
+        )
+        for name, elem in offset_provider.items()
+    )
+
 
 # Offsets
 OffsetPart: TypeAlias = Tag | common.IntIndex
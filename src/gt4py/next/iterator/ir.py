@@ -18,7 +18,7 @@ from typing import ClassVar, List, Optional, Union
 import gt4py.eve as eve
 from gt4py.eve import Coerced, SymbolName, SymbolRef, datamodels
 from gt4py.eve.traits import SymbolTableTrait, ValidatedSymbolTableTrait
-from gt4py.eve.utils import noninstantiable
+from gt4py.eve.utils import content_hash, noninstantiable
 
 
 @noninstantiable
@@ -222,15 +222,49 @@ class FencilDefinition(Node, ValidatedSymbolTableTrait):
 
 
 # TODO(fthaler): just use hashable types in nodes (tuples instead of lists)
-Sym.__hash__ = Node.__hash__  # type: ignore[method-assign]
-Expr.__hash__ = Node.__hash__  # type: ignore[method-assign]
-Literal.__hash__ = Node.__hash__  # type: ignore[method-assign]
-NoneLiteral.__hash__ = Node.__hash__  # type: ignore[method-assign]
-OffsetLiteral.__hash__ = Node.__hash__  # type: ignore[method-assign]
-AxisLiteral.__hash__ = Node.__hash__  # type: ignore[method-assign]
-SymRef.__hash__ = Node.__hash__  # type: ignore[method-assign]
-Lambda.__hash__ = Node.__hash__  # type: ignore[method-assign]
-FunCall.__hash__ = Node.__hash__  # type: ignore[method-assign]
-FunctionDefinition.__hash__ = Node.__hash__  # type: ignore[method-assign]
-StencilClosure.__hash__ = Node.__hash__  # type: ignore[method-assign]
-FencilDefinition.__hash__ = Node.__hash__  # type: ignore[method-assign]
+# ITIR nodes are never modified in place by the passes, so the (structural) hash can be
+# cached to make repeated hashing and comparisons of unchanged trees cheap.
+for _node_class in (
+    Sym,
+    Expr,
+    Literal,
+    NoneLiteral,
+    OffsetLiteral,
+    AxisLiteral,
+    SymRef,
+    Lambda,
+    FunCall,
+    FunctionDefinition,
+    StencilClosure,
+    FencilDefinition,
+):
+    eve.cache_node_hash(_node_class, Node.__hash__)
+
+
+def _fingerprint_data(value: typing.Any) -> typing.Any:
+    if isinstance(value, eve.Node):
+        return (
+            type(value).__qualname__,
+            tuple(_fingerprint_data(child) for child in value.iter_children_values()),
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_fingerprint_data(item) for item in value)
+    if isinstance(value, str):
+        return str(value)
+    return value
+
+
+@eve.register_annex_user("fingerprint", str, structural=True)
+def fingerprint(node: Node) -> str:
+    """Stable content-based fingerprint of an ITIR tree.
+
+    Unlike `hash(node)` the value is stable across interpreter sessions and, unlike
+    `str(node)`, it does not require pretty-printing the whole tree. The result is
+    memoized in the `annex` of `node`, so repeated calls on the same instance (e.g.
+    one per program call) have a constant cost. Since ITIR nodes are mutable, the
+    tree must not be modified in place after it has been fingerprinted.
+    """
+    if (result := getattr(node.annex, "fingerprint", None)) is None:
+        result = content_hash(_fingerprint_data(node))
+        node.annex.fingerprint = result
+    return result
@@ -69,14 +69,19 @@ class CollapseTuple(eve.NodeTranslator):
         collapse_make_tuple_tuple_get: bool = True,
         collapse_tuple_get_make_tuple: bool = True,
         use_global_type_inference: bool = False,
+        node_types: Optional[dict[int, type_inference.Type]] = None,
     ) -> ir.Node:
         """
         Simplifies `make_tuple`, `tuple_get` calls.
 
         If `ignore_tuple_size`, apply the transformation even if length of the inner tuple
-        is greater than the length of the outer tuple.
+        is greater than the length of the outer tuple. The result of the global type inference
+        of an enclosing node can be passed as `node_types` to avoid its recomputation.
         """
-        node_types = it_type_inference.infer_all(node) if use_global_type_inference else None
+        if not use_global_type_inference:
+            node_types = None
+        elif node_types is None:
+            node_types = it_type_inference.infer_all(node)
         return cls(
             ignore_tuple_size,
             collapse_make_tuple_tuple_get,
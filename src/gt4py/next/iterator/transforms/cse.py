@@ -11,31 +11,58 @@
 # distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
+import bisect
 import dataclasses
 import functools
 import math
-import operator
 import typing
 
-from gt4py.eve import NodeTranslator, NodeVisitor, SymbolTableTrait, VisitorWithSymbolTableTrait
+from gt4py.eve import NodeTranslator, SymbolTableTrait
 from gt4py.eve.utils import UIDGenerator
 from gt4py.next.iterator import ir
 from gt4py.next.iterator.transforms.inline_lambdas import inline_lambda
 
 
+@functools.cache
+def _is_node_class(cls: type) -> bool:
+    # `isinstance` checks against node classes are slow (see `eve.visitors._is_immutable_leaf`)
+    return issubclass(cls, ir.Node)
+
+
+@functools.cache
+def _is_scope_class(cls: type) -> bool:
+    return issubclass(cls, SymbolTableTrait)
+
+
+def _is_if_call(node: ir.Node) -> bool:
+    return (
+        type(node) is ir.FunCall
+        and type(node.fun) is ir.SymRef
+        and node.fun.id == "if_"  # type: ignore[attr-defined]  # checked above
+    )
+
+
 @dataclasses.dataclass
 class _NodeReplacer(NodeTranslator):
     PRESERVED_ANNEX_ATTRS = ("type",)
 
-    expr_map: dict[int, ir.SymRef]
+    #: The subtrees to replace, keyed by their pre-order position (see `CollectSubexpressions`),
+    #: mapped to the end of the subtree and the replacement.
+    expr_map: dict[int, tuple[int, ir.SymRef]]
+    position: int = 0
 
-    def visit_Expr(self, node: ir.Node) -> ir.Node:
-        if id(node) in self.expr_map:
-            return self.expr_map[id(node)]
-        return self.generic_visit(node)
+    def visit(self, node: typing.Any, **kwargs) -> typing.Any:
+        if not _is_node_class(type(node)):
+            return super().visit(node, **kwargs)
+        position = self.position
+        if position in self.expr_map:
+            self.position, replacement = self.expr_map[position]
+            return replacement
+        self.position += 1
+        return super().visit(node, **kwargs)
 
     def visit_FunCall(self, node: ir.FunCall) -> ir.Node:
-        node = typing.cast(ir.FunCall, self.visit_Expr(node))
+        node = self.generic_visit(node)
         # If we encounter an expression like:
         #  (λ(_cs_1) → (λ(a) → a+a)(_cs_1))(outer_expr)
         # (non-recursively) inline the lambda to obtain:
@@ -55,152 +82,167 @@ class _NodeReplacer(NodeTranslator):
 
 
 def _is_collectable_expr(node: ir.Node) -> bool:
-    if isinstance(node, ir.FunCall):
+    # note: exact type checks as this is called for (almost) every node
+    if type(node) is ir.FunCall:
         # do not collect (and thus deduplicate in CSE) shift(offsets…) calls. Node must still be
         #  visited, to ensure symbol dependencies are recognized correctly.
         # do also not collect reduce nodes if they are left in the it at this point, this may lead to
         #  conceptual problems (other parts of the tool chain rely on the arguments being present directly
         #  on the reduce FunCall node (connectivity deduction)), as well as problems with the imperative backend
         #  backend (single pass eager depth first visit approach)
-        if isinstance(node.fun, ir.SymRef) and node.fun.id in ["lift", "shift", "reduce"]:
+        if type(node.fun) is ir.SymRef and node.fun.id in ["lift", "shift", "reduce"]:
             return False
         return True
-    elif isinstance(node, ir.Lambda):
+    elif type(node) is ir.Lambda:
         return True
 
     return False
 
 
 @dataclasses.dataclass
-class CollectSubexpressions(VisitorWithSymbolTableTrait, NodeVisitor):
+class CollectSubexpressions:
+    """
+    Collect the subexpressions of a node which can be extracted from it in a single traversal.
+
+    Nodes are identified by their pre-order position in the tree, so shared nodes are
+    distinct occurrences. Structurally equal subexpressions get the same value number,
+    assigned by hash-consing the node type with the value numbers of the children and the
+    leaf values, such that subtrees are never compared with each other. A subexpression
+    can only be extracted if it does not use a symbol declared inside of the root node:
+    every symbol reference is resolved to the innermost declaration of its name (i.e.
+    respecting shadowing) and the subexpression is collected if all of them are outside
+    of it or of the root.
+
+    Occurrences in only one branch of an `if_` are conditional: they are not counted (to
+    avoid evaluating the subexpression unconditionally), but are replaced as well if the
+    subexpression is extracted because of its other occurrences.
+    """
+
+    class Occurrence(typing.NamedTuple):
+        value_number: int
+        node: ir.Expr
+        #: Pre-order position of the node in the tree.
+        position: int
+        #: Position of the first node after the subtree of the node.
+        end: int
+        depth: int
+        conditional: bool = False
+
     @dataclasses.dataclass
     class SubexpressionData:
-        #: A list of node ids with equal hash and a set of collected child subexpression ids
-        subexprs: list[tuple[int, set[int]]] = dataclasses.field(default_factory=list)
+        #: The first collected occurrence of the subexpression.
+        node: ir.Expr
+        #: Position and subtree end of all (unconditional) occurrences (see `Occurrence`).
+        occurrences: list[tuple[int, int]] = dataclasses.field(default_factory=list)
+        #: Position and subtree end of the conditional occurrences.
+        conditional_occurrences: list[tuple[int, int]] = dataclasses.field(default_factory=list)
         #: Maximum depth of a subexpression in the tree. Used to sort collected subexpressions
         #:  such that deeper nodes can be processed (in other passed building upon this pass)
         #:  earlier.
         max_depth: int | float = -math.inf
 
-    @dataclasses.dataclass
-    class State:
-        #: A dictionary mapping a node to a list of node ids with equal hash and some additional
-        #: information. See `SubexpressionData` for more information.
-        subexprs: dict[ir.Node, "CollectSubexpressions.SubexpressionData"] = dataclasses.field(
-            default_factory=dict
-        )
-        # TODO(tehrengruber): Revisit if this makes sense or if we can just recompute the collected
-        #  child node ids and get simpler code.
-        #: The ids of all child subexpressions which are collected.
-        collected_child_node_ids: set[int] = dataclasses.field(default_factory=set)
-        #: The ids of all nodes declaring a symbol which are referenced (using a `SymRef`)
-        used_symbol_ids: set[int] = dataclasses.field(default_factory=set)
-
-        def remove_subexprs(self, nodes: typing.Iterable[ir.Node]) -> None:
-            node_ids_to_remove: set[int] = set()
-            for node in nodes:
-                subexpr_data = self.subexprs.pop(node, None)
-                if subexpr_data:
-                    node_ids, _ = zip(*subexpr_data.subexprs)
-                    node_ids_to_remove |= set(node_ids)
-            for subexpr_data in self.subexprs.values():
-                for _, collected_child_node_ids in subexpr_data.subexprs:
-                    collected_child_node_ids -= node_ids_to_remove
+    #: Value numbers keyed by the node type, the value numbers of the children and leaf values.
+    value_numbers: dict[tuple, int] = dataclasses.field(default_factory=dict)
+    #: The collected occurrences in post-order.
+    occurrences: list[Occurrence] = dataclasses.field(default_factory=list)
+    #: Positions of the nodes declaring a symbol in the current scope, innermost last.
+    declarations: dict[str, list[int]] = dataclasses.field(default_factory=dict)
+    position: int = 0
 
     @classmethod
-    def apply(cls, node: ir.Node) -> dict[ir.Node, list[tuple[int, set[int]]]]:
-        state = cls.State()
-        obj = cls()
-        obj.visit(node, state=state, depth=-1)
-        # Return subexpression such that the nodes closer to the root come first and skip the root
-        # node itself.
-        subexprs_sorted: list[tuple[ir.Node, "CollectSubexpressions.SubexpressionData"]] = sorted(
-            state.subexprs.items(), key=lambda el: el[1].max_depth
-        )
-        return {k: v.subexprs for k, v in subexprs_sorted if k is not node}
+    def apply(cls, node: ir.Node) -> list["CollectSubexpressions.SubexpressionData"]:
+        collector = cls()
+        collector.visit(node, depth=0)
+        subexprs: dict[int, CollectSubexpressions.SubexpressionData] = {}
+        for occurrence in collector.occurrences:
+            if occurrence.conditional:
+                continue
+            data = subexprs.get(occurrence.value_number, None)
+            if data is None:
+                data = subexprs[occurrence.value_number] = cls.SubexpressionData(occurrence.node)
+            data.occurrences.append((occurrence.position, occurrence.end))
+            data.max_depth = max(data.max_depth, occurrence.depth)
+        for occurrence in collector.occurrences:
+            if occurrence.conditional and (data := subexprs.get(occurrence.value_number, None)):
+                data.conditional_occurrences.append((occurrence.position, occurrence.end))
+        # Return subexpression such that the nodes closer to the root come first (the root
+        # node itself is never collected).
+        return sorted(subexprs.values(), key=lambda data: data.max_depth)
+
+    def visit(self, node: ir.Node, depth: int) -> tuple[int, int | float]:
+        """
+        Collect the subexpressions of `node`.
+
+        Returns the value number of `node` and the position of the outermost declaration
+        of a symbol referenced in it (infinite if there is none inside of the root).
+        """
+        position = self.position
+        self.position += 1
+
+        declared: typing.Iterable[str] = ()
+        if _is_scope_class(type(node)):
+            declared = node.annex.symtable.keys()
+            for name in declared:
+                self.declarations.setdefault(name, []).append(position)
+
+        outermost_declaration: int | float = math.inf
+        if type(node) is ir.SymRef and (declarations := self.declarations.get(node.id, None)):
+            outermost_declaration = declarations[-1]
+
+        is_if = _is_if_call(node)
+        arg_starts: list[int] = []
+        key: list[typing.Any] = [type(node)]
+        for child in node.iter_children_values():
+            if isinstance(child, list):
+                value_numbers = []
+                for item in child:
+                    if is_if:
+                        arg_starts.append(len(self.occurrences))
+                    value_number, item_declaration = self.visit(item, depth + 2)
+                    value_numbers.append(value_number)
+                    outermost_declaration = min(outermost_declaration, item_declaration)
+                key.append(tuple(value_numbers))
+            elif _is_node_class(type(child)):
+                value_number, child_declaration = self.visit(child, depth + 1)
+                key.append(value_number)
+                outermost_declaration = min(outermost_declaration, child_declaration)
+            else:
+                key.append(child)
 
-    def generic_visit(self, *args, **kwargs):
-        depth = kwargs.pop("depth")
-        return super().generic_visit(*args, depth=depth + 1, **kwargs)
+        for name in declared:
+            self.declarations[name].pop()
 
-    def visit(self, node: ir.Node, **kwargs) -> None:  # type: ignore[override]  # supertype accepts any node, but we want to be more specific here.
-        if not isinstance(node, SymbolTableTrait) and not _is_collectable_expr(node):
-            return super().visit(node, **kwargs)
+        if is_if:
+            self._filter_if_arguments(arg_starts)
 
-        depth = kwargs["depth"]
-        parent_state = kwargs.pop("state")
-        collected_child_node_ids: set[int] = set()
-        used_symbol_ids: set[int] = set()
+        value_number = self.value_numbers.setdefault(tuple(key), len(self.value_numbers))
+        # collect the subexpression if it does not use symbols declared inside of the root
+        if position > 0 and outermost_declaration >= position and _is_collectable_expr(node):
+            self.occurrences.append(
+                self.Occurrence(value_number, node, position, self.position, depth)
+            )
+        return value_number, outermost_declaration
 
+    def _filter_if_arguments(self, arg_starts: list[int]) -> None:
         # Special handling of `if_(condition, true_branch, false_branch)` like expressions that
         # avoids extracting subexpressions unless they are used in either the condition or both
         # branches.
-        if isinstance(node, ir.FunCall) and node.fun == ir.SymRef(id="if_"):
-            assert len(node.args) == 3
-            # collect subexpressions for all arguments to the `if_`
-            arg_states = [self.State() for _ in node.args]
-            for arg, state in zip(node.args, arg_states):
-                self.visit(arg, state=state, **{**kwargs, "depth": depth + 1})
-
-            # remove all subexpressions that are not eligible for collection
-            #  (either they occur in the condition or in both branches)
-            eligible_subexprs = arg_states[0].subexprs.keys() | (
-                arg_states[1].subexprs.keys() & arg_states[2].subexprs.keys()
-            )
-            for arg_state in arg_states:
-                arg_state.remove_subexprs(arg_state.subexprs.keys() - eligible_subexprs)
-
-            # merge the states of the three arguments
-            subexprs: dict[ir.Node, CollectSubexpressions.SubexpressionData] = {}
-            for state in arg_states:
-                for subexpr, data in state.subexprs.items():
-                    merged_data = subexprs.setdefault(subexpr, self.SubexpressionData())
-                    merged_data.subexprs.extend(data.subexprs)
-                    merged_data.max_depth = max(merged_data.max_depth, data.max_depth)
-            collected_child_node_ids = functools.reduce(
-                operator.or_, (state.collected_child_node_ids for state in arg_states)
-            )
-            used_symbol_ids = functools.reduce(
-                operator.or_, (state.used_symbol_ids for state in arg_states)
-            )
-            # propagate collected subexpressions to parent
-            for subexpr, data in subexprs.items():
-                parent_data = parent_state.subexprs.setdefault(subexpr, self.SubexpressionData())
-                parent_data.subexprs.extend(data.subexprs)
-                parent_data.max_depth = max(merged_data.max_depth, data.max_depth)
-        else:
-            super().visit(
-                node,
-                state=self.State(parent_state.subexprs, collected_child_node_ids, used_symbol_ids),
-                **kwargs,
-            )
-
-        if isinstance(node, SymbolTableTrait):
-            # remove symbols used in child nodes if they are declared in the current node
-            used_symbol_ids = used_symbol_ids - {id(v) for v in node.annex.symtable.values()}
-
-        # if no symbols are used that are defined in the root node, i.e. the node given to `apply`,
-        # we collect the subexpression
-        if not used_symbol_ids and _is_collectable_expr(node):
-            parent_data = parent_state.subexprs.setdefault(node, self.SubexpressionData())
-            parent_data.subexprs.append((id(node), collected_child_node_ids))
-            parent_data.max_depth = max(parent_data.max_depth, depth)
-
-            # propagate to parent that we have collected its child
-            parent_state.collected_child_node_ids.add(id(node))
-
-        # propagate used symbol ids to parent
-        parent_state.used_symbol_ids.update(used_symbol_ids)
-
-        # propagate to parent which of its children we have collected
-        # TODO(tehrengruber): This is expensive for a large tree. Use something like a "ChainSet".
-        parent_state.collected_child_node_ids.update(collected_child_node_ids)
-
-    def visit_SymRef(
-        self, node: ir.SymRef, *, symtable: dict[str, ir.Node], state: State, **kwargs
-    ) -> None:
-        if node.id in symtable:  # root symbol otherwise
-            state.used_symbol_ids.add(id(symtable[node.id]))
+        assert len(arg_starts) == 3
+        condition, true_branch, false_branch = (
+            {
+                occurrence.value_number
+                for occurrence in self.occurrences[start:end]
+                if not occurrence.conditional
+            }
+            for start, end in zip(arg_starts, [*arg_starts[1:], len(self.occurrences)])
+        )
+        eligible_subexprs = condition | (true_branch & false_branch)
+        self.occurrences[arg_starts[0] :] = [
+            occurrence
+            if occurrence.value_number in eligible_subexprs
+            else occurrence._replace(conditional=True)
+            for occurrence in self.occurrences[arg_starts[0] :]
+        ]
 
 
 def extract_subexpression(
@@ -299,37 +341,53 @@ def extract_subexpression(
     subexprs = CollectSubexpressions.apply(node)
 
     # collect multiple occurrences and map them to fresh symbols
-    expr_map = dict[int, ir.SymRef]()
-    ignored_ids = set()
-    for expr, subexpr_entry in (
-        subexprs.items() if not deepest_expr_first else reversed(subexprs.items())
-    ):
+    expr_map = dict[int, tuple[int, ir.SymRef]]()
+    # start and end positions of the (disjoint) outermost subtrees to be replaced, all
+    # subexpressions inside of them are ignored
+    replaced_starts: list[int] = []
+    replaced_ends: list[int] = []
+
+    def is_replaced(position: int) -> bool:
+        i = bisect.bisect_right(replaced_starts, position) - 1
+        return i >= 0 and position < replaced_ends[i]
+
+    for subexpr in subexprs if not deepest_expr_first else reversed(subexprs):
         # just to make mypy happy when calling the predicate. Every subnode and hence subexpression
         # is an expr anyway.
-        assert isinstance(expr, ir.Expr)
+        assert isinstance(subexpr.node, ir.Expr)
 
-        if not predicate(expr, len(subexpr_entry)):
+        if not predicate(subexpr.node, len(subexpr.occurrences)):
             continue
 
-        eligible_ids = set()
-        for id_, child_ids in subexpr_entry:
-            if id_ in ignored_ids:
+        eligible_occurrences = []
+        for position, end in subexpr.occurrences:
+            if is_replaced(position):
                 ignored_children = True
             else:
-                eligible_ids.add(id_)
-                # since the node id is eligible don't eliminate its children
-                ignored_ids.update(child_ids)
+                eligible_occurrences.append((position, end))
 
-        # if no node ids are eligible, e.g. because the parent was already eliminated or because
-        # the expression occurs only once, skip the elimination
-        if not eligible_ids:
+        # if no occurrences are eligible, e.g. because the parent was already eliminated or
+        # because the expression occurs only once, skip the elimination
+        if not eligible_occurrences:
             continue
 
+        # the value is computed anyway, so the conditional occurrences can use it as well
+        eligible_occurrences.extend(
+            (position, end)
+            for position, end in subexpr.conditional_occurrences
+            if not is_replaced(position)
+        )
+
         expr_id = uid_generator.sequential_id()
-        extracted[ir.Sym(id=expr_id)] = expr
+        extracted[ir.Sym(id=expr_id)] = subexpr.node
         expr_ref = ir.SymRef(id=expr_id)
-        for id_ in eligible_ids:
-            expr_map[id_] = expr_ref
+        for position, end in eligible_occurrences:
+            expr_map[position] = (end, expr_ref)
+            # since the occurrence is eligible don't eliminate its children
+            lo = bisect.bisect_left(replaced_starts, position)
+            hi = bisect.bisect_left(replaced_starts, end)
+            replaced_starts[lo:hi] = [position]
+            replaced_ends[lo:hi] = [end]
 
         if once_only:
             break
@@ -361,19 +419,29 @@ class CommonSubexpressionElimination(NodeTranslator):
 
     collect_all: bool = dataclasses.field(default=False)
 
-    def visit_FunCall(self, node: ir.FunCall):
+    def visit_Lambda(self, node: ir.Lambda, **kwargs) -> ir.Lambda:
+        # subexpressions using the parameters can only be extracted inside of the lambda
+        return self.generic_visit(node, **{**kwargs, "extract": True})
+
+    def visit_FunCall(self, node: ir.FunCall, *, extract: bool = True, **kwargs):
         if isinstance(node.fun, ir.SymRef) and node.fun.id in [
             "cartesian_domain",
             "unstructured_domain",
         ]:
             return node
 
-        new_expr, extracted, ignored_children = extract_subexpression(
-            node, lambda subexpr, num_occurences: num_occurences > 1, self.uids
-        )
+        extracted = None
+        if extract:
+            new_expr, extracted, ignored_children = extract_subexpression(
+                node, lambda subexpr, num_occurences: num_occurences > 1, self.uids
+            )
 
         if not extracted:
-            return self.generic_visit(node)
+            # Every subexpression which could be extracted from a child would also have been
+            # extracted from this node, unless it uses a symbol declared in a lambda or only
+            # occurs in one branch of an `if_`. Only those children are searched again
+            # (avoiding a quadratic number of searches in deeply nested expressions).
+            return self.generic_visit(node, **{**kwargs, "extract": _is_if_call(node)})
 
         # apply remapping
         result = ir.FunCall(
@@ -205,6 +205,9 @@ def split_closures(node: ir.FencilDefinition, offset_provider) -> FencilWithTemp
     """
     uid_gen_tmps = UIDGenerator(prefix="_tmp")
 
+    # the types are saved to the annex, so the nodes must neither be shared within the tree
+    # (by position dependent types) nor with other trees (e.g. the input of the transformations)
+    node = type_inference.unshared_copy(node)
     type_inference.infer_all(node, offset_provider=offset_provider, save_to_annex=True)
 
     tmps: list[ir.Sym] = []
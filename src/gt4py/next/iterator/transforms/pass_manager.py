@@ -13,8 +13,10 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import enum
+from typing import Optional
 
-from gt4py.next.iterator import ir
+from gt4py.eve import instrumentation
+from gt4py.next.iterator import ir, type_inference
 from gt4py.next.iterator.transforms import simple_inline_heuristic
 from gt4py.next.iterator.transforms.collapse_list_get import CollapseListGet
 from gt4py.next.iterator.transforms.collapse_tuple import CollapseTuple
@@ -32,6 +34,11 @@ from gt4py.next.iterator.transforms.normalize_shifts import NormalizeShifts
 from gt4py.next.iterator.transforms.propagate_deref import PropagateDeref
 from gt4py.next.iterator.transforms.scan_eta_reduction import ScanEtaReduction
 from gt4py.next.iterator.transforms.unroll_reduce import UnrollReduce
+from gt4py.next.iterator.transforms.worklist import LoopStatistics, Worklist
+
+
+def _run_pass(name, transform, ir):
+    return instrumentation.run_pass("itir", name, transform, ir)
 
 
 @enum.unique
@@ -41,35 +48,110 @@ class LiftMode(enum.Enum):
     SIMPLE_HEURISTIC = enum.auto()
 
 
-def _inline_lifts(ir, lift_mode):
+def _inline_lifts(ir, lift_mode, **kwargs):
     if lift_mode == LiftMode.FORCE_INLINE:
-        return InlineLifts().visit(ir)
+        return InlineLifts().visit(ir, **kwargs)
     elif lift_mode == LiftMode.SIMPLE_HEURISTIC:
-        return InlineLifts(simple_inline_heuristic.is_eligible_for_inlining).visit(ir)
+        return InlineLifts(simple_inline_heuristic.is_eligible_for_inlining).visit(ir, **kwargs)
     elif lift_mode == LiftMode.FORCE_TEMPORARIES:
         return InlineLifts(
             flags=InlineLifts.Flag.INLINE_TRIVIAL_DEREF_LIFT
             | InlineLifts.Flag.INLINE_DEREF_LIFT  # some tuple exprs found in FVM don't work yet.
             | InlineLifts.Flag.INLINE_LIFTED_ARGS
             # needed for UnrollReduce and lift args like `(↑(λ() → constant)`
-        ).visit(ir)
+        ).visit(ir, **kwargs)
     else:
         raise ValueError()
 
     return ir
 
 
-def _inline_into_scan(ir, *, max_iter=10):
-    for _ in range(10):
+def _inline_into_scan(ir, *, max_iter=10, statistics=None):
+    worklist = Worklist(ir, statistics)
+    for i in range(max_iter):
         # in case there are multiple levels of lambdas around the scan we have to do multiple iterations
-        inlined = InlineIntoScan().visit(ir)
-        inlined = InlineLambdas.apply(inlined, opcount_preserving=True, force_inline_lift_args=True)
-        if inlined == ir:
+        worklist.start_iteration()
+        worklist.apply(
+            "InlineIntoScan", lambda node: InlineIntoScan().visit(node, **worklist.visit_kwargs)
+        )
+        worklist.apply(
+            "InlineLambdas",
+            lambda node: InlineLambdas.apply(
+                node, opcount_preserving=True, force_inline_lift_args=True
+            ),
+        )
+        if not worklist.changed_in_iteration():
             break
-        ir = inlined
     else:
         raise RuntimeError(f"Inlining into scan did not converge with {max_iter} iterations.")
-    return ir
+    instrumentation.record_iterations("itir", "inline_into_scan", i + 1)
+    return worklist.to_node()
+
+
+def _inline_lifts_and_lambdas(ir, lift_mode, *, max_iter=10, statistics=None):
+    worklist = Worklist(ir, statistics)
+    for i in range(max_iter):
+        worklist.start_iteration()
+        worklist.apply(
+            "InlineLifts", lambda node: _inline_lifts(node, lift_mode, **worklist.visit_kwargs)
+        )
+        worklist.apply(
+            "InlineLambdas",
+            lambda node: InlineLambdas.apply(
+                node,
+                opcount_preserving=True,
+                force_inline_lift_args=(lift_mode == LiftMode.FORCE_INLINE),
+                # If trivial lifts are not inlined we might create temporaries for constants. In all
+                #  other cases we want it anyway.
+                force_inline_trivial_lift_args=True,
+            ),
+        )
+        worklist.apply("ConstantFolding", ConstantFolding.apply)
+        # This pass is required to be in the loop such that when an `if_` call with tuple arguments
+        # is constant-folded the surrounding tuple_get calls can be removed.
+        if worklist.changed_in_iteration():
+            worklist.apply("CollapseTuple", CollapseTuple.apply)
+        else:
+            # To limit number of times global type inference is executed, only in the last
+            # iterations. The items skipped so far are (potentially) collapsed further now.
+            node_types = type_inference.infer_all(worklist.to_node())
+            worklist.apply(
+                "CollapseTuple",
+                lambda node: CollapseTuple.apply(
+                    node, use_global_type_inference=True, node_types=node_types
+                ),
+                all_items=True,
+            )
+
+        if not worklist.changed_in_iteration():
+            break
+    else:
+        raise RuntimeError("Inlining lift and lambdas did not converge.")
+    instrumentation.record_iterations("itir", "inline_lifts_and_lambdas", i + 1)
+    return worklist.to_node()
+
+
+def _unroll_reduce(ir, lift_mode, offset_provider, *, max_iter=10, statistics=None):
+    worklist = Worklist(ir, statistics)
+    for i in range(max_iter):
+        worklist.start_iteration()
+        # One instance for all items to generate the same ids as in a visit of the whole node
+        unroll_reduce = UnrollReduce()
+        if not worklist.apply(
+            "UnrollReduce",
+            lambda node: unroll_reduce.visit(node, offset_provider=offset_provider),
+        ):
+            break
+        worklist.apply("CollapseListGet", CollapseListGet().visit)
+        worklist.apply("NormalizeShifts", NormalizeShifts().visit)
+        worklist.apply(
+            "InlineLifts", lambda node: _inline_lifts(node, lift_mode, **worklist.visit_kwargs)
+        )
+        worklist.apply("NormalizeShifts", NormalizeShifts().visit)
+    else:
+        raise RuntimeError("Reduction unrolling failed.")
+    instrumentation.record_iterations("itir", "unroll_reduce", i + 1)
+    return worklist.to_node()
 
 
 def apply_common_transforms(
@@ -80,86 +162,97 @@ def apply_common_transforms(
     unroll_reduce=False,
     common_subexpression_elimination=True,
     unconditionally_collapse_tuples=False,
+    max_iterations=10,
+    statistics: Optional[dict[str, LoopStatistics]] = None,
 ):
+    """
+    Apply the common ITIR transformations.
+
+    The fixed-point loops (inlining of lifts and lambdas, inlining into scans and unrolling
+    of reductions) only revisit the function definitions and stencil closures changed in
+    the previous iteration and raise an error if they do not converge within
+    `max_iterations`. If a `statistics` dictionary is given, it is filled with the
+    :class:`LoopStatistics` of each loop (keyed by the loop name).
+
+    All passes are recorded in the active :mod:`gt4py.eve.instrumentation` profile (if any).
+    """
     if lift_mode is None:
         lift_mode = LiftMode.FORCE_INLINE
     assert isinstance(lift_mode, LiftMode)
-    ir = MergeLet().visit(ir)
-    ir = InlineFundefs().visit(ir)
-    ir = PruneUnreferencedFundefs().visit(ir)
-    ir = PropagateDeref.apply(ir)
-    ir = NormalizeShifts().visit(ir)
-
-    for _ in range(10):
-        inlined = ir
-
-        inlined = _inline_lifts(inlined, lift_mode)
-
-        inlined = InlineLambdas.apply(
-            inlined,
-            opcount_preserving=True,
-            force_inline_lift_args=(lift_mode == LiftMode.FORCE_INLINE),
-            # If trivial lifts are not inlined we might create temporaries for constants. In all
-            #  other cases we want it anyway.
-            force_inline_trivial_lift_args=True,
-        )
-        inlined = ConstantFolding.apply(inlined)
-        # This pass is required to be in the loop such that when an `if_` call with tuple arguments
-        # is constant-folded the surrounding tuple_get calls can be removed.
-        inlined = CollapseTuple.apply(
-            inlined,
-            # to limit number of times global type inference is executed, only in the last iterations.
-            use_global_type_inference=inlined == ir,
-        )
+    if statistics is None:
+        statistics = {}
 
-        if inlined == ir:
-            break
-        ir = inlined
-    else:
-        raise RuntimeError("Inlining lift and lambdas did not converge.")
+    ir = _run_pass("MergeLet", MergeLet().visit, ir)
+    ir = _run_pass("InlineFundefs", InlineFundefs().visit, ir)
+    ir = _run_pass("PruneUnreferencedFundefs", PruneUnreferencedFundefs().visit, ir)
+    ir = _run_pass("PropagateDeref", PropagateDeref.apply, ir)
+    ir = _run_pass("NormalizeShifts", NormalizeShifts().visit, ir)
+
+    ir = _inline_lifts_and_lambdas(
+        ir,
+        lift_mode,
+        max_iter=max_iterations,
+        statistics=statistics.setdefault("inline_lifts_and_lambdas", LoopStatistics()),
+    )
 
     # Since `CollapseTuple` relies on the type inference which does not support returning tuples
     # larger than the number of closure outputs as given by the unconditional collapse, we can
     # only run the unconditional version here instead of in the loop above.
     if unconditionally_collapse_tuples:
-        ir = CollapseTuple.apply(ir, ignore_tuple_size=unconditionally_collapse_tuples)
+        ir = _run_pass(
+            "CollapseTuple",
+            lambda node: CollapseTuple.apply(
+                node, ignore_tuple_size=unconditionally_collapse_tuples
+            ),
+            ir,
+        )
 
     if lift_mode == LiftMode.FORCE_INLINE:
-        ir = _inline_into_scan(ir)
+        ir = _inline_into_scan(
+            ir,
+            max_iter=max_iterations,
+            statistics=statistics.setdefault("inline_into_scan", LoopStatistics()),
+        )
 
-    ir = NormalizeShifts().visit(ir)
+    ir = _run_pass("NormalizeShifts", NormalizeShifts().visit, ir)
 
-    ir = FuseMaps().visit(ir)
-    ir = CollapseListGet().visit(ir)
+    ir = _run_pass("FuseMaps", FuseMaps().visit, ir)
+    ir = _run_pass("CollapseListGet", CollapseListGet().visit, ir)
     if unroll_reduce:
-        for _ in range(10):
-            unrolled = UnrollReduce.apply(ir, offset_provider=offset_provider)
-            if unrolled == ir:
-                break
-            ir = unrolled
-            ir = CollapseListGet().visit(ir)
-            ir = NormalizeShifts().visit(ir)
-            ir = _inline_lifts(ir, lift_mode)
-            ir = NormalizeShifts().visit(ir)
-        else:
-            raise RuntimeError("Reduction unrolling failed.")
+        ir = _unroll_reduce(
+            ir,
+            lift_mode,
+            offset_provider,
+            max_iter=max_iterations,
+            statistics=statistics.setdefault("unroll_reduce", LoopStatistics()),
+        )
 
     if lift_mode != LiftMode.FORCE_INLINE:
         assert offset_provider is not None
-        ir = CreateGlobalTmps().visit(ir, offset_provider=offset_provider)
-        ir = InlineLifts().visit(ir)
+        ir = _run_pass(
+            "CreateGlobalTmps",
+            lambda node: CreateGlobalTmps().visit(node, offset_provider=offset_provider),
+            ir,
+        )
+        ir = _run_pass("InlineLifts", InlineLifts().visit, ir)
         # If after creating temporaries, the scan is not at the top, we inline.
         # The following example doesn't have a lift around the shift, i.e. temporary pass will not extract it.
         # λ(inp) → scan(λ(state, k, kp) → state + ·k + ·kp, True, 0.0)(inp, ⟪Koffₒ, 1ₒ⟫(inp))`
-        ir = _inline_into_scan(ir)
+        ir = _inline_into_scan(
+            ir,
+            max_iter=max_iterations,
+            statistics=statistics.setdefault("inline_into_scan", LoopStatistics()),
+        )
 
-    ir = EtaReduction().visit(ir)
-    ir = ScanEtaReduction().visit(ir)
+    ir = _run_pass("EtaReduction", EtaReduction().visit, ir)
+    ir = _run_pass("ScanEtaReduction", ScanEtaReduction().visit, ir)
 
     if common_subexpression_elimination:
-        ir = CommonSubexpressionElimination().visit(ir)
-        ir = MergeLet().visit(ir)
+        ir = _run_pass("CommonSubexpressionElimination", CommonSubexpressionElimination().visit, ir)
+        ir = _run_pass("MergeLet", MergeLet().visit, ir)
 
-    ir = InlineLambdas.apply(ir, opcount_preserving=True)
+    ir = _run_pass(
+        "InlineLambdas", lambda node: InlineLambdas.apply(node, opcount_preserving=True), ir
+    )
 
     return ir
@@ -0,0 +1,126 @@
+# GT4Py - GridTools Framework
+#
+# Copyright (c) 2014-2023, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import collections
+import dataclasses
+from collections.abc import Callable
+from typing import Any
+
+from gt4py.eve import instrumentation
+from gt4py.next.iterator import ir
+
+
+@dataclasses.dataclass
+class LoopStatistics:
+    """Counters of a fixed-point transformation loop (see :class:`Worklist`)."""
+
+    #: Number of (started) iterations.
+    iterations: int = 0
+    #: Number of items transformed by the passes.
+    visited: int = 0
+    #: Number of unchanged items skipped by the passes.
+    skipped: int = 0
+    #: Number of items changed by each pass.
+    changes: collections.Counter[str] = dataclasses.field(default_factory=collections.Counter)
+
+
+class Worklist:
+    """
+    Apply passes in a fixed-point loop only to the parts of a node which may still change.
+
+    A `FencilDefinition` is split into its function definitions and stencil closures,
+    which the passes transform independently of each other. Any other node is a single
+    item. Items which were not changed by any pass in the last iteration are fixed points
+    of the loop body and are skipped, unless a pass is explicitly applied to all items.
+
+    The passes are called with the same keyword arguments they would receive when visiting
+    the whole node (i.e. the symbol table of the fencil), so the result is identical to
+    transforming the whole node in every iteration.
+    """
+
+    node: ir.Node
+    items: list[ir.Node]
+    statistics: LoopStatistics
+    #: Keyword arguments to visit the items like in a visit of the whole node.
+    visit_kwargs: dict[str, Any]
+
+    _dirty: list[bool]
+    _changed: list[bool]
+    _iteration_start: list[ir.Node]
+
+    def __init__(self, node: ir.Node, statistics: LoopStatistics | None = None):
+        self.node = node
+        if isinstance(node, ir.FencilDefinition):
+            self.items = [*node.function_definitions, *node.closures]
+            self.visit_kwargs = {"symtable": collections.ChainMap(node.annex.symtable)}
+        else:
+            self.items = [node]
+            self.visit_kwargs = {}
+        self.statistics = statistics if statistics is not None else LoopStatistics()
+        self._dirty = [True] * len(self.items)
+        self._changed = [True] * len(self.items)
+        self._iteration_start = list(self.items)
+
+    def start_iteration(self) -> None:
+        """Start a new iteration; items unchanged in the last one are skipped from now on."""
+        self._dirty = [
+            dirty and changed for dirty, changed in zip(self._dirty, self._changed, strict=True)
+        ]
+        self._changed = [False] * len(self.items)
+        self._iteration_start = list(self.items)
+        self.statistics.iterations += 1
+
+    def apply(
+        self, name: str, transform: Callable[[ir.Node], ir.Node], *, all_items: bool = False
+    ) -> bool:
+        """Apply `transform` to all items which may change (or `all_items`) and report changes."""
+        any_changed = False
+        for i, item in enumerate(self.items):
+            if not (all_items or self._dirty[i]):
+                self.statistics.skipped += 1
+                continue
+            self.statistics.visited += 1
+            new_item = instrumentation.run_pass(
+                "itir", name, transform, item, iteration=self.statistics.iterations
+            )
+            if new_item != item:
+                self.items[i] = new_item
+                self._dirty[i] = self._changed[i] = any_changed = True
+                self.statistics.changes[name] += 1
+        return any_changed
+
+    def changed_in_iteration(self) -> bool:
+        """Check if the items differ from the ones at the start of the current iteration."""
+        return any(
+            item != start for item, start in zip(self.items, self._iteration_start, strict=True)
+        )
+
+    def to_node(self) -> ir.Node:
+        """Assemble the node from the current items."""
+        if not isinstance(self.node, ir.FencilDefinition):
+            return self.items[0]
+        num_fundefs = len(self.node.function_definitions)
+        if all(
+            new is old
+            for new, old in zip(
+                self.items, [*self.node.function_definitions, *self.node.closures], strict=True
+            )
+        ):
+            return self.node
+        return ir.FencilDefinition(
+            id=self.node.id,
+            function_definitions=self.items[:num_fundefs],
+            params=list(self.node.params),
+            closures=self.items[num_fundefs:],
+        )
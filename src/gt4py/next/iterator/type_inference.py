@@ -13,6 +13,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import dataclasses
+import functools
 import typing
 from collections import abc
 from typing import Optional
@@ -27,6 +28,7 @@ from gt4py.next.type_inference import Type, TypeVar, freshen, reindex_vars, unif
 """Constraint-based inference for the iterator IR."""
 
 T = typing.TypeVar("T", bound="Type")
+NodeT = typing.TypeVar("NodeT", bound=ir.Node)
 
 # list of nodes that have a type
 TYPED_IR_NODES: typing.Final = (
@@ -968,6 +970,51 @@ def _save_types_to_annex(node: ir.Node, types: dict[int, Type]) -> None:
                 )
 
 
+def _has_shared_nodes(node: ir.Node) -> bool:
+    seen: set[int] = set()
+    for child in node.pre_walk_values():
+        if not _is_typed_node_class(child.__class__):
+            continue
+        if id(child) in seen:
+            return True
+        seen.add(id(child))
+    return False
+
+
+@functools.cache
+def _is_typed_node_class(cls: type) -> bool:
+    return issubclass(cls, TYPED_IR_NODES)
+
+
+@dataclasses.dataclass
+class _UnsharedTree(eve.NodeTranslator):
+    """Copy of a tree where each node only occurs once, with the mapping to the original nodes."""
+
+    REUSE_UNCHANGED_NODES = False
+
+    nodes: dict[int, ir.Node] = dataclasses.field(default_factory=dict)
+    tree: Optional[ir.Node] = None
+
+    def visit(self, node: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        result = super().visit(node, **kwargs)
+        if isinstance(node, ir.Node):
+            self.nodes[id(result)] = node
+        return result
+
+
+def _unshare(node: ir.Node) -> _UnsharedTree:
+    unshared = _UnsharedTree()
+    unshared.tree = unshared.visit(node)
+    return unshared
+
+
+def unshared_copy(node: NodeT) -> NodeT:
+    """Return a copy of `node` where every node occurs once, e.g. to save types to the annex."""
+    result = _unshare(node).tree
+    assert isinstance(result, type(node))
+    return result
+
+
 def infer_all(
     node: ir.Node,
     *,
@@ -981,11 +1028,22 @@ def infer_all(
     The result is a dictionary mapping the (Python) id of child nodes to their type.
 
     The `save_to_annex` flag should only be used as a last resort when the  return dictionary is
-    not enough.
+    not enough. Since the type of a node depends on its position, the tree must not contain
+    shared nodes in this case (see :func:`unshared_copy`).
     """
+    # Subtrees shared by structural sharing (see `eve.NodeTranslator`) might be used in
+    # places requiring different types, so the inference runs on a copy of the tree where
+    # every occurrence is a separate node.
+    originals = _unshare(node) if _has_shared_nodes(node) else None
+    tree = node if originals is None else originals.tree
+    if save_to_annex and originals is not None:
+        raise ValueError(
+            "Types can not be saved to the annex of shared nodes, use 'unshared_copy()' first."
+        )
+
     # Collect preliminary types of all nodes and constraints on them
     inferrer = _TypeInferrer(offset_provider=offset_provider)
-    inferrer.visit(node)
+    inferrer.visit(tree)
 
     # Ensure dict order is pre-order of the tree
     collected_types = dict(reversed(inferrer.collected_types.items()))
@@ -1004,6 +1062,9 @@ def infer_all(
         id_: unified_type
         for id_, unified_type in zip(collected_types.keys(), unified_types, strict=True)
     }
+    if originals is not None:
+        # the type of the last occurrence is used for shared nodes
+        result = {id(originals.nodes[id_]): type_ for id_, type_ in result.items()}
 
     if save_to_annex:
         _save_types_to_annex(node, result)
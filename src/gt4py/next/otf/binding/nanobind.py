@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 from typing import Any, Sequence, TypeVar, Union
 
 import gt4py.eve as eve
@@ -67,6 +68,7 @@ class WrapperFunction(eve.Node):
     name: str
     parameters: Sequence[FunctionParameter]
     body: ReturnStmt
+    release_gil: bool = True
 
 
 class BindingFunction(eve.Node):
@@ -125,6 +127,7 @@ class BindingCodeGenerator(TemplatedGenerator):
             {{"\n,".join(parameters)}}
         )
         {
+            {% if _this_node.release_gil %}nanobind::gil_scoped_release release;{% endif %}
             {{body}}
         }\
         """
@@ -195,6 +198,8 @@ def make_argument(name: str, type_: ts.TypeSpec) -> str | BufferSID | CompositeS
 
 def create_bindings(
     program_source: stages.ProgramSource[SrcL, languages.LanguageWithHeaderFilesSettings],
+    *,
+    release_gil: bool = True,
 ) -> stages.BindingSource[SrcL, languages.Python]:
     """
     Generate Python bindings through which a C++ function can be called.
@@ -203,6 +208,8 @@ def create_bindings(
     ----------
     program_source
         The program source for which the bindings are created
+    release_gil
+        Release the GIL while the C++ function runs, so other Python threads can run concurrently
     """
     if program_source.language not in [languages.Cpp, languages.Cuda]:
         raise ValueError(
@@ -241,6 +248,7 @@ def create_bindings(
                     ],
                 )
             ),
+            release_gil=release_gil,
         ),
         binding_module=BindingModule(
             name=program_source.entry_point.name,
@@ -266,8 +274,29 @@ def create_bindings(
     )
 
 
-@workflow.make_step
-def bind_source(
-    inp: stages.ProgramSource[SrcL, languages.LanguageWithHeaderFilesSettings],
-) -> stages.CompilableSource[SrcL, languages.LanguageWithHeaderFilesSettings, languages.Python]:
-    return stages.CompilableSource(program_source=inp, binding_source=create_bindings(inp))
+@dataclasses.dataclass(frozen=True)
+class BindSource(
+    workflow.ChainableWorkflowMixin[
+        stages.ProgramSource[SrcL, languages.LanguageWithHeaderFilesSettings],
+        stages.CompilableSource[SrcL, languages.LanguageWithHeaderFilesSettings, languages.Python],
+    ],
+    workflow.ReplaceEnabledWorkflowMixin[
+        stages.ProgramSource[SrcL, languages.LanguageWithHeaderFilesSettings],
+        stages.CompilableSource[SrcL, languages.LanguageWithHeaderFilesSettings, languages.Python],
+    ],
+):
+    """Create nanobind bindings for a program source (ProgramSource -> CompilableSource)."""
+
+    release_gil: bool = True
+
+    def __call__(
+        self,
+        inp: stages.ProgramSource[SrcL, languages.LanguageWithHeaderFilesSettings],
+    ) -> stages.CompilableSource[SrcL, languages.LanguageWithHeaderFilesSettings, languages.Python]:
+        return stages.CompilableSource(
+            program_source=inp,
+            binding_source=create_bindings(inp, release_gil=self.release_gil),
+        )
+
+
+bind_source: BindSource = BindSource()
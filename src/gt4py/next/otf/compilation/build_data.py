@@ -17,7 +17,9 @@ from __future__ import annotations
 import dataclasses
 import enum
 import json
+import os
 import pathlib
+import tempfile
 from typing import Final, Optional
 
 
@@ -82,12 +84,20 @@ def contains_data(path: pathlib.Path) -> bool:
 def read_data(path: pathlib.Path) -> Optional[BuildData]:
     try:
         return BuildData.from_json(json.loads((path / _DATAFILE_NAME).read_text()))
-    except FileNotFoundError:
+    except (FileNotFoundError, json.JSONDecodeError, KeyError, AttributeError):
         return None
 
 
 def write_data(data: BuildData, path: pathlib.Path) -> None:
-    (path / _DATAFILE_NAME).write_text(json.dumps(data.to_json()))
+    # publish atomically, so concurrent readers never see a partially written file
+    fd, tmp_path = tempfile.mkstemp(dir=path, prefix=f".{_DATAFILE_NAME}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps(data.to_json()))
+        os.replace(tmp_path, path / _DATAFILE_NAME)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 
 def update_status(new_status: BuildStatus, path: pathlib.Path) -> None:
@@ -73,15 +73,23 @@ class CompiledbFactory(
             language_settings=source.program_source.language_settings,
         )
 
-        if self.renew_compiledb or not (
-            compiledb_template := _cc_find_compiledb(cc_prototype_program_source, cache_strategy)
-        ):
-            compiledb_template = _cc_create_compiledb(
-                cc_prototype_program_source,
-                build_type=self.cmake_build_type,
-                cmake_flags=self.cmake_extra_flags or [],
-                cache_strategy=cache_strategy,
+        # the template is shared by all programs, concurrent processes must not create it twice
+        with cache.lock(
+            cache.get_cache_folder(
+                stages.CompilableSource(cc_prototype_program_source, None), cache_strategy
             )
+        ):
+            if self.renew_compiledb or not (
+                compiledb_template := _cc_find_compiledb(
+                    cc_prototype_program_source, cache_strategy
+                )
+            ):
+                compiledb_template = _cc_create_compiledb(
+                    cc_prototype_program_source,
+                    build_type=self.cmake_build_type,
+                    cmake_flags=self.cmake_extra_flags or [],
+                    cache_strategy=cache_strategy,
+                )
 
         return CompiledbProject(
             root_path=cache.get_cache_folder(source, cache_strategy),
@@ -321,5 +329,7 @@ def _cc_create_compiledb(
         )
 
     compile_db_path = cache_path / "compile_commands.json"
-    compile_db_path.write_text(json.dumps(compile_db))
+    tmp_compile_db_path = cache_path / "compile_commands.json.tmp"
+    tmp_compile_db_path.write_text(json.dumps(compile_db))
+    tmp_compile_db_path.replace(compile_db_path)
     return compile_db_path
@@ -12,16 +12,40 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-"""Caching for compiled backend artifacts."""
+"""
+Caching for compiled backend artifacts.
 
+The persistent cache (in `build` inside :data:`gt4py.next.config.CACHE_DIR`) can be
+shared by concurrent processes: builds of the same program are serialized with a lock
+file next to the cache folder (see :func:`lock`), and the build status is published
+atomically (see :mod:`build_data`), so other processes only use complete builds.
+"""
 
+from __future__ import annotations
+
+import contextlib
+import dataclasses
 import enum
 import hashlib
+import os
 import pathlib
+import shutil
 import tempfile
+import time
+import uuid
+from typing import Iterator, Optional, Sequence
 
+from gt4py.next import config
 from gt4py.next.otf import stages
 from gt4py.next.otf.binding import interface
+from gt4py.next.otf.compilation import build_data
+
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
 
 
 class Strategy(enum.Enum):
@@ -32,7 +56,13 @@ class Strategy(enum.Enum):
 _session_cache_dir = tempfile.TemporaryDirectory(prefix="gt4py_session_")
 
 _session_cache_dir_path = pathlib.Path(_session_cache_dir.name)
-_persistent_cache_dir_path = pathlib.Path(tempfile.gettempdir()) / "gt4py_cache"
+
+#: Prefix of the (shared) CMake configuration folders used by the compiledb build system.
+_COMPILEDB_PREFIX = "compile_commands_cache"
+
+
+def _persistent_cache_dir_path() -> pathlib.Path:
+    return config.CACHE_DIR / "build"
 
 
 def _serialize_param(parameter: interface.Parameter) -> str:
@@ -73,17 +103,172 @@ def get_cache_folder(
     # TODO(ricoh): make dependent on binding source too or add alternative that depends on bindings
     folder_name = _cache_folder_name(compilable_source.program_source)
 
+    base_path = get_cache_root(strategy)
+    base_path.mkdir(parents=True, exist_ok=True)
+
+    complete_path = base_path / folder_name
+    complete_path.mkdir(exist_ok=True)
+    if strategy == Strategy.PERSISTENT:
+        os.utime(complete_path)  # mark as recently used for the eviction
+
+    return complete_path
+
+
+def get_cache_root(strategy: Strategy) -> pathlib.Path:
     match strategy:
         case Strategy.SESSION:
-            base_path = _session_cache_dir_path
+            return _session_cache_dir_path
         case Strategy.PERSISTENT:
-            base_path = _persistent_cache_dir_path
+            return _persistent_cache_dir_path()
         case _:
             raise ValueError("Unsupported caching strategy.")
 
-    base_path.mkdir(exist_ok=True)
 
-    complete_path = base_path / folder_name
-    complete_path.mkdir(exist_ok=True)
+def _lock_path(path: pathlib.Path) -> pathlib.Path:
+    return path.parent / f".{path.name}.lock"
 
-    return complete_path
+
+def _is_current_lock_file(fd: int, lock_path: pathlib.Path) -> bool:
+    try:
+        current = os.stat(lock_path)
+    except FileNotFoundError:
+        return False
+    locked = os.fstat(fd)
+    return (locked.st_dev, locked.st_ino) == (current.st_dev, current.st_ino)
+
+
+@contextlib.contextmanager
+def lock(path: pathlib.Path, *, blocking: bool = True) -> Iterator[bool]:
+    """
+    Hold an exclusive inter-process lock on the cache folder `path` within the context.
+
+    The lock file is kept next to the folder, so the folder itself can be removed while
+    locked. If `blocking` is `False`, the context value tells if the lock was acquired.
+    """
+    lock_path = _lock_path(path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    while True:
+        with open(lock_path, "a+b") as lock_file:
+            fd = lock_file.fileno()
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+            except OSError:
+                if blocking:
+                    raise
+                yield False
+                return
+            try:
+                # the lock file is removed together with an evicted entry (see `remove_entry`),
+                # so a lock acquired on the removed file has to be taken again on the new one
+                if not _is_current_lock_file(fd, lock_path):
+                    continue
+                yield True
+                return
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheEntry:
+    """A program build (or a shared build configuration) in the persistent cache."""
+
+    path: pathlib.Path
+    size: int
+    last_used: float
+    status: Optional[build_data.BuildStatus]
+
+    @property
+    def is_shared(self) -> bool:
+        return self.path.name.startswith(_COMPILEDB_PREFIX)
+
+
+def _folder_size(path: pathlib.Path) -> int:
+    size = 0
+    for folder, _, files in os.walk(path):
+        for name in files:
+            with contextlib.suppress(OSError):
+                size += os.lstat(os.path.join(folder, name)).st_size
+    return size
+
+
+def list_entries(root: Optional[pathlib.Path] = None) -> list[CacheEntry]:
+    """List the entries of the persistent cache, least recently used first."""
+    root = root or get_cache_root(Strategy.PERSISTENT)
+    if not root.is_dir():
+        return []
+
+    entries = []
+    for path in root.iterdir():
+        if path.name.startswith(".") or not path.is_dir():
+            continue
+        with contextlib.suppress(OSError):  # removed in the meantime
+            data = build_data.read_data(path)
+            entries.append(
+                CacheEntry(
+                    path=path,
+                    size=_folder_size(path),
+                    last_used=path.stat().st_mtime,
+                    status=data.status if data else None,
+                )
+            )
+    return sorted(entries, key=lambda entry: entry.last_used)
+
+
+def remove_entry(entry: CacheEntry) -> bool:
+    """
+    Remove an entry unless it is locked by a running build.
+
+    The folder is first renamed, so other processes never see a partially removed build.
+    The lock file of the entry is removed as well.
+    """
+    with lock(entry.path, blocking=False) as acquired:
+        if not acquired:
+            return False
+        trash_path = entry.path.parent / f".trash_{entry.path.name}_{uuid.uuid4().hex}"
+        try:
+            entry.path.rename(trash_path)
+        except OSError:
+            return False
+        with contextlib.suppress(OSError):  # open lock files can not be removed on Windows
+            _lock_path(entry.path).unlink()
+    shutil.rmtree(trash_path, ignore_errors=True)
+    return True
+
+
+def prune(
+    max_size: int,
+    *,
+    root: Optional[pathlib.Path] = None,
+    keep: Sequence[pathlib.Path] = (),
+    min_age: float = 0.0,
+    dry_run: bool = False,
+) -> list[CacheEntry]:
+    """
+    Evict least recently used entries until the persistent cache is not larger than `max_size`.
+
+    Entries in `keep`, entries used less than `min_age` seconds ago, locked entries and
+    the shared build configurations of the compiledb build system (which are needed by
+    concurrent builds) are never evicted. Return the list of removed entries (or of the
+    entries which would be removed if `dry_run` is set).
+    """
+    entries = list_entries(root)
+    total_size = sum(entry.size for entry in entries)
+    keep = {pathlib.Path(path) for path in keep}
+    now = time.time()
+    removed = []
+    for entry in entries:
+        if total_size <= max_size:
+            break
+        if entry.is_shared or entry.path in keep or now - entry.last_used < min_age:
+            continue
+        if dry_run or remove_entry(entry):
+            total_size -= entry.size
+            removed.append(entry)
+    return removed
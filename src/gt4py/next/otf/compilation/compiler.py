@@ -18,6 +18,7 @@ import dataclasses
 import pathlib
 from typing import Protocol, TypeVar
 
+from gt4py.next import config
 from gt4py.next.otf import languages, stages, step_types, workflow
 from gt4py.next.otf.compilation import build_data, cache, importer
 from gt4py.next.otf.step_types import LS, SrcL, TgtL
@@ -74,7 +75,17 @@ class Compiler(
         data = build_data.read_data(src_dir)
 
         if not data or not is_compiled(data) or self.force_recompile:
-            self.builder_factory(inp, self.cache_strategy).build()
+            # only one process builds, the others wait and reuse the result
+            with cache.lock(src_dir):
+                data = build_data.read_data(src_dir)
+                if not data or not is_compiled(data) or self.force_recompile:
+                    self.builder_factory(inp, self.cache_strategy).build()
+            if self.cache_strategy == cache.Strategy.PERSISTENT and config.BUILD_CACHE_MAX_SIZE:
+                cache.prune(
+                    config.BUILD_CACHE_MAX_SIZE,
+                    keep=[src_dir],
+                    min_age=config.BUILD_CACHE_MIN_AGE,
+                )
 
         new_data = build_data.read_data(src_dir)
 
@@ -0,0 +1,89 @@
+# GT4Py - GridTools Framework
+#
+# Copyright (c) 2014-2023, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Persistent on-disk cache for the intermediate representations of the toolchain.
+
+Entries are pickled and stored in a subfolder of :data:`gt4py.next.config.CACHE_DIR`
+under a key computed with :func:`make_key`, which always covers the `gt4py` version.
+The cache is only used if :data:`gt4py.next.config.PERSISTENT_IR_CACHE` is enabled.
+"""
+
+from __future__ import annotations
+
+import os
+import pathlib
+import pickle
+import sys
+import tempfile
+from typing import Any, Callable, Optional, TypeVar
+
+import gt4py
+from gt4py.eve.utils import content_hash
+from gt4py.next import config
+
+
+_T = TypeVar("_T")
+
+#: Version of the layout of the cache entries, bump on incompatible changes.
+_CACHE_FORMAT_VERSION = 1
+
+
+def cache_dir() -> pathlib.Path:
+    return config.CACHE_DIR / "ir_cache"
+
+
+def make_key(*parts: Any) -> str:
+    """Compute a stable cache key from picklable `parts`, the Python and the `gt4py` versions."""
+    return content_hash(_CACHE_FORMAT_VERSION, gt4py.__version__, sys.version_info[:2], *parts)
+
+
+def load(key: str) -> Optional[Any]:
+    """Return the value cached under `key` or `None` if missing or unreadable."""
+    try:
+        with open(cache_dir() / f"{key}.pkl", "rb") as f:
+            return pickle.load(f)
+    except Exception:  # a broken entry is just a cache miss
+        return None
+
+
+def store(key: str, value: Any) -> None:
+    """Store `value` under `key`, silently ignoring values or folders which are not usable."""
+    try:
+        data = pickle.dumps(value)
+        folder = cache_dir()
+        folder.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first, so concurrent readers never see partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=f".{key}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, folder / f"{key}.pkl")
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):
+        pass
+
+
+def cached(key: Optional[str], compute: Callable[[], _T]) -> _T:
+    """Load the value for `key` from the cache or `compute` and store it (if `key` is not `None`)."""
+    if key is None or not config.PERSISTENT_IR_CACHE:
+        return compute()
+
+    value = load(key)
+    if value is None:
+        value = compute()
+        store(key, value)
+    return value
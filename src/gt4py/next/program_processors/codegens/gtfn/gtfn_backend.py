@@ -17,7 +17,10 @@ from typing import Any
 import gt4py.next.iterator.ir as itir
 from gt4py.eve import codegen
 from gt4py.eve.exceptions import EveValueError
-from gt4py.next.iterator.transforms.pass_manager import apply_common_transforms
+from gt4py.next import config
+from gt4py.next.iterator.embedded import offset_provider_fingerprint
+from gt4py.next.iterator.transforms.pass_manager import LiftMode, apply_common_transforms
+from gt4py.next.otf import ir_cache
 from gt4py.next.program_processors.codegens.gtfn.codegen import GTFNCodegen, GTFNIMCodegen
 from gt4py.next.program_processors.codegens.gtfn.gtfn_ir_to_gtfn_im_ir import GTFN_IM_lowering
 from gt4py.next.program_processors.codegens.gtfn.itir_to_gtfn_ir import GTFN_lowering
@@ -29,12 +32,30 @@ def _lower(
     offset_provider = kwargs.get("offset_provider")
     assert isinstance(offset_provider, dict)
     if enable_itir_transforms:
-        program = apply_common_transforms(
-            program,
-            lift_mode=kwargs.get("lift_mode"),
-            offset_provider=offset_provider,
-            unroll_reduce=do_unroll,
-            unconditionally_collapse_tuples=True,  # sid::composite (via hymap) supports assigning from tuple with more elements to tuple with fewer elements
+        transforms_cache_key = (
+            ir_cache.make_key(
+                "gtfn",
+                itir.fingerprint(program),
+                kwargs.get("lift_mode"),
+                do_unroll,
+                offset_provider_fingerprint(
+                    offset_provider,
+                    # the sizes of temporaries are derived from the neighbor tables
+                    with_domain_sizes=kwargs.get("lift_mode") not in (None, LiftMode.FORCE_INLINE),
+                ),
+            )
+            if config.PERSISTENT_IR_CACHE
+            else None
+        )
+        program = ir_cache.cached(
+            transforms_cache_key,
+            lambda: apply_common_transforms(
+                program,
+                lift_mode=kwargs.get("lift_mode"),
+                offset_provider=offset_provider,
+                unroll_reduce=do_unroll,
+                unconditionally_collapse_tuples=True,  # sid::composite (via hymap) supports assigning from tuple with more elements to tuple with fewer elements
+            ),
         )
     gtfn_ir = GTFN_lowering.apply(
         program,
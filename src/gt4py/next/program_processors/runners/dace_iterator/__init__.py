@@ -23,7 +23,7 @@ import gt4py.next.allocators as next_allocators
 import gt4py.next.iterator.ir as itir
 import gt4py.next.program_processors.otf_compile_executor as otf_exec
 from gt4py.next.common import Dimension, Domain, UnitRange, is_field
-from gt4py.next.iterator.embedded import NeighborTableOffsetProvider, StridedNeighborOffsetProvider
+from gt4py.next.iterator.embedded import NeighborTableOffsetProvider, offset_provider_fingerprint
 from gt4py.next.iterator.transforms import LiftMode, apply_common_transforms
 from gt4py.next.otf.compilation import cache
 from gt4py.next.program_processors.processor_interface import program_executor
@@ -147,18 +147,18 @@ def get_cache_id(
     column_axis: Optional[Dimension],
     offset_provider: Mapping[str, Any],
 ) -> str:
-    max_neighbors = [
-        (k, v.max_neighbors)
-        for k, v in offset_provider.items()
-        if isinstance(v, (NeighborTableOffsetProvider, StridedNeighborOffsetProvider))
+    connectivities = [
+        (k, v)
+        for k, v in offset_provider_fingerprint(offset_provider)
+        if not isinstance(v, Dimension)
     ]
     cache_id_args = [
         str(arg)
         for arg in (
-            program,
+            itir.fingerprint(program),
             *arg_types,
             column_axis,
-            *max_neighbors,
+            *connectivities,
         )
     ]
     m = hashlib.sha256()
@@ -22,6 +22,7 @@ import gt4py._core.definitions as core_defs
 import gt4py.next.allocators as next_allocators
 from gt4py.eve.utils import content_hash
 from gt4py.next import common
+from gt4py.next.iterator import embedded, ir as itir
 from gt4py.next.iterator.transforms import LiftMode
 from gt4py.next.otf import languages, recipes, stages, step_types, workflow
 from gt4py.next.otf.binding import nanobind
@@ -101,14 +102,22 @@ def extract_connectivity_args(
 def compilation_hash(otf_closure: stages.ProgramCall) -> int:
     """Given closure compute a hash uniquely determining if we need to recompile."""
     offset_provider = otf_closure.kwargs["offset_provider"]
+    lift_mode = otf_closure.kwargs.get("lift_mode", None)
     return hash(
         (
-            otf_closure.program,
+            itir.fingerprint(otf_closure.program),
             # As the frontend types contain lists they are not hashable. As a workaround we just
             # use content_hash here.
             content_hash(tuple(from_value(arg) for arg in otf_closure.args)),
-            id(offset_provider) if offset_provider else None,
+            embedded.offset_provider_fingerprint(
+                offset_provider,
+                # the sizes of temporaries are derived from the neighbor tables
+                with_domain_sizes=lift_mode not in (None, LiftMode.FORCE_INLINE),
+            )
+            if offset_provider
+            else None,
             otf_closure.kwargs.get("column_axis", None),
+            lift_mode,
         )
     )
 
@@ -43,6 +43,8 @@ def _create_tmp(axes, origin, shape, dtype):
 
 
 class EmbeddedDSL(codegen.TemplatedGenerator):
+    MEMOIZE_RENDERS = True
+
     Sym = as_fmt("{id}")
     SymRef = as_fmt("{id}")
     Literal = as_fmt("{value}")
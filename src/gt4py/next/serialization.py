@@ -0,0 +1,118 @@
+# GT4Py - GridTools Framework
+#
+# Copyright (c) 2014-2023, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Binary files of fields, preserving their domain and the memory layout of their buffers."""
+
+from __future__ import annotations
+
+import os
+from typing import Optional, Union
+
+import gt4py._core.definitions as core_defs
+import gt4py.next.allocators as next_allocators
+import gt4py.next.common as common
+import gt4py.next.embedded.nd_array_field as nd_array_field
+import gt4py.storage.serialization as storage_serialization
+
+
+def save_field(path: Union[str, os.PathLike], field: common.Field, *, num_threads: int = 1) -> None:
+    """
+    Save a field to a binary file, preserving its domain and the memory layout of its buffer.
+
+    The file format is described in :mod:`gt4py.storage.serialization`.
+
+    Arguments:
+        path: Path of the file (overwritten if it exists).
+        field: The field to save.
+
+    Keyword Arguments:
+        num_threads: Number of threads writing chunks of large fields in parallel
+            (0 for as many as OpenMP would use).
+    """
+    storage_serialization.write(
+        path,
+        field.ndarray,
+        dims=tuple(dim.value for dim in field.domain.dims),
+        origin=tuple(-r.start for r in field.domain.ranges),
+        metadata={
+            "domain": [[dim.value, dim.kind.value, r.start, r.stop] for dim, r in field.domain]
+        },
+        num_threads=num_threads,
+    )
+
+
+def load_field(
+    path: Union[str, os.PathLike],
+    *,
+    allocator: Optional[next_allocators.FieldBufferAllocationUtil] = None,
+    device: Optional[core_defs.Device] = None,
+    mmap_mode: Optional[storage_serialization.MMapLoadMode] = None,
+    num_threads: int = 1,
+) -> nd_array_field.NdArrayField:
+    """
+    Load a field saved by :func:`save_field`.
+
+    Without `allocator` and `device`, the field is read into a buffer with the strides and
+    alignment of the saved field.
+
+    Arguments:
+        path: Path of the file.
+
+    Keyword Arguments:
+        allocator: The allocator or allocator factory (e.g. backend) used to allocate the
+            buffer of the field. The data is read directly into the buffer if it has the
+            layout of the saved field, otherwise it is copied.
+        device: The device to allocate the buffer on with the default allocator.
+        mmap_mode: Memory-map the field in the file instead of reading it, read-only (`"r"`),
+            read-write (`"r+"`) or copy-on-write (`"c"`).
+        num_threads: Number of threads reading chunks of large fields in parallel
+            (0 for as many as OpenMP would use).
+
+    Returns:
+        The field, with the domain of the saved field.
+
+    Raises:
+        ValueError
+            If illegal or inconsistent arguments are specified or the file is not valid.
+    """
+    if mmap_mode is not None and (allocator is not None or device is not None):
+        raise ValueError(
+            "Argument 'mmap_mode' is mutually exclusive with 'allocator' and 'device'."
+        )
+
+    header = storage_serialization.read_header(path)
+    if "domain" not in header.metadata:
+        raise ValueError(f"File '{path}' does not contain a field.")
+    domain = common.domain(
+        {
+            common.Dimension(name, common.DimensionKind(kind)): (start, stop)
+            for name, kind, start, stop in header.metadata["domain"]
+        }
+    )
+
+    if mmap_mode is not None:
+        ndarray = storage_serialization.memory_map(path, mmap_mode)[1]
+    elif allocator is not None or device is not None:
+        buffer = next_allocators.allocate(
+            domain, core_defs.dtype(header.dtype.type), allocator=allocator, device=device
+        )
+        ndarray = storage_serialization.read(
+            path, buffer.ndarray, overwrite_padding=True, num_threads=num_threads
+        )[1]
+    else:
+        ndarray = storage_serialization.read(path, num_threads=num_threads)[1]
+
+    res = common.field(ndarray, domain=domain)
+    assert isinstance(res, nd_array_field.NdArrayField)
+    return res
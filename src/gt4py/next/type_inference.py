@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import functools
 import typing
 from collections import abc
 
@@ -76,21 +77,46 @@ class TypeVar(Type):
         return cls(idx=cls.fresh_index(), **kwargs)
 
 
-class _TypeVarReindexer(eve.NodeTranslator):
-    """Reindex type variables in a type tree."""
+@functools.cache
+def _is_subclass(cls: type, base: type) -> bool:
+    # `isinstance` checks on eve nodes go through `typing._ProtocolMeta` and are slow
+    return issubclass(cls, base)
+
+
+class _TypeVarReindexer:
+    """Reindex type variables in type trees (and lists or tuples of them).
+
+    Subtrees shared by several types (as created by the unification) are only reindexed once.
+    The field types of the rebuilt types are not validated again (by the callers), as they
+    only consist of already validated types. The validation is only switched off in the
+    current context, so types created concurrently by other threads are still validated.
+    """
 
     def __init__(self, indexer: abc.Callable[[dict[int, int]], int]):
-        super().__init__()
         self.indexer = indexer
+        self.index_map = dict[int, int]()
+        self._memo = dict[int, Type]()
+
+    def visit(self, value: typing.Any) -> typing.Any:
+        if isinstance(value, (list, tuple)):
+            return value.__class__(self.visit(item) for item in value)
+        if not _is_subclass(value.__class__, Type):
+            return value
+        if id(value) in self._memo:
+            return self._memo[id(value)]
 
-    def visit_TypeVar(self, node: V, *, index_map: dict[int, int]) -> V:
-        node = self.generic_visit(node, index_map=index_map)
-        new_index = index_map.setdefault(node.idx, self.indexer(index_map))
         new_values = {
-            typing.cast(str, k): (new_index if k == "idx" else v)
-            for k, v in node.iter_children_items()
+            typing.cast(str, k): (v if k == "idx" else self.visit(v))
+            for k, v in value.iter_children_items()
         }
-        return node.__class__(**new_values)
+        if _is_subclass(value.__class__, TypeVar):
+            if value.idx not in self.index_map:
+                self.index_map[value.idx] = self.indexer(self.index_map)
+            new_values["idx"] = self.index_map[value.idx]
+        changed = any(new_values[k] is not v for k, v in value.iter_children_items())
+        result = value.__class__(**new_values) if changed else value
+        self._memo[id(value)] = result
+        return result
 
 
 @typing.overload
@@ -112,8 +138,9 @@ def freshen(dtypes: list[T] | T) -> list[T] | T:
     def indexer(index_map: dict[int, int]) -> int:
         return TypeVar.fresh_index()
 
-    index_map = dict[int, int]()
-    return [_TypeVarReindexer(indexer).visit(dtype, index_map=index_map) for dtype in dtypes]
+    reindexer = _TypeVarReindexer(indexer)
+    with datamodels.validation_settings(field_types=False):
+        return [reindexer.visit(dtype) for dtype in dtypes]
 
 
 def reindex_vars(dtypes: typing.Any) -> typing.Any:
@@ -122,198 +149,124 @@ def reindex_vars(dtypes: typing.Any) -> typing.Any:
     def indexer(index_map: dict[int, int]) -> int:
         return len(index_map)
 
-    index_map = dict[int, int]()
-    return _TypeVarReindexer(indexer).visit(dtypes, index_map=index_map)
-
-
-class _FreeVariables(eve.NodeVisitor):
-    """Collect type variables within a type expression."""
-
-    def visit_TypeVar(self, node: TypeVar, *, free_variables: set[TypeVar]) -> None:
-        self.generic_visit(node, free_variables=free_variables)
-        free_variables.add(node)
-
-
-def _free_variables(x: Type) -> set[TypeVar]:
-    """Collect type variables within a type expression."""
-    fv = set[TypeVar]()
-    _FreeVariables().visit(x, free_variables=fv)
-    return fv
-
-
-class _Dedup(eve.NodeTranslator):
-    """Deduplicate type nodes that have the same value but a different `id`."""
+    with datamodels.validation_settings(field_types=False):
+        return _TypeVarReindexer(indexer).visit(dtypes)
 
-    def visit(self, node, *, memo: dict[T, T]) -> typing.Any:  # type: ignore[override]
-        if isinstance(node, Type):
-            node = super().visit(node, memo=memo)
-            return memo.setdefault(node, node)
-        return node
 
-
-def _assert_constituent_types(value: typing.Any, allowed_types: tuple[type, ...]) -> None:
-    if isinstance(value, tuple):
-        for el in value:
-            _assert_constituent_types(el, allowed_types)
-    else:
-        assert isinstance(value, allowed_types)
-
-
-class _Renamer:
-    """Efficiently rename (that is, replace) nodes in a type expression.
-
-    Works by collecting all parent nodes of all nodes in a tree. If a node should be replaced by
-    another, all referencing parent nodes can be found efficiently and modified in place.
-
-    Note that all types have to be registered before they can be used in a `rename` call.
-
-    Besides basic renaming, this also resolves `ValTuple` to full `Tuple` if possible after
-    renaming.
+class _Unifier:
+    """A type unifier based on union-find (disjoint sets) of type variables.
+
+    Each type variable is bound either to another variable of the same equivalence class or,
+    for the representative of the class, to the concrete type the class was unified with. The
+    bindings are looked up lazily (with path compression) instead of substituting them into all
+    pending constraints like the classical unifier (Robinson, 1971), which keeps unification
+    almost linear in the size of the constraints. Types are only rebuilt once at the end
+    (without validating their field types again, see `_TypeVarReindexer`) and for the arguments
+    of custom constraint handlers.
     """
 
     def __init__(self) -> None:
-        self._parents = dict[Type, list[tuple[Type, str]]]()
-
-    def register(self, dtype: Type) -> None:
-        """Register a type for possible future renaming.
+        self._bindings = dict[int, Type]()
+        self._ranks = dict[int, int]()
 
-        Collects the parent nodes of all nodes in the type tree.
-        """
-
-        def collect_parents(node: Type) -> None:
-            for field, child in node.iter_children_items():
-                if isinstance(child, Type):
-                    self._parents.setdefault(child, []).append((node, typing.cast(str, field)))
-                    collect_parents(child)
-                else:
-                    _assert_constituent_types(child, (int, str))
-
-        collect_parents(dtype)
-
-    def _update_node(self, node: Type, field: str, replacement: Type) -> None:
-        """Replace a field of a node by some other value.
-
-        Basically performs `setattr(node, field, replacement)`. Further, updates the mapping of node
-        parents and handles the possibly changing hash value of the updated node.
-        """
-        # Pop the node out of the parents dict as its hash could change after modification
-        popped = self._parents.pop(node, None)
-
-        # Update the node’s field
-        setattr(node, field, replacement)
-
-        # Register `node` to be the new parent of `replacement`
-        self._parents.setdefault(replacement, []).append((node, field))
-
-        # Put back possible previous entries to the parents dict after possible hash change
-        if popped:
-            self._parents[node] = popped
-
-    def rename(self, node: Type, replacement: Type) -> None:
-        """Rename/replace all occurrences of `node` to/by `replacement`."""
-        try:
-            # Find parent nodes
-            nodes = self._parents.pop(node)
-        except KeyError:
-            return
-
-        for node, field in nodes:
-            # Default case: just update a field value of the node
-            self._update_node(node, field, replacement)
-
-
-class _Box(Type):
-    """Simple value holder, used for wrapping root nodes of a type tree.
-
-    This makes sure that all root nodes have a parent node which can be updated by the `_Renamer`.
-    """
-
-    value: Type
-
-
-class _Unifier:
-    """A classical type unifier (Robinson, 1971).
-
-    Computes the most general type satisfying all given constraints. Uses a `_Renamer` for efficient
-    type variable renaming.
-    """
-
-    def __init__(self, dtypes: list[Type], constraints: set[tuple[Type, Type]]) -> None:
-        # Wrap the original `dtype` and all `constraints` to make sure they have a parent node and
-        # thus the root nodes are correctly handled by the renamer
-        self._dtypes = [_Box(value=dtype) for dtype in dtypes]
-        self._constraints = [(_Box(value=s), _Box(value=t)) for s, t in constraints]
-
-        # Create a renamer and register `dtype` and all `constraints` types
-        self._renamer = _Renamer()
-        for dtype in self._dtypes:
-            self._renamer.register(dtype)
-        for s, t in self._constraints:
-            self._renamer.register(s)
-            self._renamer.register(t)
-
-    def unify(self) -> tuple[list[Type] | Type, list[tuple[Type, Type]]]:
+    def unify(
+        self, dtypes: list[Type], constraints: abc.Iterable[tuple[Type, Type]]
+    ) -> tuple[list[Type], list[tuple[Type, Type]]]:
         """Run the unification."""
-        unsatisfiable_constraints = []
-        while self._constraints:
-            constraint = self._constraints.pop()
+        pending = list(constraints)
+        failed = []
+        while pending:
+            constraint = pending.pop()
+            s, t = (self._find(c) for c in constraint)
             try:
-                handled = self._handle_constraint(constraint)
+                handled = self._handle_constraint(s, t, pending)
                 if not handled:
                     # Try with swapped LHS and RHS
-                    handled = self._handle_constraint(constraint[::-1])
+                    handled = self._handle_constraint(t, s, pending)
             except TypeError:
                 # custom constraint handler raised an error as constraint is not satisfiable
                 # (contrary to just not handled)
                 handled = False
 
             if not handled:
-                unsatisfiable_constraints.append((constraint[0].value, constraint[1].value))
-
-        unboxed_dtypes = [dtype.value for dtype in self._dtypes]
-
-        return unboxed_dtypes, unsatisfiable_constraints
-
-    def _rename(self, x: Type, y: Type) -> None:
-        """Type renaming/replacement."""
-        self._renamer.register(x)
-        self._renamer.register(y)
-        self._renamer.rename(x, y)
-
-    def _add_constraint(self, x: Type, y: Type) -> None:
-        """Register a new constraint."""
-        x = _Box(value=x)
-        y = _Box(value=y)
-        self._renamer.register(x)
-        self._renamer.register(y)
-        self._constraints.append((x, y))
-
-    def _handle_constraint(self, constraint: tuple[_Box, _Box]) -> bool:
-        """Handle a single constraint."""
-        s, t = (c.value for c in constraint)
-        if s == t:
-            # Constraint is satisfied if LHS equals RHS
+                failed.append(constraint)
+
+        memo = dict[int, typing.Optional[Type]]()
+        with datamodels.validation_settings(field_types=False):
+            return [self._substitute(dtype, memo) for dtype in dtypes], [
+                (self._substitute(s, memo), self._substitute(t, memo)) for s, t in failed
+            ]
+
+    def _find(self, dtype: Type) -> Type:
+        """Return the representative type variable or the concrete type `dtype` is bound to."""
+        if type(dtype) is not TypeVar or dtype.idx not in self._bindings:
+            return dtype
+        path = []
+        while type(dtype) is TypeVar and dtype.idx in self._bindings:
+            path.append(dtype.idx)
+            dtype = self._bindings[dtype.idx]
+        for idx in path:
+            self._bindings[idx] = dtype
+        return dtype
+
+    def _bind(self, var: TypeVar, dtype: Type) -> None:
+        """Bind a representative type variable to a representative or a concrete type."""
+        if type(dtype) is TypeVar:
+            var_rank, dtype_rank = self._ranks.get(var.idx, 0), self._ranks.get(dtype.idx, 0)
+            if var_rank > dtype_rank:
+                var, dtype = dtype, var
+            elif var_rank == dtype_rank:
+                self._ranks[dtype.idx] = dtype_rank + 1
+        self._bindings[var.idx] = dtype
+
+    def _substitute(self, dtype: Type, memo: dict[int, typing.Optional[Type]]) -> Type:
+        """Rebuild `dtype` with all type variables replaced by their bindings."""
+        dtype = self._find(dtype)
+        if type(dtype) is TypeVar:
+            return dtype
+        if id(dtype) in memo:
+            result = memo[id(dtype)]
+            if result is None:
+                # only happens if a type variable was bound to a type containing itself
+                raise TypeError(f"Can not construct infinite type: {dtype}")
+            return result
+
+        memo[id(dtype)] = None
+        values = {}
+        changed = False
+        for name, value in dtype.iter_children_items():
+            if _is_subclass(value.__class__, Type):
+                new_value = self._substitute(value, memo)
+                changed = changed or new_value is not value
+                value = new_value
+            values[name] = value
+        result = dtype.__class__(**values) if changed else dtype
+        memo[id(dtype)] = result
+        return result
+
+    def _handle_constraint(self, s: Type, t: Type, pending: list[tuple[Type, Type]]) -> bool:
+        """Handle a single constraint on representative types."""
+        if s is t:
             return True
 
         if type(s) is TypeVar:
-            assert s not in _free_variables(t)
-            # Just replace LHS by RHS if LHS is a type variable
-            self._rename(s, t)
+            if type(t) is not TypeVar or s.idx != t.idx:
+                self._bind(s, t)
             return True
 
-        if s.handle_constraint(t, self._add_constraint):
-            # Use a custom constraint handler if available
-            return True
+        if type(s).handle_constraint is not Type.handle_constraint:
+            # Use a custom constraint handler (on the current bindings) if available
+            memo = dict[int, typing.Optional[Type]]()
+            if self._substitute(s, memo).handle_constraint(
+                self._substitute(t, memo), lambda x, y: pending.append((x, y))
+            ):
+                return True
 
         if type(s) is type(t):
-            assert s not in _free_variables(t) and t not in _free_variables(s)
-            assert datamodels.fields(s).keys() == datamodels.fields(t).keys()
-            for k in datamodels.fields(s).keys():
-                sv = getattr(s, k)
-                tv = getattr(t, k)
-                if isinstance(sv, Type):
-                    assert isinstance(tv, Type)
-                    self._add_constraint(sv, tv)
+            for (name, sv), (_, tv) in zip(s.iter_children_items(), t.iter_children_items()):
+                if _is_subclass(sv.__class__, Type):
+                    assert _is_subclass(tv.__class__, Type)
+                    pending.append((sv, tv))
                 else:
                     assert sv == tv
             return True
@@ -348,11 +301,4 @@ def unify(
         result_types, unsatisfiable_constraints = unify([dtypes], constraints)
         return result_types[0], unsatisfiable_constraints
 
-    # Deduplicate type nodes, this can speed up later things a bit
-    memo = dict[Type, Type]()
-    dtypes = [_Dedup().visit(dtype, memo=memo) for dtype in dtypes]
-    constraints = {_Dedup().visit(c, memo=memo) for c in constraints}
-    del memo
-
-    unifier = _Unifier(dtypes, constraints)
-    return unifier.unify()
+    return _Unifier().unify(dtypes, constraints)
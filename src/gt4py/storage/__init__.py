@@ -16,19 +16,32 @@
 
 """GridTools storages utilities."""
 
-from . import cartesian
+from . import cartesian, serialization
 from .cartesian import layout
-from .cartesian.interface import empty, from_array, full, ones, zeros  # noqa: F401
+from .cartesian.interface import (  # noqa: F401
+    empty,
+    from_array,
+    full,
+    load,
+    load_header,
+    ones,
+    save,
+    zeros,
+)
 from .cartesian.layout import from_name, register
 
 
 __all__ = [
     "cartesian",
     "layout",
+    "serialization",
     "empty",
     "from_array",
     "full",
+    "load",
+    "load_header",
     "ones",
+    "save",
     "zeros",
     "from_name",
     "register",
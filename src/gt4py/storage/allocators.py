@@ -15,11 +15,16 @@
 from __future__ import annotations
 
 import abc
+import collections
 import collections.abc
 import dataclasses
 import functools
 import math
+import mmap
 import operator
+import os
+import threading
+import weakref
 
 import numpy as np
 import numpy.typing as npt
@@ -30,6 +35,7 @@ from gt4py.eve.extended_typing import (
     TYPE_CHECKING,
     Any,
     Generic,
+    Literal,
     NewType,
     Optional,
     Protocol,
@@ -332,6 +338,10 @@ class ValidNumPyLikeAllocationNS(Protocol):
     def empty(shape: Tuple[int, ...], dtype: Any) -> _NDBuffer:
         ...
 
+    @staticmethod
+    def asarray(obj: Any) -> _NDBuffer:
+        ...
+
     @staticmethod
     def byte_bounds(ndarray: _NDBuffer) -> Tuple[int, int]:
         ...
@@ -399,3 +409,423 @@ class NDArrayBufferAllocator(_BaseNDArrayBufferAllocator[core_defs.DeviceTypeT])
             tensor_view = tensor_view[shape_slices]
 
         return tensor_view
+
+
+MMapMode = Literal["w+", "r+", "r"]
+
+
+@dataclasses.dataclass(frozen=True, init=False)
+class MMapBufferAllocator(NDArrayBufferAllocator[core_defs.CPUDeviceTyping]):
+    """
+    CPU buffer allocator mapping the buffer to a file.
+
+    The file contains the raw buffer, including the padding and alignment offset of
+    the tensor. Since mappings are page-aligned, the same allocation request (shape,
+    dtype, layout, alignment and aligned index) always produces the same layout, so
+    other processes can attach to the buffer by requesting the same tensor from the
+    same file with mode ``"r+"`` or ``"r"``, without copying it. Use a file in
+    ``/dev/shm`` (see :meth:`shared_memory`) for buffers only shared in memory.
+
+    Every allocation maps the whole file, so an allocator should only be used for a
+    single buffer.
+
+    Args:
+        path: Path of the file.
+        mode: ``"w+"`` to create (or overwrite) the file, ``"r+"`` and ``"r"`` to attach to
+            an existing file in read-write or read-only mode.
+    """
+
+    path: str
+    mode: MMapMode
+
+    def __init__(self, path: Union[str, os.PathLike], mode: MMapMode = "w+"):
+        if mode not in ("w+", "r+", "r"):
+            raise ValueError(f"Invalid mmap mode '{mode}' (valid: 'w+', 'r+', 'r').")
+        super().__init__(core_defs.DeviceType.CPU, np)
+        object.__setattr__(self, "path", os.fspath(path))
+        object.__setattr__(self, "mode", mode)
+
+    @classmethod
+    def shared_memory(cls, name: str, mode: MMapMode = "w+") -> MMapBufferAllocator:
+        """Create an allocator for a buffer in the shared memory file system (``/dev/shm``)."""
+        if not name or os.sep in name:
+            raise ValueError(f"Invalid shared memory name '{name}'.")
+        return cls(os.path.join("/dev/shm", name), mode)
+
+    def malloc(self, length: int, device_id: int) -> _NDBuffer:
+        if device_id != 0:
+            raise ValueError(f"Unsupported device ID {device_id} for CPU memory allocation")
+
+        length = max(length, 1)  # empty files cannot be mapped
+        if self.mode != "w+" and (file_size := os.path.getsize(self.path)) < length:
+            raise ValueError(
+                f"File '{self.path}' ({file_size} bytes) is too small for the requested buffer "
+                f"({length} bytes)."
+            )
+        return np.memmap(self.path, dtype=np.uint8, mode=self.mode, shape=(length,))
+
+
+#: Size (in bytes) of the (transparent) huge pages on x86-64 and most AArch64 Linux systems.
+HUGE_PAGE_SIZE = 2 * 2**20
+
+
+@dataclasses.dataclass(frozen=True, init=False)
+class HugePageBufferAllocator(NDArrayBufferAllocator[core_defs.CPUDeviceTyping]):
+    """
+    CPU buffer allocator using transparent huge pages for large buffers.
+
+    Buffers of at least `min_size` bytes are allocated as anonymous memory mappings aligned
+    to :data:`HUGE_PAGE_SIZE` with the ``madvise(MADV_HUGEPAGE)`` advice (Linux only), which
+    makes the kernel back them with huge pages unless transparent huge pages are disabled.
+    Smaller buffers, and all buffers on platforms without ``MADV_HUGEPAGE``, are allocated
+    like by :class:`NDArrayBufferAllocator`, and the advice is silently skipped if the
+    kernel does not support it. Use :func:`huge_page_bytes` to check whether huge pages
+    were actually obtained.
+
+    Args:
+        min_size: Minimum size (in bytes) of the buffers using huge pages.
+    """
+
+    min_size: int
+
+    def __init__(self, min_size: int = HUGE_PAGE_SIZE):
+        super().__init__(core_defs.DeviceType.CPU, np)
+        object.__setattr__(self, "min_size", min_size)
+
+    def malloc(self, length: int, device_id: int) -> _NDBuffer:
+        if length < self.min_size or not hasattr(mmap, "MADV_HUGEPAGE"):
+            return super().malloc(length, device_id)
+        if device_id != 0:
+            raise ValueError(f"Unsupported device ID {device_id} for CPU memory allocation")
+
+        # Map an extra huge page to align the start of the buffer
+        huge_length = -(-length // HUGE_PAGE_SIZE) * HUGE_PAGE_SIZE
+        # (private mapping, since shared anonymous memory only uses huge pages if enabled for shmem)
+        mapping = mmap.mmap(
+            -1, huge_length + HUGE_PAGE_SIZE, flags=mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS
+        )
+        mapping_address = np.byte_bounds(np.frombuffer(mapping, dtype=np.uint8))[0]
+        offset = -mapping_address % HUGE_PAGE_SIZE
+        try:
+            mapping.madvise(mmap.MADV_HUGEPAGE, offset, huge_length)
+        except OSError:
+            pass  # e.g. kernel without transparent huge pages support
+
+        # The array keeps the mapping alive
+        return np.frombuffer(mapping, dtype=np.uint8, count=length, offset=offset)
+
+
+def huge_page_bytes(buffer: Union[TensorBuffer, core_defs.NDArrayObject]) -> int:
+    """
+    Return the size (in bytes) of the huge pages backing the memory mappings of a CPU buffer.
+
+    Memory pages are only allocated when they are first written to. The result is 0
+    if the information is not available (i.e. not on Linux).
+    """
+    start, end = np.byte_bounds(np.asarray(buffer))
+    result = 0
+    try:
+        with open("/proc/self/smaps") as smaps:
+            in_buffer = False
+            for line in smaps:
+                key, _, value = line.partition(" ")
+                if "-" in key and not key.endswith(":"):
+                    map_start, map_end = (int(address, 16) for address in key.split("-"))
+                    in_buffer = map_start < end and start < map_end
+                elif in_buffer and key == "AnonHugePages:":
+                    result += int(value.split()[0]) * 1024
+    except OSError:
+        return 0
+    return result
+
+
+@dataclasses.dataclass
+class BufferPoolStatistics:
+    """Counters of a :class:`PoolingBufferAllocator`."""
+
+    #: Number of allocations served with a pooled buffer.
+    hits: int = 0
+    #: Number of allocations which required a new buffer.
+    misses: int = 0
+    #: Number of buffers given back to the pool.
+    returned: int = 0
+    #: Number of released buffers freed because the pool was full.
+    dropped: int = 0
+    #: Size (in bytes) of the free buffers held by the pool.
+    bytes_held: int = 0
+    #: Size (in bytes) of the pooled buffers currently in use.
+    bytes_in_use: int = 0
+
+
+def _size_class(length: int) -> int:
+    """Round a buffer length up to its size class (4 classes per power of two, at least 64 bytes)."""
+    step = max(64, 1 << max(0, length.bit_length() - 3))
+    return -(-length // step) * step
+
+
+class _PooledMemory:
+    """Owner of the memory of a pooled buffer, which is returned to the pool when collected."""
+
+    __slots__ = ("raw", "__weakref__")
+
+    def __init__(self, raw: _NDBuffer):
+        self.raw = raw
+
+    @property
+    def __array_interface__(self) -> dict[str, Any]:
+        return self.raw.__array_interface__  # type: ignore[union-attr]
+
+    @property
+    def __cuda_array_interface__(self) -> dict[str, Any]:
+        return self.raw.__cuda_array_interface__  # type: ignore[union-attr]
+
+
+@dataclasses.dataclass(frozen=True, init=False, eq=False)
+class PoolingBufferAllocator(_BaseNDArrayBufferAllocator[core_defs.DeviceTypeT]):
+    """
+    Buffer allocator reusing the memory of buffers which are not used anymore.
+
+    Buffers are requested from the wrapped `allocator` with lengths rounded up to a size
+    class and they are returned to the pool of their size class and device as soon as
+    the last array viewing them is garbage-collected, or explicitly with :meth:`release`.
+    Since the required padding for the alignment is part of the buffer length, buffers
+    from the same pool can be used for any alignment.
+
+    Args:
+        allocator: Allocator of the pooled buffers.
+        max_bytes: Maximum size (in bytes) of the free buffers held by the pool
+            (released buffers exceeding the limit are freed). No limit if `None`.
+    """
+
+    allocator: _BaseNDArrayBufferAllocator[core_defs.DeviceTypeT]
+    max_bytes: Optional[int]
+
+    _free: dict[tuple[int, int], list[_NDBuffer]] = dataclasses.field(repr=False)
+    _in_use: dict[int, weakref.finalize] = dataclasses.field(repr=False)
+    # Buffers released by finalizers, which might run while the pool is locked
+    # (i.e. at any allocation), so they are only added to the pool by the next call
+    _released: collections.deque[tuple[tuple[int, int], int, _NDBuffer]] = dataclasses.field(
+        repr=False
+    )
+    _lock: threading.Lock = dataclasses.field(repr=False)
+    _statistics: BufferPoolStatistics = dataclasses.field(repr=False)
+
+    # Every pool is a different allocator
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+    def __init__(
+        self,
+        allocator: _BaseNDArrayBufferAllocator[core_defs.DeviceTypeT],
+        *,
+        max_bytes: Optional[int] = None,
+    ):
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError(f"Invalid maximum pool size {max_bytes}")
+        object.__setattr__(self, "allocator", allocator)
+        object.__setattr__(self, "max_bytes", max_bytes)
+        object.__setattr__(self, "_free", collections.defaultdict(list))
+        object.__setattr__(self, "_in_use", {})
+        object.__setattr__(self, "_released", collections.deque())
+        object.__setattr__(self, "_lock", threading.Lock())
+        object.__setattr__(self, "_statistics", BufferPoolStatistics())
+
+    @property
+    def device_type(self) -> core_defs.DeviceTypeT:
+        return self.allocator.device_type
+
+    @property
+    def array_ns(self) -> ValidNumPyLikeAllocationNS:
+        return self.allocator.array_ns
+
+    @property
+    def statistics(self) -> BufferPoolStatistics:
+        """Snapshot of the pool counters."""
+        with self._lock:
+            self._collect_released()
+            return dataclasses.replace(self._statistics)
+
+    def malloc(self, length: int, device_id: int) -> _NDBuffer:
+        key = (_size_class(length), device_id)
+        with self._lock:
+            self._collect_released()
+            free_buffers = self._free.get(key)
+            if free_buffers:
+                raw = free_buffers.pop()
+                self._statistics.hits += 1
+                self._statistics.bytes_held -= key[0]
+            else:
+                raw = self.allocator.malloc(key[0], device_id)
+                self._statistics.misses += 1
+            self._statistics.bytes_in_use += key[0]
+
+            # The returned buffer (and every array viewing it) keeps the owner alive
+            owner = _PooledMemory(raw)
+            address = self.array_ns.byte_bounds(raw)[0]
+            self._in_use[address] = weakref.finalize(
+                owner, self._released.append, (key, address, raw)
+            )
+
+        return self.array_ns.asarray(owner)
+
+    def tensorize(
+        self,
+        buffer: _NDBuffer,
+        dtype: core_defs.DType[core_defs.ScalarT],
+        shape: core_defs.TensorShape,
+        allocated_shape: core_defs.TensorShape,
+        item_size: int,
+        strides: Sequence[int],
+        byte_offset: int,
+    ) -> core_defs.NDArrayObject:
+        return self.allocator.tensorize(
+            buffer, dtype, shape, allocated_shape, item_size, strides, byte_offset
+        )
+
+    def release(self, buffer: Union[TensorBuffer, _NDBuffer]) -> None:
+        """
+        Return the memory of a buffer allocated by this pool immediately.
+
+        The buffer (or any array viewing it) must not be used afterwards, since
+        its memory will be reused by the next allocations of the same size class.
+        """
+        if isinstance(buffer, TensorBuffer):
+            address = buffer.memory_address
+        else:
+            # Find the owner of the memory in the chain of bases of the array
+            owner: Any = buffer
+            while owner is not None and not isinstance(owner, _PooledMemory):
+                owner = getattr(owner, "base", None)
+            if owner is None:
+                raise ValueError("Buffer was not allocated by a buffer pool.")
+            address = self.array_ns.byte_bounds(owner.raw)[0]
+
+        finalizer = self._in_use.get(address, None)
+        if finalizer is None:
+            raise ValueError("Buffer was not allocated by this buffer pool or already released.")
+        finalizer()
+        with self._lock:
+            self._collect_released()
+
+    def clear(self) -> None:
+        """Free all the buffers held by the pool."""
+        with self._lock:
+            self._collect_released()
+            self._free.clear()
+            self._statistics.bytes_held = 0
+
+    def _collect_released(self) -> None:
+        while self._released:
+            key, address, raw = self._released.popleft()
+            size = key[0]
+            del self._in_use[address]
+            self._statistics.bytes_in_use -= size
+            if self.max_bytes is not None and self._statistics.bytes_held + size > self.max_bytes:
+                self._statistics.dropped += 1
+            else:
+                self._free[key].append(raw)
+                self._statistics.returned += 1
+                self._statistics.bytes_held += size
+
+
+#: Minimum size (in bytes) of the arrays initialized in parallel by :func:`first_touch_fill`.
+FIRST_TOUCH_MIN_PARALLEL_BYTES = 2**20
+
+
+def default_num_threads() -> int:
+    """Number of threads like in OpenMP: ``OMP_NUM_THREADS`` or the number of available CPUs."""
+    try:
+        return max(int(os.environ["OMP_NUM_THREADS"].split(",")[0]), 1)
+    except (KeyError, ValueError):
+        pass
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def first_touch_fill(ndarray: core_defs.NDArrayObject, value: Any, *, num_threads: int = 0) -> None:
+    """
+    Initialize an array from several threads to place its pages close to the threads using them.
+
+    The memory pages of a new buffer are placed on the NUMA node of the thread which writes
+    them first. The array is split in blocks of its outermost dimension in the memory layout
+    (i.e. the one with ``layout_map`` value 0, which has the largest stride) like the
+    iterations of an OpenMP loop with static schedule, and the ``k``-th block is filled by
+    a thread bound to the ``k``-th CPU available to the process (if supported by the OS),
+    like the ``k``-th thread of a stencil with ``OMP_PROC_BIND=close``. Non-NumPy arrays and
+    arrays smaller than :data:`FIRST_TOUCH_MIN_PARALLEL_BYTES` are filled by the calling thread.
+
+    Args:
+        ndarray: Array to initialize.
+        value: Scalar or array (of the same shape) with the values.
+        num_threads: Number of threads (:func:`default_num_threads` if 0).
+    """
+    num_threads = num_threads or default_num_threads()
+    if (
+        not isinstance(ndarray, np.ndarray)
+        or ndarray.ndim == 0
+        or num_threads <= 1
+        or ndarray.nbytes < FIRST_TOUCH_MIN_PARALLEL_BYTES
+    ):
+        ndarray[...] = value
+        return
+
+    outer_dim, bounds = _first_touch_blocks(ndarray, num_threads)
+    num_threads = len(bounds) - 1
+    value_is_array = isinstance(value, np.ndarray) and value.shape == ndarray.shape
+    cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_setaffinity") else []
+
+    errors: list[BaseException] = []
+
+    def fill_block(k: int) -> None:
+        try:
+            if len(cpus) >= num_threads:
+                os.sched_setaffinity(0, {cpus[k]})  # only affects this thread
+            block = (slice(None),) * outer_dim + (slice(bounds[k], bounds[k + 1]),)
+            ndarray[block] = value[block] if value_is_array else value
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=fill_block, args=(k,)) for k in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+def _first_touch_blocks(ndarray: np.ndarray, num_threads: int) -> Tuple[int, list[int]]:
+    """Return the outermost dimension in memory and the bounds of its blocks for each thread."""
+    outer_dim = max(
+        range(ndarray.ndim),
+        key=lambda dim: abs(ndarray.strides[dim]) if ndarray.shape[dim] > 1 else -1,
+    )
+    length = ndarray.shape[outer_dim]
+    num_threads = min(num_threads, length)
+
+    # Static schedule: the first `length % num_threads` blocks get an extra item
+    block_size, remainder = divmod(length, num_threads)
+    bounds = [0]
+    for k in range(num_threads):
+        bounds.append(bounds[-1] + block_size + (k < remainder))
+    return outer_dim, bounds
+
+
+def fill(
+    ndarray: core_defs.NDArrayObject, value: Any, *, parallel_first_touch: Union[bool, int] = False
+) -> None:
+    """
+    Fill an array with `value`, in parallel by :func:`first_touch_fill` if requested.
+
+    Args:
+        ndarray: Array to initialize.
+        value: Scalar or array (of the same shape) with the values.
+        parallel_first_touch: Fill the array by :func:`first_touch_fill`, with the given
+            number of threads or :func:`default_num_threads` if `True`.
+    """
+    if parallel_first_touch is False:
+        ndarray[...] = value
+    else:
+        num_threads = 0 if parallel_first_touch is True else parallel_first_touch
+        first_touch_fill(ndarray, value, num_threads=num_threads)
@@ -15,11 +15,12 @@
 from __future__ import annotations
 
 import numbers
-from typing import Optional, Sequence, Union
+import os
+from typing import Literal, Optional, Sequence, Union
 
 import numpy as np
 
-from gt4py.storage import allocators
+from gt4py.storage import allocators, serialization
 from gt4py.storage.cartesian import layout, utils as storage_utils
 
 
@@ -50,6 +51,11 @@ def empty(
     backend: str,
     aligned_index: Optional[Sequence[int]] = None,
     dimensions: Optional[Sequence[str]] = None,
+    allocator: Optional[allocators.BufferAllocator] = None,
+    backing: Literal["memory", "mmap"] = "memory",
+    path: Optional[Union[str, os.PathLike]] = None,
+    mmap_mode: allocators.MMapMode = "w+",
+    parallel_first_touch: Union[bool, int] = False,
 ) -> Union[np.ndarray, "cp.ndarray"]:
     """Allocate an array of uninitialized (undefined) values with performance-optimal strides and alignment.
 
@@ -70,6 +76,22 @@ def empty(
         dimensions: `Sequence` of `str`, optional
             Indicate the semantic meaning of the dimensions in the provided array. Only used for determining optimal
             strides, the information is not stored.
+        allocator: `BufferAllocator`, optional
+            Allocator of the buffer (e.g. a :class:`gt4py.storage.allocators.PoolingBufferAllocator`) for the
+            device of the `backend`. If not passed, a new buffer is allocated with the default allocator.
+        backing: `str`, optional
+            Memory backing the buffer: `"memory"` (default) or `"mmap"` for a buffer mapped to the file at
+            `path` (CPU backends only, see :class:`gt4py.storage.allocators.MMapBufferAllocator`).
+        path: `str` or `os.PathLike`, optional
+            File of a `"mmap"` buffer, e.g. in `/dev/shm` for a buffer shared between processes.
+        mmap_mode: `str`, optional
+            `"w+"` (default) to create the file, `"r+"` or `"r"` to attach to the buffer in an existing file
+            (created by an allocation with the same arguments) in read-write or read-only mode.
+        parallel_first_touch: `bool` or `int`, optional
+            Initialize the buffer with zeros from several threads (`True` for as many as OpenMP would use, or a
+            number of threads), each one writing a block of the outermost dimension of the layout. This places the
+            memory pages on the NUMA nodes of the CPUs processing them in multi-threaded stencils (see
+            :func:`gt4py.storage.allocators.first_touch_fill`).
 
     Returns
     -------
@@ -92,6 +114,19 @@ def empty(
     else:
         allocate_f = storage_utils.allocate_cpu
 
+    if backing == "mmap":
+        if path is None:
+            raise ValueError("A 'path' is required for 'mmap' backed storages.")
+        if allocator is not None:
+            raise ValueError("Arguments 'allocator' and 'backing' are mutually exclusive.")
+        if storage_info["device"] != "cpu":
+            raise ValueError(f"Backend '{backend}' does not support 'mmap' backed storages.")
+        allocator = allocators.MMapBufferAllocator(path, mmap_mode)
+    elif backing != "memory":
+        raise ValueError(f"Invalid storage backing '{backing}' (valid: 'memory', 'mmap').")
+    elif path is not None:
+        raise ValueError("Argument 'path' is only valid for 'mmap' backed storages.")
+
     aligned_index, shape, dtype, dimensions = storage_utils.normalize_storage_spec(
         aligned_index, shape, dtype, dimensions
     )
@@ -103,7 +138,11 @@ def empty(
     assert allocators.is_valid_layout_map(layout_map)
 
     dtype = np.dtype(dtype)
-    _, res = allocate_f(shape, layout_map, dtype, alignment * dtype.itemsize, aligned_index)
+    _, res = allocate_f(
+        shape, layout_map, dtype, alignment * dtype.itemsize, aligned_index, allocator=allocator
+    )
+    if parallel_first_touch is not False:
+        allocators.fill(res, dtype.type(0), parallel_first_touch=parallel_first_touch)
 
     return res
 
@@ -115,6 +154,8 @@ def ones(
     backend: str,
     aligned_index: Optional[Sequence[int]] = None,
     dimensions: Optional[Sequence[str]] = None,
+    allocator: Optional[allocators.BufferAllocator] = None,
+    parallel_first_touch: Union[bool, int] = False,
 ) -> Union[np.ndarray, "cp.ndarray"]:
     """Allocate an array with values initialized to 1.0 with performance-optimal strides and alignment.
 
@@ -135,6 +176,14 @@ def ones(
         dimensions: `Sequence` of `str`, optional
             Indicate the semantic meaning of the dimensions in the provided array. Only used for determining optimal
             strides, the information is not stored.
+        allocator: `BufferAllocator`, optional
+            Allocator of the buffer (e.g. a :class:`gt4py.storage.allocators.PoolingBufferAllocator`) for the
+            device of the `backend`. If not passed, a new buffer is allocated with the default allocator.
+        parallel_first_touch: `bool` or `int`, optional
+            Initialize the buffer from several threads (`True` for as many as OpenMP would use, or a number of
+            threads), each one writing a block of the outermost dimension of the layout. This places the memory
+            pages on the NUMA nodes of the CPUs processing them in multi-threaded stencils (see
+            :func:`gt4py.storage.allocators.first_touch_fill`).
 
     Returns
     -------
@@ -155,8 +204,9 @@ def ones(
         backend=backend,
         aligned_index=aligned_index,
         dimensions=dimensions,
+        allocator=allocator,
     )
-    storage[...] = storage.dtype.type(1)
+    allocators.fill(storage, storage.dtype.type(1), parallel_first_touch=parallel_first_touch)
     return storage
 
 
@@ -168,6 +218,8 @@ def full(
     backend: str,
     aligned_index: Optional[Sequence[int]] = None,
     dimensions: Optional[Sequence[str]] = None,
+    allocator: Optional[allocators.BufferAllocator] = None,
+    parallel_first_touch: Union[bool, int] = False,
 ) -> Union[np.ndarray, "cp.ndarray"]:
     """Allocate an array with values initialized to `fill_value` with performance-optimal strides and alignment.
 
@@ -190,6 +242,14 @@ def full(
         dimensions: `Sequence` of `str`, optional
             Indicate the semantic meaning of the dimensions in the provided array. Only used for determining optimal
             strides, the information is not stored.
+        allocator: `BufferAllocator`, optional
+            Allocator of the buffer (e.g. a :class:`gt4py.storage.allocators.PoolingBufferAllocator`) for the
+            device of the `backend`. If not passed, a new buffer is allocated with the default allocator.
+        parallel_first_touch: `bool` or `int`, optional
+            Initialize the buffer from several threads (`True` for as many as OpenMP would use, or a number of
+            threads), each one writing a block of the outermost dimension of the layout. This places the memory
+            pages on the NUMA nodes of the CPUs processing them in multi-threaded stencils (see
+            :func:`gt4py.storage.allocators.first_touch_fill`).
 
     Returns
     -------
@@ -210,8 +270,11 @@ def full(
         backend=backend,
         aligned_index=aligned_index,
         dimensions=dimensions,
+        allocator=allocator,
+    )
+    allocators.fill(
+        storage, storage.dtype.type(fill_value), parallel_first_touch=parallel_first_touch
     )
-    storage[...] = storage.dtype.type(fill_value)
     return storage
 
 
@@ -222,6 +285,8 @@ def zeros(
     backend: str,
     aligned_index: Optional[Sequence[int]] = None,
     dimensions: Optional[Sequence[str]] = None,
+    allocator: Optional[allocators.BufferAllocator] = None,
+    parallel_first_touch: Union[bool, int] = False,
 ) -> Union[np.ndarray, "cp.ndarray"]:
     """Allocate an array with values initialized to 0.0 with performance-optimal strides and alignment.
 
@@ -242,6 +307,14 @@ def zeros(
         dimensions: `Sequence` of `str`, optional
             Indicate the semantic meaning of the dimensions in the provided array. Only used for determining optimal
             strides, the information is not stored.
+        allocator: `BufferAllocator`, optional
+            Allocator of the buffer (e.g. a :class:`gt4py.storage.allocators.PoolingBufferAllocator`) for the
+            device of the `backend`. If not passed, a new buffer is allocated with the default allocator.
+        parallel_first_touch: `bool` or `int`, optional
+            Initialize the buffer from several threads (`True` for as many as OpenMP would use, or a number of
+            threads), each one writing a block of the outermost dimension of the layout. This places the memory
+            pages on the NUMA nodes of the CPUs processing them in multi-threaded stencils (see
+            :func:`gt4py.storage.allocators.first_touch_fill`).
 
     Returns
     -------
@@ -262,8 +335,9 @@ def zeros(
         backend=backend,
         aligned_index=aligned_index,
         dimensions=dimensions,
+        allocator=allocator,
     )
-    storage[...] = storage.dtype.type(0)
+    allocators.fill(storage, storage.dtype.type(0), parallel_first_touch=parallel_first_touch)
     return storage
 
 
@@ -274,6 +348,7 @@ def from_array(
     backend: str,
     aligned_index: Optional[Sequence[int]] = None,
     dimensions: Optional[Sequence[str]] = None,
+    allocator: Optional[allocators.BufferAllocator] = None,
 ) -> Union[np.ndarray, "cp.ndarray"]:
     """Allocate an array with values initialized to those of `data` with performance-optimal strides and alignment.
 
@@ -296,6 +371,9 @@ def from_array(
         dimensions: `Sequence` of `str`, optional
             Indicate the semantic meaning of the dimensions in the provided array. Only used for determining optimal
             strides, the information is not stored.
+        allocator: `BufferAllocator`, optional
+            Allocator of the buffer (e.g. a :class:`gt4py.storage.allocators.PoolingBufferAllocator`) for the
+            device of the `backend`. If not passed, a new buffer is allocated with the default allocator.
 
     Returns
     -------
@@ -324,6 +402,7 @@ def from_array(
         backend=backend,
         aligned_index=aligned_index,
         dimensions=dimensions,
+        allocator=allocator,
     )
 
     layout_info = layout.from_name(backend)
@@ -331,3 +410,137 @@ def from_array(
     storage[...] = storage_utils.asarray(data, device=layout_info["device"])
 
     return storage
+
+
+def save(
+    path: Union[str, os.PathLike],
+    data: ArrayLike,
+    *,
+    backend: Optional[str] = None,
+    aligned_index: Optional[Sequence[int]] = None,
+    dimensions: Optional[Sequence[str]] = None,
+    origin: Optional[Sequence[int]] = None,
+    num_threads: int = 1,
+) -> None:
+    """Save an array to a binary file, preserving its padded memory layout, dimensions and origin.
+
+    The file holds a versioned header and the buffer of the array including its padding (see
+    :mod:`gt4py.storage.serialization`), so that :func:`load` can read it without reordering or memory-map it.
+
+    Parameters
+    ----------
+        path : `str` or `os.PathLike`
+            Path of the file (overwritten if it exists).
+        data : `ArrayLike`
+            Storage (or any NumPy or CuPy array) to save.
+
+    Keyword Arguments
+    -----------------
+        backend : `str`, optional
+            Backend for which the storage was allocated, to record its alignment in the header.
+        aligned_index: `Sequence` of `int`, optional
+            Index used for the alignment of the storage, recorded in the header.
+        dimensions: `Sequence` of `str`, optional
+            Semantic meaning of the dimensions. Taken from `__gt_dims__` (if defined) if not passed.
+        origin: `Sequence` of `int`, optional
+            Origin of the computation domain. Taken from `__gt_origin__` (if defined) if not passed.
+        num_threads: `int`, optional
+            Number of threads writing chunks of large arrays in parallel (0 for as many as OpenMP would use).
+
+    Raises
+    -------
+        ValueError
+            If illegal or inconsistent arguments are specified.
+    """
+    array = storage_utils.asarray(data)
+    byte_alignment = None
+    if backend is not None:
+        _error_on_invalid_preset(backend)
+        storage_info = layout.from_name(backend)
+        assert storage_info is not None
+        byte_alignment = storage_info["alignment"] * array.itemsize
+    serialization.write(
+        path,
+        array,
+        byte_alignment=byte_alignment,
+        aligned_index=None if aligned_index is None else tuple(aligned_index),
+        dims=tuple(dimensions) if dimensions is not None else storage_utils.get_dims(data),
+        origin=tuple(origin) if origin is not None else storage_utils.get_origin(data),
+        metadata={"backend": backend} if backend is not None else None,
+        num_threads=num_threads,
+    )
+
+
+def load(
+    path: Union[str, os.PathLike],
+    *,
+    backend: Optional[str] = None,
+    aligned_index: Optional[Sequence[int]] = None,
+    allocator: Optional[allocators.BufferAllocator] = None,
+    mmap_mode: Optional[serialization.MMapLoadMode] = None,
+    num_threads: int = 1,
+) -> Union[np.ndarray, "cp.ndarray"]:
+    """Load an array saved by :func:`save`.
+
+    Without a `backend`, the array is read into a buffer with the strides and alignment of the saved array. The
+    dimensions and origin of the saved array are available through :func:`load_header`.
+
+    Parameters
+    ----------
+        path : `str` or `os.PathLike`
+            Path of the file.
+
+    Keyword Arguments
+    -----------------
+        backend : `str`, optional
+            The target backend for which the allocation is optimized. The data is read directly into the new
+            buffer if it has the layout of the saved array, otherwise it is copied.
+        aligned_index: `Sequence` of `int`, optional
+            Index of the new buffer which is aligned, if allocated for a `backend`. Defaults to the aligned index
+            or, if not known, the origin of the saved array.
+        allocator: `BufferAllocator`, optional
+            Allocator of the buffer for the device of the `backend`.
+        mmap_mode: `str`, optional
+            Memory-map the array in the file instead of reading it, read-only (`"r"`), read-write (`"r+"`) or
+            copy-on-write (`"c"`).
+        num_threads: `int`, optional
+            Number of threads reading chunks of large arrays in parallel (0 for as many as OpenMP would use).
+
+    Returns
+    -------
+        NumPy or CuPy ndarray
+            With the values of the saved array.
+
+    Raises
+    -------
+        ValueError
+            If illegal or inconsistent arguments are specified or if the file is not valid.
+    """
+    if mmap_mode is not None:
+        if backend is not None or allocator is not None:
+            raise ValueError(
+                "Argument 'mmap_mode' is mutually exclusive with 'backend' and 'allocator'."
+            )
+        return serialization.memory_map(path, mmap_mode)[1]
+    if backend is None:
+        if allocator is not None:
+            raise ValueError("Argument 'allocator' requires a 'backend'.")
+        return serialization.read(path, num_threads=num_threads)[1]
+
+    header = serialization.read_header(path)
+    if aligned_index is None:
+        aligned_index = header.aligned_index if header.aligned_index is not None else header.origin
+    storage = empty(
+        header.shape,
+        header.dtype,
+        backend=backend,
+        aligned_index=aligned_index,
+        dimensions=header.dims,
+        allocator=allocator,
+    )
+    return serialization.read(path, storage, overwrite_padding=True, num_threads=num_threads)[1]
+
+
+def load_header(path: Union[str, os.PathLike]) -> serialization.BufferHeader:
+    """Read the header of a file written by :func:`save`, with the shape, dtype, layout, dimensions and origin."""
+    return serialization.read_header(path)
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import collections.abc
+import functools
 import math
 import numbers
 from typing import Any, Final, Literal, Optional, Sequence, Tuple, Union, cast
@@ -55,6 +56,18 @@ _CPUBufferAllocator = allocators.NDArrayBufferAllocator(
     array_ns=np,
 )
 
+
+@functools.lru_cache(maxsize=None)
+def _huge_page_allocator(min_size: int) -> allocators.HugePageBufferAllocator:
+    return allocators.HugePageBufferAllocator(min_size=min_size)
+
+
+def _default_cpu_allocator() -> allocators.BufferAllocator:
+    if gt_config.storage_settings["huge_pages"]:
+        return _huge_page_allocator(gt_config.storage_settings["huge_pages_min_size"])
+    return _CPUBufferAllocator
+
+
 _GPUBufferAllocator: Optional[allocators.NDArrayBufferAllocator] = None
 if cp:
     assert allocators.is_valid_nplike_allocation_ns(cp)
@@ -225,9 +238,15 @@ def allocate_cpu(
     dtype: DTypeLike,
     alignment_bytes: int,
     aligned_index: Optional[Sequence[int]],
+    *,
+    allocator: Optional[allocators.BufferAllocator] = None,
 ) -> Tuple[allocators._NDBuffer, np.ndarray]:
     device = core_defs.Device(core_defs.DeviceType.CPU, 0)
-    buffer = _CPUBufferAllocator.allocate(
+    if allocator is None:
+        allocator = _default_cpu_allocator()
+    if allocator.device_type != device.device_type:
+        raise ValueError(f"Allocator {allocator} cannot allocate {device.device_type.name} memory")
+    buffer = allocator.allocate(
         shape,
         core_defs.dtype(dtype),
         device_id=device.device_id,
@@ -244,12 +263,18 @@ def allocate_gpu(
     dtype: DTypeLike,
     alignment_bytes: int,
     aligned_index: Optional[Sequence[int]],
+    *,
+    allocator: Optional[allocators.BufferAllocator] = None,
 ) -> Tuple["cp.ndarray", "cp.ndarray"]:
-    assert _GPUBufferAllocator is not None, "GPU allocation library or device not found"
+    if allocator is None:
+        allocator = _GPUBufferAllocator
+    assert allocator is not None, "GPU allocation library or device not found"
     device = core_defs.Device(  # type: ignore[type-var]
         core_defs.DeviceType.ROCM if gt_config.GT4PY_USE_HIP else core_defs.DeviceType.CUDA, 0
     )
-    buffer = _GPUBufferAllocator.allocate(
+    if allocator.device_type != device.device_type:
+        raise ValueError(f"Allocator {allocator} cannot allocate {device.device_type.name} memory")
+    buffer = allocator.allocate(
         shape,
         core_defs.dtype(dtype),
         device_id=device.device_id,
@@ -0,0 +1,412 @@
+# GT4Py - GridTools Framework
+#
+# Copyright (c) 2014-2023, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Binary files of storage buffers, preserving their memory layout.
+
+A file starts with a fixed-size prefix (magic string, format version and header size),
+followed by a JSON header describing the array (:class:`BufferHeader`) and by the raw bytes
+spanned by the array in its buffer, including the padding between its rows. The data is
+placed at the same offset from a :data:`PAGE_SIZE` boundary as the first element of the
+original array in memory, so arrays read into new buffers or memory-mapped from the file
+keep the strides and the alignment of the saved array.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+import struct
+import threading
+import uuid
+
+import numpy as np
+
+from gt4py._core import definitions as core_defs
+from gt4py.eve.extended_typing import Any, Dict, Literal, Optional, Tuple, Union
+from gt4py.storage import allocators
+
+
+MAGIC = b"\x93GT4PY"
+
+#: Version of the file format (files with a newer version cannot be read).
+FORMAT_VERSION = 1
+
+#: Alignment (in bytes) of the data in the files and in the buffers allocated to read them.
+PAGE_SIZE = 4096
+
+#: Size (in bytes) of the chunks transferred by each thread in parallel reads and writes.
+DEFAULT_CHUNK_SIZE = 64 * 2**20
+
+MMapLoadMode = Literal["r", "r+", "c"]
+
+_PREFIX = struct.Struct("<6sHI")  # magic, format version, header size
+
+
+@dataclasses.dataclass(frozen=True)
+class BufferHeader:
+    """
+    Description of the array stored in a file.
+
+    Attributes:
+        shape: Shape of the array.
+        dtype: Data type of the array.
+        strides: Strides (in bytes) of the array in the file and in the loaded buffers.
+        layout_map: Layout of the array dimensions (see :data:`allocators.BufferLayoutMap`).
+        address_offset: Offset (in bytes) of the first element from a :data:`PAGE_SIZE`
+            boundary in the original buffer, the file and the loaded buffers.
+        byte_alignment: Alignment (in bytes) of the original buffer (if known).
+        aligned_index: Index of the aligned element of the original buffer (if known).
+        dims: Names of the dimensions (if known).
+        origin: Origin of the computation domain in the array (if known).
+        metadata: Additional JSON-serializable data, e.g. the domain of a field.
+        version: Version of the file format.
+    """
+
+    shape: Tuple[int, ...]
+    dtype: np.dtype
+    strides: Tuple[int, ...]
+    layout_map: allocators.BufferLayoutMap
+    address_offset: int = 0
+    byte_alignment: Optional[int] = None
+    aligned_index: Optional[Tuple[int, ...]] = None
+    dims: Optional[Tuple[str, ...]] = None
+    origin: Optional[Tuple[int, ...]] = None
+    metadata: Dict[str, Any] = dataclasses.field(default_factory=dict)
+    version: int = FORMAT_VERSION
+
+    @property
+    def data_size(self) -> int:
+        """Size (in bytes) of the data in the file."""
+        return _byte_span(self.shape, self.strides, self.dtype.itemsize)
+
+    def to_bytes(self) -> bytes:
+        """Encode the header, padded up to the start of the data."""
+        header = json.dumps(
+            {
+                "shape": self.shape,
+                "dtype": self.dtype.str,
+                "strides": self.strides,
+                "layout_map": self.layout_map,
+                "address_offset": self.address_offset,
+                "byte_alignment": self.byte_alignment,
+                "aligned_index": self.aligned_index,
+                "dims": self.dims,
+                "origin": self.origin,
+                "metadata": self.metadata,
+            }
+        ).encode()
+        prefix = _PREFIX.pack(MAGIC, self.version, len(header))
+        data_offset = _data_offset(len(prefix) + len(header), self.address_offset)
+        return (prefix + header).ljust(data_offset, b" ")
+
+    @classmethod
+    def from_file(cls, file: Any) -> Tuple[BufferHeader, int]:
+        """Decode the header at the start of a binary file and return it with the data offset."""
+        prefix = file.read(_PREFIX.size)
+        if len(prefix) < _PREFIX.size or prefix[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"File '{file.name}' is not a GT4Py storage file.")
+        _, version, header_size = _PREFIX.unpack(prefix)
+        if version > FORMAT_VERSION:
+            raise ValueError(
+                f"File '{file.name}' has format version {version}, which is newer than "
+                f"the supported version {FORMAT_VERSION}."
+            )
+        data = json.loads(file.read(header_size))
+        header = cls(
+            shape=tuple(data["shape"]),
+            dtype=np.dtype(data["dtype"]),
+            strides=tuple(data["strides"]),
+            layout_map=tuple(data["layout_map"]),
+            address_offset=data["address_offset"],
+            byte_alignment=data["byte_alignment"],
+            aligned_index=_optional_tuple(data["aligned_index"]),
+            dims=_optional_tuple(data["dims"]),
+            origin=_optional_tuple(data["origin"]),
+            metadata=data["metadata"],
+            version=version,
+        )
+        return header, _data_offset(_PREFIX.size + header_size, header.address_offset)
+
+
+def _optional_tuple(value: Optional[list]) -> Optional[tuple]:
+    return None if value is None else tuple(value)
+
+
+def _data_offset(header_size: int, address_offset: int) -> int:
+    return header_size + (address_offset - header_size) % PAGE_SIZE
+
+
+def _byte_span(shape: Tuple[int, ...], strides: Tuple[int, ...], itemsize: int) -> int:
+    if 0 in shape:
+        return 0
+    return sum((size - 1) * stride for size, stride in zip(shape, strides)) + itemsize
+
+
+def _layout_map_of(array: np.ndarray) -> allocators.BufferLayoutMap:
+    dims_layout = sorted(range(array.ndim), key=lambda dim: (-array.strides[dim], dim))
+    return tuple(dims_layout.index(dim) for dim in range(array.ndim))
+
+
+def _is_storable(array: np.ndarray, layout_map: allocators.BufferLayoutMap) -> bool:
+    # Non-negative strides of non-overlapping elements, with at most as much padding as data
+    extent = array.itemsize
+    for dim in sorted(range(array.ndim), key=layout_map.__getitem__, reverse=True):
+        if array.shape[dim] > 1:
+            stride = array.strides[dim]
+            if stride < extent or stride % array.itemsize:
+                return False
+            extent += (array.shape[dim] - 1) * stride
+    return _byte_span(array.shape, array.strides, array.itemsize) <= 2 * max(array.nbytes, 1)
+
+
+def _empty(header: BufferHeader) -> np.ndarray:
+    """Allocate a buffer with the layout and alignment of the array stored in a file."""
+    raw = np.empty(header.data_size + PAGE_SIZE, dtype=np.uint8)
+    offset = (header.address_offset - np.byte_bounds(raw)[0]) % PAGE_SIZE
+    return np.ndarray(
+        header.shape, dtype=header.dtype, buffer=raw, offset=offset, strides=header.strides
+    )
+
+
+def _bytes_of(array: np.ndarray) -> memoryview:
+    """Return the bytes spanned by a (storable) array in its buffer."""
+    span = _byte_span(array.shape, array.strides, array.itemsize)
+    if span == 0:
+        return memoryview(b"")
+    return np.lib.stride_tricks.as_strided(
+        array, shape=(span // array.itemsize,), strides=(array.itemsize,)
+    ).data.cast("B")
+
+
+def _transfer(
+    file: Any, data: memoryview, offset: int, *, write: bool, num_threads: int, chunk_size: int
+) -> None:
+    """Read or write `data` at `offset` of `file` in chunks distributed over several threads."""
+    chunk_starts = range(0, len(data), chunk_size)
+    num_threads = min(num_threads or allocators.default_num_threads(), len(chunk_starts))
+
+    if num_threads <= 1 or not hasattr(os, "preadv"):
+        file.seek(offset)
+        if write:
+            file.write(data)
+        else:
+            for start in chunk_starts:
+                chunk = data[start : start + chunk_size]
+                if file.readinto(chunk) != len(chunk):
+                    raise ValueError(f"Unexpected end of file '{file.name}'.")
+        return
+
+    file.flush()
+    fd = file.fileno()
+    errors: list[BaseException] = []
+
+    def transfer_chunks(k: int) -> None:
+        try:
+            # Static cyclic schedule of the chunks
+            for start in chunk_starts[k::num_threads]:
+                chunk = data[start : start + chunk_size]
+                while chunk:
+                    if write:
+                        count = os.pwrite(fd, chunk, offset + start)
+                    elif (count := os.preadv(fd, [chunk], offset + start)) == 0:
+                        raise ValueError(f"Unexpected end of file '{file.name}'.")
+                    chunk = chunk[count:]
+                    start += count
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=transfer_chunks, args=(k,)) for k in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+def write(
+    path: Union[str, os.PathLike],
+    array: core_defs.NDArrayObject,
+    *,
+    byte_alignment: Optional[int] = None,
+    aligned_index: Optional[Tuple[int, ...]] = None,
+    dims: Optional[Tuple[str, ...]] = None,
+    origin: Optional[Tuple[int, ...]] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+    num_threads: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> BufferHeader:
+    """
+    Write an array with its memory layout to a binary file.
+
+    Arrays with negative strides, overlapping elements or too much padding (e.g. strided
+    slices) are written as compact copies with the same order of the dimensions. Device
+    arrays are copied to the host first.
+
+    Args:
+        path: Path of the file (overwritten if it exists).
+        array: NumPy or CuPy array.
+        byte_alignment: Alignment (in bytes) of the buffer, stored in the header.
+        aligned_index: Index of the aligned element, stored in the header.
+        dims: Names of the dimensions, stored in the header.
+        origin: Origin of the computation domain, stored in the header.
+        metadata: Additional JSON-serializable data, stored in the header.
+        num_threads: Number of threads writing chunks of the data in parallel
+            (:func:`allocators.default_num_threads` if 0).
+        chunk_size: Size (in bytes) of the chunks of parallel writes.
+
+    Returns:
+        The header of the file.
+    """
+    if not isinstance(array, np.ndarray):
+        array = np.asarray(array.get() if hasattr(array, "get") else array)
+    # datetime and timedelta arrays do not support the buffer protocol
+    if array.dtype.fields is not None or array.dtype.hasobject or array.dtype.kind in "Mm":
+        raise ValueError(f"Arrays of dtype '{array.dtype}' cannot be saved.")
+    layout_map = _layout_map_of(array)
+    if not _is_storable(array, layout_map):
+        compact = np.ndarray(
+            tuple(array.shape[layout_map.index(i)] for i in range(array.ndim)), array.dtype
+        ).transpose(layout_map)
+        compact[...] = array
+        array = compact
+
+    header = BufferHeader(
+        shape=tuple(array.shape),
+        dtype=array.dtype,
+        strides=tuple(array.strides),
+        layout_map=layout_map,
+        address_offset=np.byte_bounds(array)[0] % PAGE_SIZE,
+        byte_alignment=byte_alignment,
+        aligned_index=_optional_tuple(aligned_index),
+        dims=_optional_tuple(dims),
+        origin=_optional_tuple(origin),
+        metadata=metadata or {},
+    )
+    header_bytes = header.to_bytes()
+    data = _bytes_of(array)
+    # write to a temporary file first, so a failed write never leaves a truncated file behind
+    # (not created by `tempfile.mkstemp`, which would restrict the permissions to the user)
+    folder, name = os.path.split(os.path.abspath(path))
+    tmp_path = os.path.join(folder, f".{name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp_path, "xb") as file:
+            file.write(header_bytes)
+            file.truncate(len(header_bytes) + len(data))
+            _transfer(
+                file,
+                data,
+                len(header_bytes),
+                write=True,
+                num_threads=num_threads,
+                chunk_size=chunk_size,
+            )
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return header
+
+
+def read_header(path: Union[str, os.PathLike]) -> BufferHeader:
+    """Read the header of a binary file (written by :func:`write`)."""
+    with open(path, "rb") as file:
+        return BufferHeader.from_file(file)[0]
+
+
+def read(
+    path: Union[str, os.PathLike],
+    out: Optional[core_defs.NDArrayObject] = None,
+    *,
+    overwrite_padding: bool = False,
+    num_threads: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Tuple[BufferHeader, core_defs.NDArrayObject]:
+    """
+    Read the array stored in a binary file (written by :func:`write`).
+
+    The data is read directly into the buffer of `out` if it has the same strides as the
+    stored array and no bytes between its elements would be overwritten (or this is allowed
+    by `overwrite_padding`), otherwise it is copied from a memory mapping of the file.
+
+    Args:
+        path: Path of the file.
+        out: Array (of the stored shape) to read into. If not passed, a new buffer with
+            the layout and alignment of the stored array is allocated.
+        overwrite_padding: Allow overwriting the bytes between the elements of `out`, e.g.
+            if it is a freshly allocated buffer with padding and not a view of a larger array.
+        num_threads: Number of threads reading chunks of the data in parallel
+            (:func:`allocators.default_num_threads` if 0).
+        chunk_size: Size (in bytes) of the chunks of parallel reads.
+
+    Returns:
+        The header of the file and the array.
+    """
+    with open(path, "rb") as file:
+        header, data_offset = BufferHeader.from_file(file)
+        if out is None:
+            out = _empty(header)
+            overwrite_padding = True
+        elif tuple(out.shape) != header.shape:
+            raise ValueError(f"Invalid shape {out.shape} to read an array of shape {header.shape}.")
+        if (
+            isinstance(out, np.ndarray)
+            and tuple(out.strides) == header.strides
+            and out.dtype == header.dtype
+            and out.flags.writeable
+            and (overwrite_padding or header.data_size == out.nbytes)
+        ):
+            _transfer(
+                file,
+                _bytes_of(out),
+                data_offset,
+                write=False,
+                num_threads=num_threads,
+                chunk_size=chunk_size,
+            )
+        else:
+            out[...] = _map(path, header, data_offset, "r")
+    return header, out
+
+
+def memory_map(
+    path: Union[str, os.PathLike], mode: MMapLoadMode = "r"
+) -> Tuple[BufferHeader, np.ndarray]:
+    """
+    Memory-map the array stored in a binary file (written by :func:`write`).
+
+    Args:
+        path: Path of the file.
+        mode: Read-only (`"r"`), read-write (`"r+"`) or copy-on-write (`"c"`) mapping.
+
+    Returns:
+        The header of the file and the array, with the strides and alignment of the
+        stored array.
+    """
+    if mode not in ("r", "r+", "c"):
+        raise ValueError(f"Invalid mmap mode '{mode}' (valid: 'r', 'r+', 'c').")
+    with open(path, "rb") as file:
+        header, data_offset = BufferHeader.from_file(file)
+    return header, _map(path, header, data_offset, mode)
+
+
+def _map(
+    path: Union[str, os.PathLike], header: BufferHeader, data_offset: int, mode: MMapLoadMode
+) -> np.ndarray:
+    if header.data_size == 0:
+        return np.empty(header.shape, dtype=header.dtype)
+    data = np.memmap(path, dtype=np.uint8, mode=mode, offset=data_offset, shape=header.data_size)
+    return np.ndarray(header.shape, dtype=header.dtype, buffer=data, strides=header.strides)
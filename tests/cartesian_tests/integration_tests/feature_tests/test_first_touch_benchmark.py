@@ -0,0 +1,86 @@
+# GT4Py - GridTools Framework
+#
+# Copyright (c) 2014-2023, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Stencil throughput after single-threaded vs parallel first touch of the storages.
+
+The effect is only visible on multi-socket (NUMA) nodes. Run as a script there, with
+``OMP_NUM_THREADS`` set to one thread per core and ``OMP_PROC_BIND=close``, e.g.
+``python test_first_touch_benchmark.py gt:cpu_ifirst 256 256 80``.
+"""
+
+import sys
+import time
+from typing import Tuple
+
+import numpy as np
+import pytest
+
+from gt4py import storage as gt_storage
+from gt4py.cartesian import gtscript
+from gt4py.cartesian.gtscript import PARALLEL, Field, computation, interval
+
+
+def laplacian(inp: Field[float], out: Field[float]):  # type: ignore
+    with computation(PARALLEL), interval(...):
+        out = (  # noqa: F841 # local variable 'out' is assigned to but never used
+            inp[1, 0, 0] + inp[-1, 0, 0] + inp[0, 1, 0] + inp[0, -1, 0] - 4.0 * inp[0, 0, 0]
+        )
+
+
+def run_benchmark(
+    backend: str, domain: Tuple[int, int, int], parallel_first_touch: bool, repeat: int = 20
+) -> Tuple[float, np.ndarray]:
+    """Return the mean stencil time (in seconds) and the result."""
+    stencil = gtscript.stencil(definition=laplacian, backend=backend)
+    shape = (domain[0] + 2, domain[1] + 2, domain[2])
+    inp = gt_storage.full(
+        shape,
+        1.0,
+        backend=backend,
+        aligned_index=(1, 1, 0),
+        parallel_first_touch=parallel_first_touch,
+    )
+    inp[1:-1, 1:-1] = np.random.default_rng(0).random(domain)
+    out = gt_storage.zeros(
+        shape, backend=backend, aligned_index=(1, 1, 0), parallel_first_touch=parallel_first_touch
+    )
+
+    stencil(inp, out, origin=(1, 1, 0), domain=domain)  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        stencil(inp, out, origin=(1, 1, 0), domain=domain)
+    return (time.perf_counter() - start) / repeat, np.asarray(out)
+
+
+@pytest.mark.slow
+def test_first_touch_benchmark():
+    domain = (64, 64, 16)
+    _, reference = run_benchmark("gt:cpu_ifirst", domain, parallel_first_touch=False, repeat=1)
+    _, result = run_benchmark("gt:cpu_ifirst", domain, parallel_first_touch=True, repeat=1)
+    assert np.array_equal(result, reference)
+
+
+if __name__ == "__main__":
+    backend = sys.argv[1] if len(sys.argv) > 1 else "gt:cpu_ifirst"
+    domain = tuple(int(arg) for arg in sys.argv[2:5]) or (256, 256, 80)
+    for parallel_first_touch in (False, True):
+        seconds, _ = run_benchmark(backend, domain, parallel_first_touch)
+        # one read and one write of the domain
+        gbytes_per_second = 2 * np.prod(domain) * 8 / seconds / 1e9
+        print(
+            f"parallel_first_touch={parallel_first_touch!s:5}",
+            f"stencil {seconds * 1e3:7.2f} ms ({gbytes_per_second:5.1f} GB/s)",
+            flush=True,
+        )
@@ -14,14 +14,19 @@
 
 """Integration tests for StencilObjects."""
 
+import threading
 import typing
 from typing import Any, Dict
 
+import numpy as np
 import pytest
 
 from gt4py import storage as gt_storage
 from gt4py.cartesian import gtscript
+from gt4py.cartesian.gtc.numpy.temporary_pool import TemporaryBufferPool, TemporaryPoolBudget
 from gt4py.cartesian.gtscript import PARALLEL, Field, computation, interval
+from gt4py.cartesian.stencil_object import DomainOriginCache
+from gt4py.eve import datamodels
 
 from cartesian_tests.definitions import ALL_BACKENDS
 from cartesian_tests.utils import OriginWrapper
@@ -74,6 +79,206 @@ def test_stencil_object_cache(backend: str):
     assert cleaned_cache_time > fast_time
 
 
+@pytest.mark.parametrize("backend", ["numpy"])
+def test_stencil_object_cache_stats(backend: str):
+    @gtscript.stencil(backend=backend)
+    def stencil(in_field: Field[float], out_field: Field[float]):
+        with computation(PARALLEL), interval(...):
+            out_field = in_field  # noqa: F841
+
+    stencil.clean_call_args_cache()
+    in_storage = gt_storage.ones(backend=backend, shape=(4, 4, 4), dtype=float)
+    out_storage = gt_storage.zeros(backend=backend, shape=(4, 4, 4), dtype=float)
+
+    stencil(in_storage, out_storage)
+    stencil(in_storage, out_storage)
+    stencil(in_storage, out_storage, domain=(2, 2, 2))
+    stencil(in_storage, out_storage, domain=[2, 2, 2])
+
+    info = stencil.call_args_cache_info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (2, 2, 0, 2)
+
+    # A different dtype must not reuse the cached (already validated) entry
+    with pytest.raises(TypeError, match="dtype"):
+        stencil(in_storage, gt_storage.zeros(backend=backend, shape=(4, 4, 4), dtype=int))
+
+
+@pytest.mark.parametrize("backend", ["numpy"])
+def test_stencil_object_fast_call_path(backend: str):
+    @gtscript.stencil(backend=backend)
+    def stencil(in_field: Field[float], out_field: Field[float], *, offset: float):
+        with computation(PARALLEL), interval(...):
+            out_field = in_field + offset  # noqa: F841
+
+    stencil.clean_call_args_cache()
+    in_storage = gt_storage.ones(backend=backend, shape=(4, 4, 4), dtype=float)
+    out_storage = gt_storage.zeros(backend=backend, shape=(4, 4, 4), dtype=float)
+
+    stencil(in_storage, out_storage, offset=1.0)
+    assert len(stencil._fast_call_cache) == 1
+    assert stencil.call_args_cache_info().misses == 1
+
+    # Second call goes directly to `run` without touching the domain/origin cache
+    stencil(in_storage, out_storage, offset=2.0)
+    assert (out_storage == 3.0).all()
+    assert stencil._fast_call_cache.info().hits == 1
+    assert stencil._domain_origin_cache.info().hits == 0
+    assert stencil.call_args_cache_info() == (1, 1, 0, stencil._domain_origin_cache.maxsize, 1)
+
+    # Views with the same shape but other strides are validated again
+    strided_in_storage = gt_storage.ones(backend=backend, shape=(4, 8, 4), dtype=float)[:, ::2]
+    stencil(strided_in_storage, out_storage, offset=2.0)
+    assert (out_storage == 3.0).all()
+    assert len(stencil._fast_call_cache) == 2
+
+    stencil(in_storage, out_storage, offset=1.0, domain=(2, 2, 2), origin=(1, 1, 1))
+    assert (out_storage[1:3, 1:3, 1:3] == 2.0).all()
+    assert (out_storage[0] == 3.0).all()
+
+    # A new signature (here: parameter type) is validated again
+    with pytest.raises(TypeError, match="parameter"):
+        stencil(in_storage, out_storage, offset=1)
+
+    # Arguments which are not plain arrays never use the fast path
+    wrapped_out_storage = OriginWrapper(array=out_storage, origin=(0, 0, 0))
+    stencil(in_storage, wrapped_out_storage, offset=4.0)
+    stencil(in_storage, wrapped_out_storage, offset=4.0)
+    assert (out_storage == 5.0).all()
+    assert len(stencil._fast_call_cache) == 3
+
+    stencil.clean_call_args_cache()
+    assert len(stencil._fast_call_cache) == 0
+
+
+def test_domain_origin_cache_lru_eviction():
+    cache = DomainOriginCache(maxsize=2)
+    cache.put("a", ((1, 1, 1), {}))
+    cache.put("b", ((2, 2, 2), {}))
+    assert cache.get("a") == ((1, 1, 1), {})
+    cache.put("c", ((3, 3, 3), {}))
+
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert cache.get("b") is None
+    assert cache.info() == (1, 1, 1, 2, 2)
+
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 2, 0)
+
+
+def test_domain_origin_cache_disabled():
+    cache = DomainOriginCache(maxsize=0)
+    cache.put("a", ((1, 1, 1), {}))
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError):
+        DomainOriginCache(maxsize=-1)
+
+
+def test_numpy_temporary_pool():
+    @gtscript.stencil(backend="numpy")
+    def stencil(in_field: Field[float], out_field: Field[float]):
+        with computation(PARALLEL), interval(...):
+            tmp = in_field + 1.0
+            out_field = tmp[1, 0, 0] * 2.0  # noqa: F841
+
+    stencil.clean_temporary_pool()
+    in_storage = gt_storage.ones(backend="numpy", shape=(6, 4, 3), dtype=float)
+    out_storage = gt_storage.zeros(backend="numpy", shape=(6, 4, 3), dtype=float)
+
+    stencil(in_storage, out_storage, domain=(5, 4, 3))
+    stencil(in_storage, out_storage, domain=(5, 4, 3))
+    assert (out_storage[:5] == 4.0).all()
+    info = stencil.temporary_pool_info()
+    assert (info.hits, info.misses) == (1, 1)
+    assert info.currbytes >= 5 * 4 * 3 * np.dtype(float).itemsize
+
+    # a different domain shape uses different buffers
+    stencil(in_storage, out_storage, domain=(4, 4, 3))
+    assert stencil.temporary_pool_info().misses == 2
+
+    stencil.clean_temporary_pool()
+    assert stencil.temporary_pool_info() == (0, 0, 0, info.maxbytes, 0)
+
+
+def test_numpy_temporary_pools_are_per_stencil():
+    @gtscript.stencil(backend="numpy")
+    def stencil_a(in_field: Field[float], out_field: Field[float]):
+        with computation(PARALLEL), interval(...):
+            tmp = in_field + 1.0
+            out_field = tmp[1, 0, 0]  # noqa: F841
+
+    @gtscript.stencil(backend="numpy")
+    def stencil_b(in_field: Field[float], out_field: Field[float]):
+        with computation(PARALLEL), interval(...):
+            tmp = in_field * 2.0
+            out_field = tmp[1, 0, 0]  # noqa: F841
+
+    # the pools only share the process-wide byte budget
+    assert stencil_a._temporary_pool is not stencil_b._temporary_pool
+    assert stencil_a._temporary_pool.budget is stencil_b._temporary_pool.budget
+
+    in_storage = gt_storage.ones(backend="numpy", shape=(6, 4, 3), dtype=float)
+    out_storage = gt_storage.zeros(backend="numpy", shape=(6, 4, 3), dtype=float)
+    stencil_a(in_storage, out_storage, domain=(5, 4, 3))
+    stencil_b.clean_temporary_pool()
+    stencil_b(in_storage, out_storage, domain=(5, 4, 3))
+    assert (out_storage[:5] == 2.0).all()
+    assert stencil_b.temporary_pool_info().misses == 1
+
+    # cleaning one pool does not affect the others
+    stencil_b.clean_temporary_pool()
+    assert stencil_a.temporary_pool_info().currbytes > 0
+    assert stencil_b.temporary_pool_info().currbytes == 0
+
+
+def test_temporary_pool_budget():
+    budget = TemporaryPoolBudget(maxbytes=3 * 8 * 10)
+    first, second = (TemporaryBufferPool(maxbytes=None, budget=budget) for _ in range(2))
+    with first.lease() as lease:
+        lease.empty((10,), np.float64)
+        lease.empty((10,), np.float64)
+    assert budget.currbytes == 160
+
+    # buffers exceeding the budget are dropped unless the pool can evict its own buffers
+    with second.lease() as lease:
+        lease.empty((10,), np.float64)
+        lease.empty((10,), np.float64)
+    assert (second.info().evictions, second.info().currbytes, budget.currbytes) == (1, 80, 240)
+    with first.lease() as lease:
+        lease.empty((20,), np.float64)
+    assert (first.info().evictions, first.info().currbytes, budget.currbytes) == (2, 160, 240)
+
+    # buffers in use do not count
+    with second.lease() as lease:
+        lease.empty((10,), np.float64)
+        assert budget.currbytes == 160
+    first.clear()
+    assert budget.currbytes == 80
+
+
+def test_temporary_pool_bounded_lru():
+    pool = TemporaryBufferPool(maxbytes=2 * 8 * 10)
+    with pool.lease() as lease:
+        a = lease.empty((10,), np.float64)
+        b = lease.empty((10,), np.float64)
+        lease.empty((5,), np.float64)
+    assert pool.info() == (0, 3, 1, 160, 120)
+
+    with pool.lease() as lease:
+        # buffers in use are never handed out twice
+        assert {id(lease.empty((10,), np.float64)) for _ in range(3)} & {id(a), id(b)}
+        assert len({id(buffer) for buffer in lease.buffers}) == 3
+
+    disabled = TemporaryBufferPool(maxbytes=0)
+    with disabled.lease() as lease:
+        lease.empty((10,), np.float64)
+    assert disabled.info().currbytes == 0
+
+    with pytest.raises(ValueError):
+        TemporaryBufferPool(maxbytes=-1)
+
+
 @pytest.mark.parametrize("backend", ALL_BACKENDS)
 def test_warning_for_unsupported_backend_option(backend):
     with pytest.warns(RuntimeWarning, match="Unknown option"):
@@ -82,3 +287,62 @@ def test_warning_for_unsupported_backend_option(backend):
         def foo(f: Field[float]):
             with computation(PARALLEL), interval(...):  # type: ignore
                 f = 42.0  # noqa F841
+
+
+def test_stencil_without_root_validation():
+    # root validators deriving data (symbol tables, dtypes) still run
+    with datamodels.validation_settings(field_types=False, root_validators=False):
+
+        @gtscript.stencil(backend="numpy", rebuild=True)
+        def stencil(in_field: Field[float], out_field: Field[float]):
+            with computation(PARALLEL), interval(...):
+                tmp = -in_field + 1.0
+                out_field = tmp * 2.0 if in_field > 0.0 else tmp  # noqa: F841
+
+    in_storage = gt_storage.ones(backend="numpy", shape=(3, 3, 3), dtype=float)
+    out_storage = gt_storage.ones(backend="numpy", shape=(3, 3, 3), dtype=float)
+    stencil(in_storage, out_storage)
+    assert (out_storage == 0.0).all()
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("release_gil", [True, False])
+def test_release_gil_overlapping_threads(release_gil: bool):
+    backend = "gt:cpu_ifirst"
+
+    def long_running(in_field: Field[float], out_field: Field[float]):
+        with computation(PARALLEL), interval(...):
+            tmp = in_field * in_field + 1.0
+            tmp = tmp * tmp / (tmp + 1.0) + in_field
+            tmp = tmp * tmp / (tmp + 2.0) - in_field
+            out_field = tmp * tmp / (tmp + 3.0)  # noqa: F841
+
+    stencil = gtscript.stencil(definition=long_running, backend=backend, release_gil=release_gil)
+
+    shape = (512, 512, 80)
+    storages = [
+        (
+            gt_storage.ones(backend=backend, shape=shape, dtype=float),
+            gt_storage.zeros(backend=backend, shape=shape, dtype=float),
+        )
+        for _ in range(2)
+    ]
+    barrier = threading.Barrier(2)
+    intervals = []
+
+    def run(in_storage, out_storage):
+        barrier.wait()
+        exec_info: Dict[str, Any] = {}
+        stencil(in_storage, out_storage, exec_info=exec_info)
+        intervals.append((exec_info["run_cpp_start_time"], exec_info["run_cpp_end_time"]))
+
+    threads = [threading.Thread(target=run, args=args) for args in storages]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # The timestamps are taken in the bindings while holding the GIL, so the second kernel
+    # can only start before the first one has finished if the GIL is released in between.
+    (first_start, first_end), (second_start, second_end) = sorted(intervals)
+    assert (second_start < first_end) == release_gil
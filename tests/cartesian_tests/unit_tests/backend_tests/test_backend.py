@@ -140,6 +140,24 @@ def test_device_sync_option_registered(backend_name):
     assert backend_opts[option_name]["type"] is bool
 
 
+@pytest.mark.parametrize("backend_name", ["gt:cpu_ifirst", "gt:cpu_kfirst"])
+@pytest.mark.parametrize("release_gil", (True, False, None))
+def test_release_gil_option(backend_name, release_gil):
+    backend_cls = backend_registry[backend_name]
+    builder = StencilBuilder(stencil_def, backend=backend_cls).with_externals({"MODE": 2})
+    if release_gil is not None:
+        builder.options.backend_opts["release_gil"] = release_gil
+    bindings = builder.backend.generate_bindings("python")
+    source = "".join(bindings[f"{builder.options.name}_src"].values())
+
+    if release_gil is False:
+        assert "gil_scoped_release" not in source
+    else:
+        # The GIL is only released around the computation, after the SIDs have been created
+        assert source.index("make_tuple(") < source.index("gil_scoped_release")
+        assert source.index("gil_scoped_release") < source.index("std::apply(")
+
+
 @pytest.mark.parametrize("rebuild", (True, False))
 @pytest.mark.parametrize("backend_name", CPU_BACKENDS)
 @pytest.mark.parametrize("mode", (2,))
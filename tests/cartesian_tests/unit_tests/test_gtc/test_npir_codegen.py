@@ -209,7 +209,10 @@ def test_temp_definition() -> None:
         TemporaryDeclFactory(name="a", offset=(1, 2), padding=(3, 4), dtype=common.DataType.FLOAT32)
     )
     print(result)
-    assert result == "a = Field.empty((_dI_ + 3, _dJ_ + 4, _dK_), np.float32, (1, 2, 0))"
+    assert (
+        result
+        == "a = Field.empty((_dI_ + 3, _dJ_ + 4, _dK_), np.float32, (1, 2, 0), _temporaries_)"
+    )
 
 
 def test_vector_arithmetic() -> None:
@@ -299,7 +302,8 @@ def test_computation() -> None:
             r"import numbers\n"
             r"from typing import Tuple\n+"
             r"import numpy as np\n"
-            r"from gt4py.cartesian.gtc import ufuncs\n+"
+            r"from gt4py.cartesian.gtc import ufuncs\n"
+            r"from gt4py.cartesian.gtc.numpy.temporary_pool import TemporaryBufferPool\n+"
             r"class Field:\n"
             r"(.*\n)+"
             r"def run\(\*, a, b, _domain_, _origin_\):\n"
@@ -15,6 +15,7 @@
 from gt4py.cartesian.gtc.passes.oir_optimizations.caches import FillFlushToLocalKCaches
 from gt4py.cartesian.gtc.passes.oir_optimizations.vertical_loop_merging import AdjacentLoopMerging
 from gt4py.cartesian.gtc.passes.oir_pipeline import DefaultPipeline
+from gt4py.eve import instrumentation
 
 from .oir_utils import StencilFactory
 
@@ -37,3 +38,13 @@ def test_add_steps():
     pipeline = DefaultPipeline(add_steps=add_steps)
     pipeline.run(StencilFactory())
     assert all(s in pipeline.add_steps for s in add_steps)
+
+
+def test_pass_instrumentation():
+    with instrumentation.profile_passes(count_nodes=False) as profile:
+        DefaultPipeline().run(StencilFactory())
+
+    assert [record.name for record in profile.records] == [
+        step.__name__ for step in DefaultPipeline.all_steps()
+    ]
+    assert all(record.category == "oir" for record in profile.records)
@@ -219,3 +219,62 @@ def test_templated_generator(templated_generator, fixed_compound_node):
 def test_templated_generator_exceptions(faulty_templated_generator, fixed_compound_node):
     with pytest.raises(codegen.TemplateRenderingError, match="when rendering node"):
         faulty_templated_generator.apply(fixed_compound_node)
+
+
+def test_template_compilation_reuse():
+    source = "${a} + ${b}"
+    assert codegen.MakoTemplate(source).definition is codegen.MakoTemplate(source).definition
+    source = "{{ a }} + {{ b }}"
+    assert codegen.JinjaTemplate(source).definition is codegen.JinjaTemplate(source).definition
+
+    template = codegen.FormatTemplate("{a} + {b}")
+    assert template.render(a=1, b=2) == "1 + 2"
+    assert template.render(a="x", b="y") == "x + y"
+
+
+def test_format_source_cache(monkeypatch):
+    calls = []
+
+    def formatter(source: str, *, suffix: str = "") -> str:
+        calls.append(source)
+        return source.upper() + suffix
+
+    monkeypatch.setitem(codegen.SOURCE_FORMATTERS, "_test_language", formatter)
+
+    assert codegen.format_source("_test_language", "abc") == "ABC"
+    assert codegen.format_source("_test_language", "abc") == "ABC"
+    assert codegen.format_source("_test_language", "abc", suffix="!") == "ABC!"
+    assert codegen.format_source("_test_language", "def") == "DEF"
+    assert calls == ["abc", "abc", "def"]
+
+
+class MemoLeaf(eve.FrozenNode):
+    value: int
+
+
+class MemoPair(eve.FrozenNode):
+    left: MemoLeaf
+    right: MemoLeaf
+
+
+class _MemoTestGenerator(codegen.TemplatedGenerator):
+    MEMOIZE_RENDERS = True
+
+    MemoPair = codegen.FormatTemplate("({left}, {right})")
+
+    def visit_MemoLeaf(self, node, *, prefix="", **kwargs):
+        self.visited.append(node.value)
+        return f"{prefix}{node.value}"
+
+
+def test_templated_generator_memoization():
+    generator = _MemoTestGenerator()
+    generator.visited = []
+    node = MemoPair(left=MemoLeaf(value=1), right=MemoLeaf(value=1))
+
+    assert generator.visit(node) == "(1, 1)"
+    assert generator.visited == [1]
+    assert generator.visit(node, prefix="x") == "(x1, x1)"
+    assert generator.visited == [1, 1]
+    assert generator.visit(MemoPair(left=MemoLeaf(value=2), right=MemoLeaf(value=1))) == "(2, 1)"
+    assert generator.visited == [1, 1, 2]
@@ -126,6 +126,25 @@ class TestNode:
             )
         )
 
+    def test_cached_hash(self):
+        node = definitions.make_frozen_simple_node(fixed=True)
+        other = definitions.make_frozen_simple_node(fixed=True)
+        different = definitions.make_frozen_simple_node()
+
+        assert node == other and node is not other
+        assert hash(node) == hash(other)
+        assert node.__dict__["__node_hash__"] == hash(node)
+        assert node != different
+
+        # Different cached hashes short-circuit the comparison
+        object.__setattr__(other, "__node_hash__", hash(node) + 1)
+        assert node != other
+        assert node == node
+
+        for node_copy in (copy.copy(node), copy.deepcopy(node)):
+            assert node_copy == node
+            assert "__node_hash__" not in node_copy.__dict__
+
 
 class TestEqNonlocated:
     def test_source_location(self):
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import enum
+import threading
 import types
 import typing
 from typing import Set  # noqa: F401 # imported but unused (used in exec() context)
@@ -968,6 +969,63 @@ def test_root_validators_in_subclasses():
         Model(int_value=1, float_value=1.0, str_value="1")
 
 
+def test_validation_settings():
+    assert datamodels.get_validation_settings() == (True, True)
+
+    with datamodels.validation_settings(field_types=False) as settings:
+        assert settings == datamodels.ValidationSettings(field_types=False, root_validators=True)
+        assert ModelWithValidators(str_value=0).str_value == 0
+        with pytest.raises(ValueError, match="int_value"):
+            ModelWithValidators(int_value=-1)
+        with pytest.raises(ValueError, match="float_value"):
+            ModelWithRootValidators(int_value=1, float_value=1, str_value="")
+
+    with datamodels.validation_settings(root_validators=False):
+        ModelWithRootValidators(int_value=1, float_value=1.0, str_value="")
+        with pytest.raises(TypeError, match="float_value"):
+            ModelWithRootValidators(int_value=1, float_value=1, str_value="")
+
+    assert datamodels.get_validation_settings() == (True, True)
+    with pytest.raises(TypeError, match="str_value"):
+        ModelWithValidators(str_value=0)
+
+
+def test_deriving_root_validators_always_run():
+    @datamodels.datamodel
+    class Model:
+        value: int
+
+        @datamodels.root_validator(derives_data=True)
+        @classmethod
+        def _derive(cls, instance):
+            object.__setattr__(instance, "derived", instance.value + 1)
+
+        @datamodels.root_validator
+        @classmethod
+        def _check(cls, instance):
+            if instance.value < 0:
+                raise ValueError("value")
+
+    with datamodels.validation_settings(root_validators=False):
+        assert Model(value=-1).derived == 0
+    with pytest.raises(ValueError, match="value"):
+        Model(value=-1)
+
+
+def test_validation_settings_are_context_local():
+    results = []
+    with datamodels.validation_settings(field_types=False, root_validators=False):
+        thread = threading.Thread(
+            target=lambda: results.append(datamodels.get_validation_settings())
+        )
+        thread.start()
+        thread.join()
+        assert datamodels.get_validation_settings() == (False, False)
+    assert results == [(True, True)]
+    with pytest.raises(ValueError, match="float_value"):
+        ModelWithRootValidators(int_value=1, float_value=1.0, str_value="")
+
+
 # Test field options
 def test_field_init():
     @datamodels.datamodel
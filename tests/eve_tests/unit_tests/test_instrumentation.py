@@ -0,0 +1,126 @@
+# GT4Py - GridTools Framework
+#
+# Copyright (c) 2014-2023, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import json
+import threading
+from typing import List
+
+import pytest
+
+from gt4py import eve
+from gt4py.eve import instrumentation
+
+
+class SampleNode(eve.Node):
+    children: List[SampleNode]
+
+
+def _chain(length: int) -> SampleNode:
+    node = SampleNode(children=[])
+    for _ in range(length - 1):
+        node = SampleNode(children=[node])
+    return node
+
+
+def _drop_first(node: SampleNode) -> SampleNode:
+    return node.children[0]
+
+
+def test_run_pass_without_profile():
+    assert instrumentation.active_profile() is None
+    assert instrumentation.run_pass("test", "drop", _drop_first, _chain(3)) == _chain(2)
+
+
+def test_profile_passes():
+    with instrumentation.profile_passes() as profile:
+        assert instrumentation.active_profile() is profile
+        node = _chain(4)
+        for i in range(2):
+            node = instrumentation.run_pass("test", "drop", _drop_first, node, iteration=i)
+        instrumentation.record_iterations("test", "loop", 2)
+
+        with instrumentation.profile_passes(count_nodes=False) as inner_profile:
+            instrumentation.run_pass("test", "inner", _drop_first, node)
+        assert instrumentation.active_profile() is profile
+
+    assert instrumentation.active_profile() is None
+    assert [
+        (record.name, record.nodes_before, record.nodes_after, record.iteration)
+        for record in profile.records
+    ] == [("drop", 4, 3, 0), ("drop", 3, 2, 1)]
+    assert profile.records[0].start <= profile.records[1].start
+    assert profile.iterations == {"test:loop": [2]}
+    assert profile.summary() == [
+        {
+            "category": "test",
+            "name": "drop",
+            "calls": 2,
+            "time": pytest.approx(sum(record.duration for record in profile.records)),
+        }
+    ]
+    assert [(record.name, record.nodes_before) for record in inner_profile.records] == [
+        ("inner", None)
+    ]
+
+
+def test_profile_passes_is_context_local():
+    entered, done = threading.Event(), threading.Event()
+    thread_records = []
+
+    def profile_in_thread():
+        with instrumentation.profile_passes() as profile:
+            entered.set()
+            done.wait(10)
+            instrumentation.run_pass("test", "thread", _drop_first, _chain(2))
+        thread_records.extend(record.name for record in profile.records)
+
+    thread = threading.Thread(target=profile_in_thread)
+    thread.start()
+    assert entered.wait(10)
+    with instrumentation.profile_passes() as profile:
+        # the profile of the other thread is still active, but does not record these passes
+        instrumentation.run_pass("test", "main", _drop_first, _chain(2))
+        done.set()
+        thread.join()
+        assert instrumentation.active_profile() is profile
+    assert instrumentation.active_profile() is None
+
+    assert [record.name for record in profile.records] == ["main"]
+    assert thread_records == ["thread"]
+
+
+@pytest.mark.parametrize("format", ["json", "chrome"])
+def test_dump(tmp_path, format):
+    with instrumentation.profile_passes() as profile:
+        instrumentation.run_pass("test", "drop", _drop_first, _chain(2), iteration=0)
+        instrumentation.record_iterations("test", "loop", 1)
+
+    path = tmp_path / "profile.json"
+    profile.dump(path, format=format)
+    data = json.loads(path.read_text())
+
+    if format == "json":
+        assert data["summary"][0]["name"] == "drop"
+        assert data["iterations"] == {"test:loop": [1]}
+        assert data["passes"][0]["nodes_before"] == 2
+    else:
+        (event,) = data["traceEvents"]
+        assert event["name"] == "drop" and event["cat"] == "test" and event["ph"] == "X"
+        assert event["args"] == {"nodes_before": 2, "nodes_after": 1, "iteration": 0}
+        assert data["otherData"]["iterations"] == {"test:loop": [1]}
+
+    with pytest.raises(ValueError, match="format"):
+        profile.dump(path, format="csv")
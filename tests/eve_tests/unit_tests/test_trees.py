@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import sys
 from typing import List, Union
 
 import pytest
@@ -106,3 +107,50 @@ def test_iter_tree(tree):
         traversals.append([value for value in eve.trees.walk_values(tree, order)])
 
     assert all(len(traversals[0]) == len(t) for t in traversals)
+
+
+def test_walk_items_order():
+    tree = [1, [2], {"a": (3, "s")}]
+
+    assert [*eve.trees.pre_walk_items(tree)] == [
+        (None, tree),
+        (0, 1),
+        (1, [2]),
+        (0, 2),
+        (2, {"a": (3, "s")}),
+        ("a", (3, "s")),
+        (0, 3),
+        (1, "s"),
+    ]
+    assert [*eve.trees.post_walk_items(tree)] == [
+        (0, 1),
+        (0, 2),
+        (1, [2]),
+        (0, 3),
+        (1, "s"),
+        ("a", (3, "s")),
+        (2, {"a": (3, "s")}),
+        (None, tree),
+    ]
+    assert [*eve.trees.bfs_walk_items(tree)] == [
+        (None, tree),
+        (0, 1),
+        (1, [2]),
+        (2, {"a": (3, "s")}),
+        (0, 2),
+        ("a", (3, "s")),
+        (0, 3),
+        (1, "s"),
+    ]
+
+
+def test_walk_deep_tree():
+    depth = 5 * sys.getrecursionlimit()
+    tree = SampleTree(children=[0])
+    for i in range(1, depth):
+        tree = SampleTree(children=[i, tree])
+
+    for order in eve.trees.TraversalOrder:
+        values = [value for _, value in eve.trees.walk_items(tree, order)]
+        assert len(values) == 3 * depth
+        assert [value for value in values if isinstance(value, int)] == [*reversed(range(depth))]
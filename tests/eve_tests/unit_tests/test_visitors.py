@@ -28,3 +28,111 @@ def test_annex_preservation(compound_node: eve.Node):
 
     assert translated_node.annex.foo == 1
     assert not hasattr(translated_node.annex, "bar")
+
+
+def test_dispatch_order(compound_node: eve.Node):
+    class BaseVisitor(eve.NodeVisitor):
+        def visit_Node(self, node: eve.Node, **kwargs):
+            kwargs["visited"].append("Node")
+            self.generic_visit(node, **kwargs)
+
+    class SampleVisitor(BaseVisitor):
+        def visit_SimpleNode(self, node: eve.Node, **kwargs):
+            kwargs["visited"].append(type(node).__name__)
+
+        def visit_int(self, node: int, **kwargs):
+            kwargs["visited"].append("int")
+
+    for _ in range(2):  # the second visit uses the cached dispatch
+        visited: list[str] = []
+        SampleVisitor().visit(compound_node, visited=visited)
+        assert visited[0] == "Node"
+        assert "SimpleNode" in visited and "int" in visited
+
+    assert SampleVisitor._dispatch_cache_[type(compound_node)] == "visit_Node"
+    assert SampleVisitor._dispatch_cache_[str] is None
+    assert BaseVisitor._dispatch_cache_ == {}
+
+
+def test_late_added_visitor_methods():
+    class BaseVisitor(eve.NodeVisitor):
+        def generic_visit(self, node, **kwargs):
+            return "generic"
+
+    class SampleVisitor(BaseVisitor):
+        pass
+
+    assert SampleVisitor().visit(1) == "generic"
+
+    # methods added to the class or one of its bases after a visit are used
+    BaseVisitor.visit_int = lambda self, node, **kwargs: "base"
+    assert SampleVisitor().visit(1) == "base"
+    SampleVisitor.visit_int = lambda self, node, **kwargs: "sample"
+    assert SampleVisitor().visit(1) == "sample"
+    del SampleVisitor.visit_int
+    assert SampleVisitor().visit(1) == "base"
+
+    # as well as methods of an instance
+    visitor = SampleVisitor()
+    visitor.visit_str = lambda node, **kwargs: "instance"
+    assert visitor.visit("a") == "instance"
+    assert SampleVisitor().visit("a") == "generic"
+
+
+def test_structural_sharing(compound_node: eve.Node):
+    class Identity(eve.NodeTranslator):
+        pass
+
+    class CopyingIdentity(eve.NodeTranslator):
+        REUSE_UNCHANGED_NODES = False
+
+    assert Identity().visit(compound_node) is compound_node
+
+    copied_node = CopyingIdentity().visit(compound_node)
+    assert copied_node == compound_node and copied_node is not compound_node
+    assert copied_node.simple is not compound_node.simple
+
+
+def test_structural_sharing_of_unchanged_subtrees(compound_node: eve.Node):
+    class IncrementInts(eve.NodeTranslator):
+        def visit_int(self, value: int) -> int:
+            return value + 1
+
+        def visit_SimpleNodeWithLoc(self, node: eve.Node) -> eve.Node:
+            return node
+
+    new_node = IncrementInts().visit(compound_node)
+    assert new_node is not compound_node
+    assert new_node.simple.int_value == compound_node.simple.int_value + 1
+    assert new_node.simple_loc is compound_node.simple_loc
+
+
+def test_structural_sharing_never_shares_mutable_containers(
+    simple_node_with_collections: eve.Node,
+):
+    class MoveLocation(eve.NodeTranslator):
+        def visit_SourceLocation(self, loc: eve.SourceLocation) -> eve.SourceLocation:
+            return eve.SourceLocation(line=loc.line + 1, column=loc.column, filename=loc.filename)
+
+    node = simple_node_with_collections
+    new_node = MoveLocation().visit(node)
+    assert new_node.loc.line == node.loc.line + 1
+    for name in ("int_list", "str_set", "str_to_int_dict"):
+        assert getattr(new_node, name) == getattr(node, name)
+        assert getattr(new_node, name) is not getattr(node, name)
+
+
+def test_structural_sharing_respects_annex(compound_node: eve.Node):
+    compound_node.annex.foo = 1
+
+    class Identity(eve.NodeTranslator):
+        pass
+
+    class PreservingIdentity(eve.NodeTranslator):
+        PRESERVED_ANNEX_ATTRS = ("foo",)
+
+    # the annex attribute would be dropped in a new node, so the node is rebuilt
+    new_node = Identity().visit(compound_node)
+    assert new_node is not compound_node and new_node == compound_node
+    assert not hasattr(new_node.annex, "foo")
+    assert PreservingIdentity().visit(compound_node) is compound_node
@@ -20,6 +20,7 @@ import numpy as np
 import pytest
 
 import gt4py.next as gtx
+from gt4py.next.type_system import type_translation
 
 from next_tests.integration_tests import cases
 from next_tests.integration_tests.cases import IDim, Ioff, JDim, cartesian_case, fieldview_backend
@@ -51,6 +52,32 @@ def test_identity_fo_execution(cartesian_case, identity_def):
     )
 
 
+def test_fo_direct_call_reuses_program(cartesian_case, identity_def):
+    identity = gtx.field_operator(identity_def, backend=cartesian_case.backend)
+    if identity.backend is None:
+        pytest.skip("Embedded execution does not generate programs.")
+
+    in_field = cases.allocate(cartesian_case, identity, "in_field").strategy(
+        cases.ConstInitializer(1)
+    )()
+    out_field = cases.allocate(cartesian_case, identity, "in_field").strategy(
+        cases.ConstInitializer(0)
+    )()
+
+    for _ in range(3):
+        identity(in_field, out=out_field, offset_provider={})
+    assert np.allclose(out_field.asnumpy(), 1)
+    assert identity.program_lowering_count == 1
+
+    other_identity = identity.with_backend(identity.backend)
+    arg_types = [type_translation.from_value(in_field)]
+    program = other_identity.as_program(arg_types, {})
+    assert other_identity.program_lowering_count == 0
+    other_identity(in_field, out=out_field, offset_provider={})
+    assert other_identity.as_program(arg_types, {}) is program
+    assert other_identity.program_lowering_count == 1
+
+
 @pytest.mark.uses_cartesian_shift
 def test_shift_by_one_execution(cartesian_case):
     @gtx.field_operator
@@ -16,6 +16,7 @@ import numpy as np
 import pytest
 
 import gt4py.next as gtx
+from gt4py.next import config
 from gt4py.next.iterator import transforms
 from gt4py.next.iterator.builtins import (
     deref,
@@ -24,12 +25,14 @@ from gt4py.next.iterator.builtins import (
     make_const_list,
     map_,
     multiplies,
+    named_range,
     neighbors,
     plus,
     reduce,
     shift,
+    unstructured_domain,
 )
-from gt4py.next.iterator.runtime import fundef
+from gt4py.next.iterator.runtime import closure, fendef, fundef
 from gt4py.next.program_processors.runners import gtfn
 
 from next_tests.toy_connectivity import (
@@ -485,3 +488,56 @@ def test_sparse_shifted_stencil_reduce(program_processor, lift_mode):
 
     if validate:
         assert np.allclose(out.asnumpy(), ref)
+
+
+@fundef
+def sum_edge_vertices(inp):
+    return deref(shift(E2V, 0)(inp)) + deref(shift(E2V, 1)(inp))
+
+
+@fundef
+def sum_edge_vertices_to_vertices(inp):
+    return reduce(plus, 0)(neighbors(V2E, lift(sum_edge_vertices)(inp)))
+
+
+@fendef
+def sum_edge_vertices_to_vertices_fencil(n_vertices, out, inp):
+    closure(
+        unstructured_domain(named_range(Vertex, 0, n_vertices)),
+        sum_edge_vertices_to_vertices,
+        out,
+        [inp],
+    )
+
+
+def test_meshes_of_different_size(program_processor, lift_mode, monkeypatch, tmp_path):
+    # the sizes of temporaries are derived from the neighbor tables, so the same program
+    # must not reuse (persistently) cached artifacts for a mesh of a different size
+    monkeypatch.setattr(config, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(config, "PERSISTENT_IR_CACHE", True)
+    program_processor, validate = program_processor
+
+    for n_copies in [1, 2]:
+        # `n_copies` disconnected copies of the toy mesh
+        v2e = np.concatenate([v2e_arr + i * e2v_arr.shape[0] for i in range(n_copies)])
+        e2v = np.concatenate([e2v_arr + i * v2e_arr.shape[0] for i in range(n_copies)])
+        n_vertices = v2e.shape[0]
+        inp = gtx.as_field([Vertex], np.arange(n_vertices, dtype=np.int32))
+        out = gtx.as_field([Vertex], np.zeros([n_vertices], dtype=inp.dtype))
+        ref = np.sum(np.sum(inp.asnumpy()[e2v], axis=1)[v2e], axis=1)
+
+        run_processor(
+            sum_edge_vertices_to_vertices_fencil,
+            program_processor,
+            n_vertices,
+            out,
+            inp,
+            offset_provider={
+                "V2E": gtx.NeighborTableOffsetProvider(v2e, Vertex, Edge, 4),
+                "E2V": gtx.NeighborTableOffsetProvider(e2v, Edge, Vertex, 2),
+            },
+            lift_mode=lift_mode,
+        )
+
+        if validate:
+            assert np.allclose(out.asnumpy(), ref)
@@ -0,0 +1,118 @@
+# GT4Py - GridTools Framework
+#
+# Copyright (c) 2014-2023, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import threading
+
+import numpy as np
+import pytest
+
+import gt4py.next as gtx
+from gt4py.next import config
+from gt4py.next.ffront import decorator, type_specifications as ts_ffront
+from gt4py.next.program_processors.runners import roundtrip
+
+
+IDim = gtx.Dimension("IDim")
+KDim = gtx.Dimension("KDim", kind=gtx.DimensionKind.VERTICAL)
+
+
+@pytest.fixture
+def lazy_parsing(monkeypatch):
+    monkeypatch.setattr(config, "LAZY_PARSING", True)
+
+
+@pytest.fixture
+def parse_counter(monkeypatch):
+    calls = []
+    for cls in (decorator.FieldOperator, decorator.Program):
+        original = cls.from_function.__func__
+
+        def counting_from_function(cls, definition, *args, __original=original, **kwargs):
+            calls.append(definition.__name__)
+            return __original(cls, definition, *args, **kwargs)
+
+        monkeypatch.setattr(cls, "from_function", classmethod(counting_from_function))
+    return calls
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("1", True), ("ON", True), ("true", True), ("0", False), ("Off", False), ("FALSE", False)],
+)
+def test_env_flag_to_bool(monkeypatch, value, expected):
+    monkeypatch.setenv("GT4PY_TEST_FLAG", value)
+    assert config.env_flag_to_bool("GT4PY_TEST_FLAG", default=not expected) is expected
+
+
+def test_env_flag_to_bool_invalid(monkeypatch):
+    assert config.env_flag_to_bool("GT4PY_TEST_FLAG_UNSET", default=True) is True
+    monkeypatch.setenv("GT4PY_TEST_FLAG", "maybe")
+    with pytest.raises(ValueError, match="GT4PY_TEST_FLAG"):
+        config.env_flag_to_bool("GT4PY_TEST_FLAG", default=False)
+
+
+def test_lazy_definitions_are_parsed_on_first_use(lazy_parsing, parse_counter):
+    @gtx.field_operator
+    def copy(a: gtx.Field[[IDim], float]) -> gtx.Field[[IDim], float]:
+        return a
+
+    @gtx.scan_operator(axis=KDim, forward=True, init=0.0)
+    def accumulate(carry: float, a: float) -> float:
+        return carry + a
+
+    @gtx.program(backend=roundtrip.executor)
+    def copy_program(a: gtx.Field[[IDim], float], out: gtx.Field[[IDim], float]):
+        copy(a, out=out)
+
+    assert parse_counter == []
+    assert isinstance(copy, decorator.LazyFieldOperator)
+    assert isinstance(copy_program, decorator.LazyProgram)
+    assert isinstance(copy.with_backend(roundtrip.executor), decorator.LazyFieldOperator)
+    assert parse_counter == []
+
+    assert isinstance(accumulate.__gt_type__(), ts_ffront.ScanOperatorType)
+    assert parse_counter == ["accumulate"]
+
+    a = gtx.as_field([IDim], np.arange(5.0))
+    out = gtx.as_field([IDim], np.zeros(5))
+    copy_program(a, out, offset_provider={})
+    assert np.allclose(out.asnumpy(), a.asnumpy())
+    assert sorted(parse_counter) == ["accumulate", "copy", "copy_program"]
+
+    # subsequent uses reuse the parsed definitions
+    copy_program(a, out, offset_provider={})
+    assert copy_program.past_node.id == "copy_program"
+    assert sorted(parse_counter) == ["accumulate", "copy", "copy_program"]
+
+
+def test_lazy_parsing_thread_safety(lazy_parsing, parse_counter):
+    @gtx.field_operator
+    def identity(a: gtx.Field[[IDim], float]) -> gtx.Field[[IDim], float]:
+        return a
+
+    barrier = threading.Barrier(8)
+    types = []
+
+    def use():
+        barrier.wait()
+        types.append(identity.__gt_type__())
+
+    threads = [threading.Thread(target=use) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert parse_counter == ["identity"]
+    assert len(types) == 8 and all(type_ is types[0] for type_ in types)
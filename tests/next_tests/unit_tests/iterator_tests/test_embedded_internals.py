@@ -147,3 +147,51 @@ def test_column_array_function_wrong_shape():
             np.where(cond, wrong_shape, b)
 
     _run_within_context(test_func)
+
+
+def test_offset_provider_fingerprint():
+    from gt4py.next import common
+
+    Vertex = common.Dimension("Vertex")
+    Edge = common.Dimension("Edge")
+    K = common.Dimension("K", kind=common.DimensionKind.VERTICAL)
+
+    def make_offset_provider(table, max_neighbors=2, has_skip_values=False):
+        return {
+            "V2E": embedded.NeighborTableOffsetProvider(
+                table, Vertex, Edge, max_neighbors, has_skip_values=has_skip_values
+            ),
+            "Koff": K,
+        }
+
+    table = np.zeros((4, 2), dtype=np.int32)
+    reference = embedded.offset_provider_fingerprint(make_offset_provider(table))
+
+    # independent of the identity and the content of the neighbor table
+    assert embedded.offset_provider_fingerprint(make_offset_provider(table + 1)) == reference
+    assert hash(embedded.offset_provider_fingerprint(make_offset_provider(table))) == hash(
+        reference
+    )
+
+    # sensitive to the properties affecting code generation
+    assert embedded.offset_provider_fingerprint(make_offset_provider(table.astype(np.int64))) != (
+        reference
+    )
+    assert (
+        embedded.offset_provider_fingerprint(make_offset_provider(table, has_skip_values=True))
+        != reference
+    )
+    assert (
+        embedded.offset_provider_fingerprint(
+            make_offset_provider(np.zeros((4, 3), dtype=np.int32), max_neighbors=3)
+        )
+        != reference
+    )
+
+    # the horizontal domain sizes are only included on request
+    assert embedded.offset_provider_fingerprint(
+        make_offset_provider(table + 1), with_domain_sizes=True
+    ) != embedded.offset_provider_fingerprint(make_offset_provider(table), with_domain_sizes=True)
+    assert embedded.offset_provider_fingerprint(
+        make_offset_provider(np.zeros((5, 2), dtype=np.int32)), with_domain_sizes=True
+    ) != embedded.offset_provider_fingerprint(make_offset_provider(table), with_domain_sizes=True)
@@ -29,3 +29,40 @@ def test_str():
     expected = "λ(x) → x"
     actual = str(testee)
     assert actual == expected
+
+
+def _make_fencil(expr_id: str = "x") -> ir.FencilDefinition:
+    return ir.FencilDefinition(
+        id="f",
+        function_definitions=[],
+        params=[ir.Sym(id="inp"), ir.Sym(id="out")],
+        closures=[
+            ir.StencilClosure(
+                domain=ir.FunCall(fun=ir.SymRef(id="cartesian_domain"), args=[]),
+                stencil=ir.Lambda(
+                    params=[ir.Sym(id=expr_id)],
+                    expr=ir.FunCall(fun=ir.SymRef(id="deref"), args=[ir.SymRef(id=expr_id)]),
+                ),
+                output=ir.SymRef(id="out"),
+                inputs=[ir.SymRef(id="inp")],
+            )
+        ],
+    )
+
+
+def test_fingerprint_content_based():
+    assert ir.fingerprint(_make_fencil()) == ir.fingerprint(_make_fencil())
+    assert ir.fingerprint(_make_fencil("x")) != ir.fingerprint(_make_fencil("y"))
+
+
+def test_fingerprint_memoized(monkeypatch):
+    fencil = _make_fencil()
+    expected = ir.fingerprint(fencil)
+
+    def _fail(value):
+        raise AssertionError("fingerprint recomputed")
+
+    monkeypatch.setattr(ir, "_fingerprint_data", _fail)
+    # Repeated calls on the same instance must not walk the tree again
+    for _ in range(3):
+        assert ir.fingerprint(fencil) == expected
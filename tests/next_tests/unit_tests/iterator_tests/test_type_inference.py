@@ -13,6 +13,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import numpy as np
+import pytest
 
 import gt4py.next as gtx
 from gt4py.next.iterator import ir, ir_makers as im, type_inference as ti
@@ -906,6 +907,41 @@ def test_fencil_definition_same_closure_input():
     assert isinstance(f2_param_type.defined_loc, ti.TypeVar)
 
 
+def test_fencil_definition_closure_chain():
+    # every closure copies the previous output, so the dtype of the first parameter has to be
+    # propagated through a long chain of type variables
+    num_closures = 100
+    params = [im.sym("i"), im.sym("j"), im.sym("k"), ir.Sym(id="a0", dtype=("float64", False))]
+    params += [im.sym(f"a{n}") for n in range(1, num_closures + 1)]
+    testee = ir.FencilDefinition(
+        id="f",
+        function_definitions=[],
+        params=params,
+        closures=[
+            ir.StencilClosure(
+                domain=CARTESIAN_DOMAIN,
+                stencil=ir.SymRef(id="deref"),
+                output=ir.SymRef(id=f"a{n + 1}"),
+                inputs=[ir.SymRef(id=f"a{n}")],
+            )
+            for n in range(num_closures)
+        ],
+    )
+
+    inferred = ti.infer(testee)
+
+    param_types = list(inferred.params)[3:]
+    assert len(param_types) == num_closures + 1
+    assert all(param_type == param_types[0] for param_type in param_types)
+    assert param_types[0] == ti.Val(
+        kind=ti.Iterator(),
+        dtype=ti.Primitive(name="float64"),
+        size=ti.Column(),
+        current_loc=ti.ANYWHERE,
+        defined_loc=ti.TypeVar(idx=0),
+    )
+
+
 def test_fencil_definition_with_function_definitions():
     fundefs = [
         ir.FunctionDefinition(id="f", params=[ir.Sym(id="x")], expr=ir.SymRef(id="x")),
@@ -1047,6 +1083,19 @@ def test_save_types_to_annex():
     assert isinstance(param_type, ti.Val) and param_type.dtype.name == "float32"
 
 
+def test_save_types_to_annex_of_shared_nodes():
+    shared = im.ref("a")
+    testee = im.lambda_("a")(im.plus(shared, im.call(im.lambda_("a")(shared))(1.0)))
+    # `shared` refers to differently typed symbols at its two positions
+    with pytest.raises(ValueError, match="shared"):
+        ti.infer(testee, save_to_annex=True)
+
+    unshared = ti.unshared_copy(testee)
+    assert unshared == testee
+    ti.infer(unshared, save_to_annex=True)
+    assert unshared.expr.args[0] is not unshared.expr.args[1].fun.expr
+
+
 def test_pformat():
     vs = [ti.TypeVar(idx=i) for i in range(5)]
     assert ti.pformat(vs[0]) == "T₀"
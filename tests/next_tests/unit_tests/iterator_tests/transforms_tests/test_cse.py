@@ -139,6 +139,59 @@ def test_lambda_redef_same_arg_scope():
     assert actual == expected
 
 
+def test_shadowed_symbol():
+    # x + 1 + (x + 1) + (λ(x) → x + 1 + (x + 1))(y)
+    testee = im.plus(
+        im.plus(im.plus("x", 1), im.plus("x", 1)),
+        im.call(im.lambda_("x")(im.plus(im.plus("x", 1), im.plus("x", 1))))("y"),
+    )
+    # (λ(_cs_1) → _cs_1 + _cs_1 + (λ(x) → (λ(_cs_2) → _cs_2 + _cs_2)(x + 1))(y))(x + 1)
+    expected = im.let("_cs_1", im.plus("x", 1))(
+        im.plus(
+            im.plus("_cs_1", "_cs_1"),
+            im.call(im.lambda_("x")(im.let("_cs_2", im.plus("x", 1))(im.plus("_cs_2", "_cs_2"))))(
+                "y"
+            ),
+        )
+    )
+    actual = CSE().visit(testee)
+    assert actual == expected
+
+
+def test_shared_nodes():
+    common = im.plus("x", "y")
+    # the same node object at every occurrence
+    testee = im.plus(common, im.plus(common, common))
+    expected = im.let("_cs_1", im.plus("x", "y"))(im.plus("_cs_1", im.plus("_cs_1", "_cs_1")))
+    actual = CSE().visit(testee)
+    assert actual == expected
+
+
+def test_large_unrolled_reduction():
+    def neighbor(i):
+        return im.deref(im.shift("V2E", i)("w"))
+
+    num_neighbors = 100
+    # 0 + ·⟪V2Eₒ, 0ₒ⟫(w) × ·⟪V2Eₒ, 0ₒ⟫(w) + ·⟪V2Eₒ, 1ₒ⟫(w) × ·⟪V2Eₒ, 1ₒ⟫(w) + ...
+    testee = im.literal("0", "float64")
+    for i in range(num_neighbors):
+        testee = im.plus(testee, im.multiplies_(neighbor(i), neighbor(i)))
+    # the neighbors closer to the root are extracted first
+    expected = im.literal("0", "float64")
+    for i in range(num_neighbors):
+        symbol = f"_cs_{num_neighbors - i}"
+        expected = im.plus(expected, im.multiplies_(symbol, symbol))
+    expected = im.let(
+        *(
+            value
+            for i in reversed(range(num_neighbors))
+            for value in (f"_cs_{num_neighbors - i}", neighbor(i))
+        )
+    )(expected)
+    actual = CSE().visit(testee)
+    assert actual == expected
+
+
 def test_if_can_deref_no_extraction():
     # Test that a subexpression only occurring in one branch of an `if_` is not moved outside the
     # if statement. A case using `can_deref` is used here as it is common.
@@ -201,6 +254,23 @@ def test_if_eligible_extraction():
     assert actual == expected
 
 
+def test_if_conditional_occurrence_reuse():
+    # Test that an occurrence in only one branch of an `if_` uses a subexpression which is
+    # extracted because of its other occurrences.
+
+    # (x + y) × (x + y) + (if c then x + y else 0)
+    testee = im.plus(
+        im.multiplies_(im.plus("x", "y"), im.plus("x", "y")), im.if_("c", im.plus("x", "y"), 0)
+    )
+    # (λ(_cs_1) → _cs_1 × _cs_1 + (if c then _cs_1 else 0))(x + y)
+    expected = im.let("_cs_1", im.plus("x", "y"))(
+        im.plus(im.multiplies_("_cs_1", "_cs_1"), im.if_("c", "_cs_1", 0))
+    )
+
+    actual = CSE().visit(testee)
+    assert actual == expected
+
+
 def test_extract_subexpression_conversion_to_assignment_stmt_form():
     # TODO(tehrengruber): Remove. This test is too complicated for the little coverage of
     #  `extract_subexpression` it has. Since the algorithm is useful we just leave it here for now.
@@ -0,0 +1,86 @@
+# GT4Py - GridTools Framework
+#
+# Copyright (c) 2014-2023, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Scaling benchmark of the CSE pass on unrolled neighbor reductions.
+
+Run as a script to print the CSE time for a number of unrolled terms, e.g.
+``python test_cse_scaling.py 25 100 400``.
+"""
+
+import sys
+import time
+
+import pytest
+
+from gt4py.eve import instrumentation
+from gt4py.next.iterator import ir, ir_makers as im
+from gt4py.next.iterator.transforms.cse import CommonSubexpressionElimination as CSE
+
+
+def _neighbor_term(k: int) -> ir.Expr:
+    # ·⟪V2Eₒ, kₒ⟫(w) × (·⟪E2Vₒ, 0ₒ⟫(⟪V2Eₒ, kₒ⟫(a)) + ·⟪E2Vₒ, 1ₒ⟫(⟪V2Eₒ, kₒ⟫(a)))
+    w = im.deref(im.shift("V2E", k)("w"))
+    a = im.plus(
+        im.deref(im.shift("E2V", 0)(im.shift("V2E", k)("a"))),
+        im.deref(im.shift("E2V", 1)(im.shift("V2E", k)("a"))),
+    )
+    return im.multiplies_(w, a)
+
+
+def _unrolled_sum(num_terms: int, term) -> ir.Expr:
+    expr = im.literal("0", "float64")
+    for k in range(num_terms):
+        expr = im.plus(expr, term(k))
+    return expr
+
+
+def make_fvm_like_sum(num_terms: int) -> ir.Lambda:
+    """Two unrolled reductions sharing their terms, like a divergence times a gradient."""
+    div = _unrolled_sum(num_terms, _neighbor_term)
+    grad = _unrolled_sum(
+        num_terms, lambda k: im.plus(_neighbor_term(k), im.deref(im.shift("V2E", k)("w")))
+    )
+    return im.lambda_("a", "w")(im.multiplies_(div, grad))
+
+
+def time_cse(num_terms: int, repeat: int = 3) -> tuple[int, int, float]:
+    """Return the number of nodes before and after CSE and the fastest CSE time."""
+    node = make_fvm_like_sum(num_terms)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = CSE().visit(node)
+        times.append(time.perf_counter() - start)
+    return instrumentation.count_nodes(node), instrumentation.count_nodes(result), min(times)
+
+
+@pytest.mark.slow
+def test_cse_scales_linearly():
+    _, _, small = time_cse(25)
+    _, _, large = time_cse(100)
+    # 4 times the terms: a quadratic CSE would take 16 times as long
+    assert large / small < 8
+
+
+if __name__ == "__main__":
+    # building and visiting the deeply nested sums of many terms recurses deeply
+    sys.setrecursionlimit(100000)
+    for num_terms in [int(arg) for arg in sys.argv[1:]] or [25, 50, 100, 200, 400]:
+        nodes_before, nodes_after, seconds = time_cse(num_terms)
+        print(
+            f"terms {num_terms:4d}  nodes {nodes_before:6d} -> {nodes_after:6d}",
+            f"cse {seconds:7.3f} s",
+            flush=True,
+        )
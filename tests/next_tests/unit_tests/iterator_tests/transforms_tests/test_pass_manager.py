@@ -0,0 +1,82 @@
+# GT4Py - GridTools Framework
+#
+# Copyright (c) 2014-2023, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import pytest
+
+from gt4py.eve import instrumentation
+from gt4py.next.iterator import ir, ir_makers as im
+from gt4py.next.iterator.transforms import pass_manager
+
+
+def _make_fencil(*stencils: ir.Expr) -> ir.FencilDefinition:
+    domain = im.call("cartesian_domain")(
+        im.call("named_range")(ir.AxisLiteral(value="IDim"), 0, ir.SymRef(id="size"))
+    )
+    return ir.FencilDefinition(
+        id="f",
+        function_definitions=[],
+        params=[im.sym("inp"), im.sym("out"), im.sym("size")],
+        closures=[
+            ir.StencilClosure(
+                domain=domain, stencil=stencil, output=im.ref("out"), inputs=[im.ref("inp")]
+            )
+            for stencil in stencils
+        ],
+    )
+
+
+def test_worklist_skips_converged_closures():
+    nested_lambdas = im.lambda_("x")(im.deref("x"))
+    for _ in range(3):
+        nested_lambdas = im.lambda_("x")(im.call(nested_lambdas)(im.lift("deref")("x")))
+    testee = _make_fencil(im.lambda_("x")(im.deref("x")), im.ref("deref"), nested_lambdas)
+
+    statistics = {}
+    actual = pass_manager.apply_common_transforms(
+        testee, common_subexpression_elimination=False, statistics=statistics
+    )
+
+    expected = _make_fencil(*3 * [im.ref("deref")])
+    assert actual == expected
+
+    loop_statistics = statistics["inline_lifts_and_lambdas"]
+    assert loop_statistics.iterations == 3
+    assert loop_statistics.skipped > 0
+    assert loop_statistics.changes["InlineLambdas"] >= 1
+    assert loop_statistics.changes["InlineLifts"] >= 1
+
+
+def test_max_iterations():
+    nested_lambdas = im.lambda_("x")(im.deref("x"))
+    for _ in range(3):
+        nested_lambdas = im.lambda_("x")(im.call(nested_lambdas)(im.lift("deref")("x")))
+    testee = _make_fencil(nested_lambdas)
+
+    with pytest.raises(RuntimeError, match="did not converge"):
+        pass_manager.apply_common_transforms(testee, max_iterations=1)
+
+
+def test_pass_instrumentation():
+    testee = _make_fencil(im.lambda_("x")(im.deref(im.lift("deref")("x"))))
+
+    with instrumentation.profile_passes() as profile:
+        pass_manager.apply_common_transforms(testee)
+
+    names = [record.name for record in profile.records]
+    assert names[0] == "MergeLet" and "InlineLifts" in names
+    assert all(record.category == "itir" for record in profile.records)
+    inline_lifts = next(record for record in profile.records if record.name == "InlineLifts")
+    assert inline_lifts.iteration == 1
+    assert inline_lifts.nodes_after < inline_lifts.nodes_before
+    assert profile.iterations["itir:inline_lifts_and_lambdas"] == [2]
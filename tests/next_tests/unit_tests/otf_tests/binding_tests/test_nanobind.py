@@ -22,3 +22,15 @@ from next_tests.unit_tests.otf_tests.compilation_tests.build_systems_tests.conft
 def test_bindings(program_source_example):
     module = nanobind.create_bindings(program_source_example)
     assert module.library_deps[0].name == "nanobind"
+
+
+def test_bindings_release_gil(program_source_example):
+    assert "gil_scoped_release" in nanobind.create_bindings(program_source_example).source_code
+    assert "gil_scoped_release" not in (
+        nanobind.create_bindings(program_source_example, release_gil=False).source_code
+    )
+    assert "gil_scoped_release" not in (
+        nanobind.bind_source.replace(release_gil=False)(
+            program_source_example
+        ).binding_source.source_code
+    )
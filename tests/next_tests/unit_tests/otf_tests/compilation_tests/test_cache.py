@@ -0,0 +1,157 @@
+# GT4Py - GridTools Framework
+#
+# Copyright (c) 2014-2023, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import multiprocessing
+import os
+import pathlib
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from gt4py.next import cli, config
+from gt4py.next.otf import stages
+from gt4py.next.otf.compilation import build_data, cache
+
+
+@pytest.fixture
+def cache_root(monkeypatch, tmp_path):
+    monkeypatch.setattr(config, "CACHE_DIR", tmp_path)
+    return cache.get_cache_root(cache.Strategy.PERSISTENT)
+
+
+def make_entry(root: pathlib.Path, name: str, size: int, last_used: float) -> pathlib.Path:
+    path = root / name
+    path.mkdir(parents=True)
+    (path / "lib.so").write_bytes(b"x" * size)
+    build_data.write_data(
+        build_data.BuildData(build_data.BuildStatus.COMPILED, pathlib.Path("lib.so"), "main"), path
+    )
+    os.utime(path, (last_used, last_used))
+    return path
+
+
+def hold_lock(path, acquired, release):
+    with cache.lock(path):
+        acquired.set()
+        release.wait(10)
+
+
+def test_lock_is_exclusive_across_processes(tmp_path):
+    ctx = multiprocessing.get_context("spawn")
+    acquired, release = ctx.Event(), ctx.Event()
+    process = ctx.Process(target=hold_lock, args=(tmp_path / "entry", acquired, release))
+    process.start()
+    try:
+        assert acquired.wait(30)
+        with cache.lock(tmp_path / "entry", blocking=False) as locked:
+            assert not locked
+    finally:
+        release.set()
+        process.join()
+    with cache.lock(tmp_path / "entry", blocking=False) as locked:
+        assert locked
+
+
+def test_write_data_is_atomic(tmp_path):
+    data = build_data.BuildData(build_data.BuildStatus.CONFIGURED, pathlib.Path("m.so"), "f")
+    build_data.write_data(data, tmp_path)
+    assert build_data.read_data(tmp_path) == data
+    assert [p.name for p in tmp_path.iterdir()] == ["gt4py.json"]
+
+    (tmp_path / "gt4py.json").write_text('{"status": "COMP')  # e.g. an older interrupted write
+    assert build_data.read_data(tmp_path) is None
+
+
+def test_prune_evicts_least_recently_used(cache_root):
+    now = time.time()
+    old = make_entry(cache_root, "old", 1000, now - 300)
+    recent = make_entry(cache_root, "recent", 1000, now - 100)
+    kept = make_entry(cache_root, "kept", 1000, now - 200)
+    shared = make_entry(cache_root, f"{cache._COMPILEDB_PREFIX}_x", 1000, now - 400)
+
+    assert [entry.path for entry in cache.list_entries()] == [shared, old, kept, recent]
+    assert cache.prune(2500, dry_run=True)[0].path == old and old.exists()
+
+    removed = cache.prune(2500, keep=[kept])
+    assert [entry.path for entry in removed] == [old, recent]
+    assert not old.exists() and not recent.exists()
+    assert kept.exists() and shared.exists()
+    assert not any(path.name.startswith(".trash") for path in cache_root.iterdir())
+    assert not any(path.name.endswith(".lock") for path in cache_root.iterdir())
+
+
+def test_prune_skips_recently_used_entries(cache_root):
+    now = time.time()
+    old = make_entry(cache_root, "old", 1000, now - 300)
+    recent = make_entry(cache_root, "recent", 1000, now - 100)
+
+    assert [entry.path for entry in cache.prune(0, min_age=200)] == [old]
+    assert recent.exists()
+
+
+def test_lock_after_removal(cache_root):
+    entry = make_entry(cache_root, "entry", 10, 0)
+    with cache.lock(entry):
+        # e.g. the entry is evicted by another process
+        (cache_root / ".entry.lock").unlink()
+        with cache.lock(entry, blocking=False) as locked:
+            assert locked
+
+
+def test_prune_skips_locked_entries(cache_root):
+    now = time.time()
+    locked = make_entry(cache_root, "locked", 1000, now - 200)
+    unlocked = make_entry(cache_root, "unlocked", 1000, now - 100)
+    ctx = multiprocessing.get_context("spawn")
+    acquired, release = ctx.Event(), ctx.Event()
+    process = ctx.Process(target=hold_lock, args=(locked, acquired, release))
+    process.start()
+    try:
+        assert acquired.wait(30)
+        assert [entry.path for entry in cache.prune(0)] == [unlocked]
+    finally:
+        release.set()
+        process.join()
+    assert locked.exists()
+
+
+def test_get_cache_folder_marks_use(cache_root, monkeypatch):
+    entry = make_entry(cache_root, "entry", 10, 0)
+    monkeypatch.setattr(cache, "_cache_folder_name", lambda source: "entry")
+    source = stages.CompilableSource(program_source=None, binding_source=None)
+    assert cache.get_cache_folder(source, cache.Strategy.PERSISTENT) == entry
+    assert entry.stat().st_mtime > time.time() - 100
+
+
+def test_cli(cache_root, monkeypatch):
+    now = time.time()
+    make_entry(cache_root, "first", 2048, now - 200)
+    make_entry(cache_root, "second", 2048, now - 100)
+    runner = CliRunner()
+
+    result = runner.invoke(cli.main, ["cache", "info", "-v"])
+    assert result.exit_code == 0, result.output
+    assert "Entries: 2" in result.output and "first" in result.output
+
+    monkeypatch.setattr(config, "BUILD_CACHE_MAX_SIZE", 0)
+    assert runner.invoke(cli.main, ["cache", "prune"]).exit_code != 0
+
+    result = runner.invoke(cli.main, ["cache", "prune", "--max-size", "3k"])
+    assert result.exit_code == 0, result.output
+    assert "Removed first" in result.output
+    assert [entry.path.name for entry in cache.list_entries()] == ["second"]
+
+    result = runner.invoke(cli.main, ["cache", "prune", "--all"])
+    assert result.exit_code == 0 and cache.list_entries() == []
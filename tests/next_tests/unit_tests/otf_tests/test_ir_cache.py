@@ -0,0 +1,155 @@
+# GT4Py - GridTools Framework
+#
+# Copyright (c) 2014-2023, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import pathlib
+import types
+
+import pytest
+
+import gt4py.next as gtx
+from gt4py.next import config
+from gt4py.next.ffront import decorator
+from gt4py.next.ffront.source_utils import SourceDefinition
+from gt4py.next.otf import ir_cache
+
+
+IDim = gtx.Dimension("IDim")
+Ioff = gtx.FieldOffset("Ioff", source=IDim, target=(IDim,))
+
+
+@pytest.fixture
+def persistent_ir_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(config, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(config, "PERSISTENT_IR_CACHE", True)
+    return tmp_path
+
+
+def test_cached(persistent_ir_cache):
+    key = ir_cache.make_key("test_cached")
+    assert ir_cache.cached(key, lambda: {"value": 1}) == {"value": 1}
+    assert ir_cache.load(key) == {"value": 1}
+    assert ir_cache.cached(key, lambda: pytest.fail("not cached")) == {"value": 1}
+    assert list(ir_cache.cache_dir().glob("*.tmp")) == []
+
+
+def test_cached_disabled(persistent_ir_cache, monkeypatch):
+    monkeypatch.setattr(config, "PERSISTENT_IR_CACHE", False)
+    key = ir_cache.make_key("test_cached_disabled")
+    assert ir_cache.cached(key, lambda: 1) == 1
+    assert ir_cache.load(key) is None
+
+
+def test_broken_entry_is_a_miss(persistent_ir_cache):
+    key = ir_cache.make_key("test_broken_entry")
+    ir_cache.cache_dir().mkdir(parents=True)
+    (ir_cache.cache_dir() / f"{key}.pkl").write_bytes(b"not a pickle")
+    assert ir_cache.cached(key, lambda: 42) == 42
+    assert ir_cache.load(key) == 42
+
+
+def test_unpicklable_value_is_not_stored(persistent_ir_cache):
+    key = ir_cache.make_key("test_unpicklable")
+    value = ir_cache.cached(key, lambda: lambda: None)
+    assert callable(value)
+    assert ir_cache.load(key) is None
+
+
+def copy_shifted(a: gtx.Field[[IDim], float]) -> gtx.Field[[IDim], float]:
+    return a(Ioff[1])
+
+
+copy_shifted_definition = copy_shifted
+
+
+def shift_program(a: gtx.Field[[IDim], float], out: gtx.Field[[IDim], float]):
+    copy_shifted(a, out=out, domain={IDim: (0, 4)})
+
+
+def test_frontend_artifacts_are_reused(persistent_ir_cache, monkeypatch):
+    monkeypatch.setitem(globals(), "copy_shifted", gtx.field_operator(copy_shifted_definition))
+    program = gtx.program(shift_program)
+    assert copy_shifted.ir_cache_key is not None and program.ir_cache_key is not None
+    expected_itir = program.itir
+
+    # a new session would parse the same definitions again
+    def fail(*args, **kwargs):
+        pytest.fail("frontend was not skipped")
+
+    monkeypatch.setattr(decorator.FieldOperatorParser, "apply", fail)
+    monkeypatch.setattr(decorator.FieldOperatorLowering, "apply", fail)
+    monkeypatch.setattr(decorator.ProgramParser, "apply", fail)
+    monkeypatch.setattr(decorator.ProgramLowering, "apply", fail)
+
+    monkeypatch.setitem(globals(), "copy_shifted", gtx.field_operator(copy_shifted_definition))
+    cached_program = gtx.program(shift_program)
+    assert cached_program.ir_cache_key == program.ir_cache_key
+    assert cached_program.itir == expected_itir
+
+
+def test_key_depends_on_closure_vars(persistent_ir_cache, monkeypatch):
+    key = gtx.field_operator(copy_shifted_definition).ir_cache_key
+    monkeypatch.setitem(globals(), "Ioff", gtx.FieldOffset("Ioff", source=IDim, target=(IDim,)))
+    assert gtx.field_operator(copy_shifted_definition).ir_cache_key == key
+    monkeypatch.setitem(globals(), "Ioff", gtx.FieldOffset("Ioff2", source=IDim, target=(IDim,)))
+    assert gtx.field_operator(copy_shifted_definition).ir_cache_key != key
+
+
+def test_key_depends_on_function_code(persistent_ir_cache):
+    source_def = SourceDefinition("def foo(a):\n    return helper(a)\n")
+
+    def make_helper(offset):
+        if offset:
+
+            def helper(a):
+                return a + 1
+
+        else:
+
+            def helper(a):
+                return a
+
+        return helper
+
+    key = decorator._make_ir_cache_key(source_def, {"helper": make_helper(0)}, {})
+    assert key is not None
+    assert decorator._make_ir_cache_key(source_def, {"helper": make_helper(0)}, {}) == key
+    assert decorator._make_ir_cache_key(source_def, {"helper": make_helper(1)}, {}) != key
+
+
+def test_key_depends_on_accessed_module_attributes(persistent_ir_cache):
+    source_def = SourceDefinition("def foo(a):\n    return mod.sub.value + mod.func(a)\n")
+
+    def make_module(value):
+        module = types.ModuleType("mod")
+        module.sub = types.ModuleType("mod.sub")
+        module.sub.value = value
+        module.func = copy_shifted_definition
+        module.unused = object()  # not picklable, but not accessed either
+        return module
+
+    key = decorator._make_ir_cache_key(source_def, {"mod": make_module(1)}, {})
+    assert key is not None
+    assert decorator._make_ir_cache_key(source_def, {"mod": make_module(1)}, {}) == key
+    assert decorator._make_ir_cache_key(source_def, {"mod": make_module(2)}, {}) != key
+
+    # the module itself is used, so its contents can not be tracked
+    source_def = SourceDefinition("def foo(a):\n    return getattr(mod, 'func')(a)\n")
+    assert decorator._make_ir_cache_key(source_def, {"mod": make_module(1)}, {}) is None
+
+
+def test_default_cache_dir_is_per_user(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert config._default_cache_dir() == tmp_path / "gt4py"
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    assert config._default_cache_dir() == pathlib.Path.home() / ".cache" / "gt4py"
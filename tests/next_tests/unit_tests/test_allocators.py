@@ -191,3 +191,44 @@ def test_allocate():
     # Test with no device or allocator
     with pytest.raises(ValueError, match="No 'device' or 'allocator' specified"):
         allocate(domain, dtype)
+
+
+def test_pooling_allocator():
+    I = common.Dimension("I")
+    K = common.Dimension("K", common.DimensionKind.VERTICAL)
+    domain = common.domain(((I, (0, 10)), (K, (0, 3))))
+    dtype = core_defs.dtype(float)
+
+    allocator = next_allocators.PoolingFieldBufferAllocator.from_allocator(
+        next_allocators.StandardCPUFieldBufferAllocator()
+    )
+    assert allocator != next_allocators.PoolingFieldBufferAllocator.from_allocator(
+        next_allocators.StandardCPUFieldBufferAllocator()
+    )
+
+    tensor_buffer = next_allocators.allocate(domain, dtype, allocator=allocator)
+    assert tensor_buffer.shape == domain.shape
+    allocator.release(tensor_buffer)
+
+    tensor_buffer = next_allocators.allocate(domain, dtype, allocator=allocator)
+    statistics = allocator.pool.statistics
+    assert (statistics.hits, statistics.misses) == (1, 1)
+
+
+def test_mmap_allocator(tmp_path):
+    I = common.Dimension("I")
+    K = common.Dimension("K", common.DimensionKind.VERTICAL)
+    domain = common.domain(((I, (0, 10)), (K, (0, 3))))
+    dtype = core_defs.dtype(float)
+    path = tmp_path / "field"
+
+    tensor_buffer = next_allocators.allocate(
+        domain, dtype, allocator=next_allocators.MMapFieldBufferAllocator(path)
+    )
+    tensor_buffer.ndarray[...] = 1.0
+
+    attached = next_allocators.allocate(
+        domain, dtype, allocator=next_allocators.MMapFieldBufferAllocator(path, "r")
+    )
+    assert attached.strides == tensor_buffer.strides
+    assert attached.ndarray.sum() == 30.0
@@ -19,6 +19,7 @@ from gt4py import next as gtx
 from gt4py._core import definitions as core_defs
 from gt4py.next import allocators as next_allocators, common, float32
 from gt4py.next.program_processors.runners import roundtrip
+from gt4py.storage import allocators as core_allocators
 
 from next_tests.integration_tests import cases
 
@@ -112,6 +113,18 @@ def test_full(allocator, device):
     assert np.array_equal(a.ndarray, ref)
 
 
+def test_full_parallel_first_touch(monkeypatch):
+    monkeypatch.setattr(core_allocators, "FIRST_TOUCH_MIN_PARALLEL_BYTES", 0)
+    a = gtx.full(
+        domain={I: range(sizes[I]), K: range(sizes[K])},
+        fill_value=42.0,
+        allocator=next_allocators.StandardCPUFieldBufferAllocator(),
+        parallel_first_touch=3,
+    )
+
+    assert np.array_equal(a.ndarray, np.full((sizes[I], sizes[K]), 42.0))
+
+
 def test_as_field():
     ref = np.random.rand(sizes[I]).astype(gtx.float32)
     a = gtx.as_field([I], ref)
@@ -0,0 +1,63 @@
+# GT4Py - GridTools Framework
+#
+# Copyright (c) 2014-2023, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import numpy as np
+import pytest
+
+import gt4py.storage
+from gt4py import next as gtx
+from gt4py._core import definitions as core_defs
+from gt4py.next.program_processors.runners import roundtrip
+
+
+I = gtx.Dimension("I")
+K = gtx.Dimension("K", kind=gtx.DimensionKind.VERTICAL)
+
+
+@pytest.fixture
+def field():
+    return gtx.as_field(
+        {I: range(-2, 8), K: range(0, 5)}, np.arange(50, dtype=np.float32).reshape(10, 5)
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"allocator": roundtrip.backend, "num_threads": 2},
+        {"device": core_defs.Device(core_defs.DeviceType.CPU, 0)},
+        {"mmap_mode": "r"},
+    ],
+)
+def test_save_load_field(tmp_path, field, kwargs):
+    path = tmp_path / "field.gt"
+    gtx.save_field(path, field)
+
+    loaded = gtx.load_field(path, **kwargs)
+    assert loaded.domain == field.domain
+    assert loaded.dtype == field.dtype
+    assert loaded.ndarray.strides == field.ndarray.strides
+    assert np.array_equal(loaded.ndarray, field.ndarray)
+
+
+def test_load_field_errors(tmp_path, field):
+    path = tmp_path / "field.gt"
+    gtx.save_field(path, field)
+    with pytest.raises(ValueError, match="mutually exclusive"):
+        gtx.load_field(path, allocator=roundtrip.backend, mmap_mode="r")
+
+    gt4py.storage.save(path, np.zeros((3, 3)))
+    with pytest.raises(ValueError, match="does not contain a field"):
+        gtx.load_field(path)
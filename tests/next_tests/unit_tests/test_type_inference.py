@@ -12,39 +12,52 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import threading
+
+import pytest
+
+from gt4py.eve import datamodels
 from gt4py.next import type_inference as ti
 
 
-def test_renamer():
-    class Foo(ti.Type):
-        bar: ti.Type
-        baz: ti.Type
-
-    class Bar(ti.Type):
-        ...
-
-    r = ti._Renamer()
-    actual = [
-        (
-            ti._Box(value=Foo(bar=ti.TypeVar(idx=0), baz=ti.TypeVar(idx=1))),
-            ti._Box(value=ti.TypeVar(idx=0)),
-        )
-    ]
-    src = ti.TypeVar(idx=0)
-    dst = ti.TypeVar(idx=1)
-    for s, t in actual:
-        r.register(s)
-        r.register(t)
-    r.register(src)
-    r.register(dst)
-    r.rename(src, dst)
-    expected = [
-        (
-            ti._Box(value=Foo(bar=ti.TypeVar(idx=1), baz=ti.TypeVar(idx=1))),
-            ti._Box(value=ti.TypeVar(idx=1)),
-        )
-    ]
-    assert actual == expected
+class Foo(ti.Type):
+    bar: ti.Type
+    baz: ti.Type
+
+
+class Bar(ti.Type):
+    ...
+
+
+class Baz(ti.Type):
+    ...
+
+
+def test_unify_type_var_chain():
+    v = [ti.TypeVar(idx=i) for i in range(5000)]
+    constraints = {(v[i], v[i + 1]) for i in range(len(v) - 1)} | {(v[-1], Bar())}
+    dtype = Foo(bar=v[0], baz=v[len(v) // 2])
+
+    actual, unsatisfiable_constraints = ti.unify(dtype, constraints)
+    assert actual == Foo(bar=Bar(), baz=Bar())
+    assert not unsatisfiable_constraints
+
+
+def test_unify_unsatisfiable():
+    v = [ti.TypeVar(idx=i) for i in range(2)]
+    constraints = {(Foo(bar=v[0], baz=v[0]), Foo(bar=Bar(), baz=v[1])), (v[1], Baz())}
+
+    actual, unsatisfiable_constraints = ti.unify([v[0], v[1]], constraints)
+    # the result depends on the order in which the constraints are handled
+    assert all(dtype in (Bar(), Baz()) for dtype in actual)
+    assert len(unsatisfiable_constraints) == 1
+    assert set(unsatisfiable_constraints[0]) == {Bar(), Baz()}
+
+
+def test_unify_infinite_type():
+    v = ti.TypeVar(idx=0)
+    with pytest.raises(TypeError, match="infinite type"):
+        ti.unify(v, {(v, Foo(bar=v, baz=Bar()))})
 
 
 def test_custom_type_inference():
@@ -83,3 +96,27 @@ def test_custom_type_inference():
 
     actual = ti.reindex_vars(ti.unify(dtype, constraints)[0])
     assert actual == expected
+
+
+def test_unchecked_rebuild_is_thread_local(monkeypatch):
+    entered, checked = threading.Event(), threading.Event()
+    original_visit = ti._TypeVarReindexer.visit
+
+    def visit(self, value):
+        if not entered.is_set():
+            entered.set()
+            checked.wait(10)
+        return original_visit(self, value)
+
+    monkeypatch.setattr(ti._TypeVarReindexer, "visit", visit)
+    thread = threading.Thread(target=ti.freshen, args=(Foo(bar=ti.TypeVar(idx=0), baz=Bar()),))
+    thread.start()
+    assert entered.wait(10)
+    try:
+        # the other thread is rebuilding types without validation right now
+        assert datamodels.get_validation_settings().field_types
+        with pytest.raises(TypeError):
+            Foo(bar=Bar(), baz=1)
+    finally:
+        checked.set()
+        thread.join()
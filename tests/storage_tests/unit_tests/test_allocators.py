@@ -0,0 +1,257 @@
+# GT4Py - GridTools Framework
+#
+# Copyright (c) 2014-2023, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import gc
+import os
+import threading
+
+import numpy as np
+import pytest
+
+import gt4py
+from gt4py._core import definitions as core_defs
+from gt4py.storage import allocators
+
+
+def _make_pool(**kwargs):
+    return allocators.PoolingBufferAllocator(
+        allocators.NDArrayBufferAllocator(core_defs.DeviceType.CPU, np), **kwargs
+    )
+
+
+def _allocate(pool, shape=(10, 20), aligned_index=None):
+    return pool.allocate(shape, core_defs.dtype(np.float64), 0, (0, 1), 64, aligned_index)
+
+
+def test_pool_reuses_collected_buffers():
+    pool = _make_pool()
+    buffer = _allocate(pool)
+    address = buffer.memory_address
+    view = buffer.ndarray[1:, 2:]
+    del buffer
+    gc.collect()
+
+    # The buffer is still used by the view
+    assert pool.statistics.bytes_held == 0
+    other_address = _allocate(pool).memory_address
+    assert other_address != address
+
+    del view
+    gc.collect()
+    statistics = pool.statistics
+    assert statistics.returned == 2
+    assert statistics.bytes_in_use == 0
+
+    # Same size class, different alignment of the first element
+    buffer = _allocate(pool, shape=(10, 19), aligned_index=(0, 1))
+    assert buffer.memory_address in (address, other_address)
+    assert pool.statistics.hits == 1
+    assert buffer.byte_offset % 8 == 0
+    assert (buffer.ndarray[:, 1:].ctypes.data % 64) == 0
+
+
+def test_pool_explicit_release():
+    pool = _make_pool()
+    buffer = _allocate(pool)
+    pool.release(buffer)
+    assert pool.statistics.bytes_in_use == 0
+    with pytest.raises(ValueError, match="already released"):
+        pool.release(buffer)
+
+    buffer = _allocate(pool)
+    assert pool.statistics.hits == 1
+    pool.release(buffer.ndarray)
+    assert pool.statistics.returned == 2
+
+    with pytest.raises(ValueError, match="not allocated by a buffer pool"):
+        pool.release(np.empty(10))
+
+
+def test_pool_max_bytes():
+    pool = _make_pool(max_bytes=3000)
+    first, second = _allocate(pool), _allocate(pool)
+    size = pool.statistics.bytes_in_use // 2
+    assert 1500 < size <= 3000
+
+    pool.release(first)
+    pool.release(second)
+    statistics = pool.statistics
+    assert statistics.returned == 1
+    assert statistics.dropped == 1
+    assert statistics.bytes_held == size
+
+    pool.clear()
+    assert pool.statistics.bytes_held == 0
+
+
+def test_storage_interface_pooled_allocation():
+    pool = _make_pool()
+    for _ in range(3):
+        field = gt4py.storage.zeros((5, 6, 7), backend="numpy", allocator=pool)
+        assert field.shape == (5, 6, 7)
+        assert np.all(field == 0)
+        del field
+        gc.collect()
+
+    statistics = pool.statistics
+    assert statistics.misses == 1
+    assert statistics.hits == 2
+
+
+def test_mmap_allocator(tmp_path):
+    path = tmp_path / "buffer"
+    buffer = _allocate(allocators.MMapBufferAllocator(path), aligned_index=(0, 1))
+    buffer.ndarray[...] = np.arange(200).reshape(10, 20)
+    assert path.stat().st_size >= buffer.ndarray.nbytes
+
+    # Attach to the same buffer
+    attached = _allocate(allocators.MMapBufferAllocator(path, "r+"), aligned_index=(0, 1))
+    assert attached.strides == buffer.strides
+    assert attached.byte_offset == buffer.byte_offset
+    assert np.all(attached.ndarray == buffer.ndarray)
+    attached.ndarray[0, 0] = -1
+    assert buffer.ndarray[0, 0] == -1
+
+    read_only = _allocate(allocators.MMapBufferAllocator(path, "r"), aligned_index=(0, 1))
+    assert not read_only.ndarray.flags.writeable
+    assert np.all(read_only.ndarray == buffer.ndarray)
+
+    with pytest.raises(ValueError, match="too small"):
+        _allocate(allocators.MMapBufferAllocator(path, "r"), shape=(20, 20))
+    with pytest.raises(ValueError, match="Invalid mmap mode"):
+        allocators.MMapBufferAllocator(path, "a")
+
+
+def test_storage_interface_mmap_backing(tmp_path):
+    path = tmp_path / "storage"
+    kwargs = dict(backend="gt:cpu_kfirst", aligned_index=(1, 1, 0), backing="mmap", path=path)
+    storage = gt4py.storage.empty((5, 6, 7), **kwargs)
+    storage[...] = 3.0
+
+    attached = gt4py.storage.empty((5, 6, 7), **kwargs, mmap_mode="r")
+    assert attached.strides == storage.strides
+    assert np.all(attached == 3.0)
+
+    with pytest.raises(ValueError, match="'path' is required"):
+        gt4py.storage.empty((5, 6, 7), backend="numpy", backing="mmap")
+    with pytest.raises(ValueError, match="only valid for 'mmap'"):
+        gt4py.storage.empty((5, 6, 7), backend="numpy", path=path)
+    with pytest.raises(ValueError, match="Invalid storage backing"):
+        gt4py.storage.empty((5, 6, 7), backend="numpy", backing="disk", path=path)
+
+
+@pytest.mark.parametrize(
+    "layout_map, outer_dim, bounds",
+    [
+        ((0, 1, 2), 0, [0, 2, 4, 6, 7]),
+        ((2, 0, 1), 1, [0, 2, 3, 4, 5]),
+        ((1, 2, 0), 2, [0, 1, 2, 3]),
+    ],
+)
+def test_first_touch_fill(monkeypatch, layout_map, outer_dim, bounds):
+    monkeypatch.setattr(allocators, "FIRST_TOUCH_MIN_PARALLEL_BYTES", 0)
+    allocator = allocators.NDArrayBufferAllocator(core_defs.DeviceType.CPU, np)
+    buffer = allocator.allocate((7, 5, 3), core_defs.dtype(np.float64), 0, layout_map, 64)
+
+    # blocks of the outermost dimension in memory, like an OpenMP static schedule
+    assert allocators._first_touch_blocks(buffer.ndarray, 4) == (outer_dim, bounds)
+
+    allocators.first_touch_fill(buffer.ndarray, 2.0, num_threads=4)
+    assert np.all(buffer.ndarray == 2.0)
+
+    values = np.arange(7 * 5 * 3, dtype=np.float64).reshape(7, 5, 3)
+    allocators.first_touch_fill(buffer.ndarray, values, num_threads=3)
+    assert np.all(buffer.ndarray == values)
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="No thread pinning support.")
+def test_first_touch_fill_pinning(monkeypatch):
+    monkeypatch.setattr(allocators, "FIRST_TOUCH_MIN_PARALLEL_BYTES", 0)
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: {8, 2, 5, 11})
+    pinned_cpus = {}
+    monkeypatch.setattr(
+        os, "sched_setaffinity", lambda pid, cpus: pinned_cpus.update({threading.get_ident(): cpus})
+    )
+    filled_blocks = []
+
+    class RecordingArray(np.ndarray):
+        def __getitem__(self, key):
+            (block,) = key
+            filled_blocks.append((pinned_cpus[threading.get_ident()], block.start, block.stop))
+            return super().__getitem__(key)
+
+    array = np.zeros((6, 4))
+    allocators.first_touch_fill(array, np.ones((6, 4)).view(RecordingArray), num_threads=3)
+
+    # block k is filled by a thread pinned to the k-th available CPU
+    assert sorted(filled_blocks) == [({2}, 0, 2), ({5}, 2, 4), ({8}, 4, 6)]
+    assert np.all(array == 1.0)
+
+
+def test_storage_interface_parallel_first_touch(monkeypatch):
+    monkeypatch.setattr(allocators, "FIRST_TOUCH_MIN_PARALLEL_BYTES", 0)
+    storage = gt4py.storage.full((8, 6, 4), 5.0, backend="gt:cpu_ifirst", parallel_first_touch=3)
+    assert np.all(storage == 5.0)
+    storage = gt4py.storage.empty((8, 6, 4), backend="numpy", parallel_first_touch=True)
+    assert np.all(storage == 0.0)
+
+
+def test_huge_page_allocator():
+    allocator = allocators.HugePageBufferAllocator(min_size=1024)
+    buffer = allocator.allocate((40, 30), core_defs.dtype(np.float64), 0, (0, 1), 64, (1, 1))
+    assert buffer.memory_address % allocators.HUGE_PAGE_SIZE == 0
+    assert buffer.ndarray.shape == (40, 30)
+    buffer.ndarray[...] = np.arange(1200).reshape(40, 30)
+    assert np.all(buffer.ndarray == np.arange(1200).reshape(40, 30))
+
+    small = allocators.HugePageBufferAllocator().allocate(
+        (4, 3), core_defs.dtype(np.float64), 0, (0, 1), 64
+    )
+    assert small.ndarray.shape == (4, 3)
+
+
+def _transparent_huge_pages_mode() -> str:
+    try:
+        with open("/sys/kernel/mm/transparent_hugepage/enabled") as f:
+            # e.g. "always [madvise] never"
+            return f.read().split("[")[1].split("]")[0]
+    except (OSError, IndexError):
+        return "unavailable"
+
+
+@pytest.mark.skipif(
+    _transparent_huge_pages_mode() not in ("always", "madvise"),
+    reason="Transparent huge pages are not available for madvise'd memory.",
+)
+def test_huge_page_allocator_obtains_huge_pages():
+    allocator = allocators.HugePageBufferAllocator()
+    shape = (4 * allocators.HUGE_PAGE_SIZE // 8,)
+    buffer = allocator.allocate(shape, core_defs.dtype(np.float64), 0, (0,), 64)
+    # pages are only allocated when written to
+    buffer.ndarray[...] = 1.0
+    assert allocators.huge_page_bytes(buffer) > 0
+
+
+def test_storage_interface_huge_pages(monkeypatch):
+    from gt4py.cartesian import config as gt_config
+    from gt4py.storage.cartesian import utils as storage_utils
+
+    monkeypatch.setitem(gt_config.storage_settings, "huge_pages", False)
+    assert storage_utils._default_cpu_allocator() is storage_utils._CPUBufferAllocator
+    monkeypatch.setitem(gt_config.storage_settings, "huge_pages", True)
+    monkeypatch.setitem(gt_config.storage_settings, "huge_pages_min_size", 0)
+    assert storage_utils._default_cpu_allocator() == allocators.HugePageBufferAllocator(0)
+
+    storage = gt4py.storage.ones((5, 6, 7), backend="gt:cpu_kfirst", aligned_index=(1, 1, 0))
+    assert np.all(storage == 1.0)
@@ -0,0 +1,140 @@
+# GT4Py - GridTools Framework
+#
+# Copyright (c) 2014-2023, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import numpy as np
+import pytest
+
+import gt4py
+from gt4py.storage import serialization
+
+
+def _random_storage(backend, shape=(13, 11, 5), aligned_index=(3, 3, 0)):
+    storage = gt4py.storage.empty(shape, backend=backend, aligned_index=aligned_index)
+    storage[...] = np.random.default_rng(0).random(shape)
+    return storage
+
+
+@pytest.mark.parametrize("backend", ["numpy", "gt:cpu_ifirst", "gt:cpu_kfirst"])
+def test_save_load(tmp_path, backend):
+    path = tmp_path / "storage.gt"
+    storage = _random_storage(backend)
+    gt4py.storage.save(path, storage, backend=backend, dimensions="IJK", origin=(3, 3, 0))
+
+    header = gt4py.storage.load_header(path)
+    assert header.shape == storage.shape
+    assert header.strides == storage.strides
+    assert header.dims == ("I", "J", "K")
+    assert header.origin == (3, 3, 0)
+    assert header.version == serialization.FORMAT_VERSION
+
+    loaded = gt4py.storage.load(path)
+    assert loaded.strides == storage.strides
+    assert (
+        loaded.ctypes.data % serialization.PAGE_SIZE
+        == storage.ctypes.data % serialization.PAGE_SIZE
+    )
+    assert np.array_equal(loaded, storage)
+
+    loaded = gt4py.storage.load(path, backend=backend, num_threads=3)
+    assert loaded.strides == storage.strides
+    assert np.array_equal(loaded, storage)
+
+    mapped = gt4py.storage.load(path, mmap_mode="r")
+    assert mapped.strides == storage.strides
+    assert not mapped.flags.writeable
+    assert np.array_equal(mapped, storage)
+
+
+def test_load_other_layout(tmp_path):
+    path = tmp_path / "storage.gt"
+    storage = _random_storage("gt:cpu_ifirst")
+    gt4py.storage.save(path, storage)
+
+    loaded = gt4py.storage.load(path, backend="gt:cpu_kfirst")
+    assert loaded.strides == gt4py.storage.empty(storage.shape, backend="gt:cpu_kfirst").strides
+    assert np.array_equal(loaded, storage)
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.arange(60.0).reshape(3, 4, 5)[::2, :, ::-1],
+        np.arange(60, dtype=np.int32).reshape(3, 4, 5).transpose(2, 0, 1),
+        np.broadcast_to(np.arange(5.0), (4, 5)),
+        np.zeros((0, 3)),
+        np.float32(3),
+    ],
+)
+def test_write_read(tmp_path, array):
+    path = tmp_path / "array.gt"
+    serialization.write(path, array)
+    header, loaded = serialization.read(path)
+    assert loaded.dtype == np.asarray(array).dtype
+    assert header.layout_map == serialization._layout_map_of(np.asarray(array))
+    assert np.array_equal(loaded, array)
+
+
+def test_parallel_chunks(tmp_path):
+    path = tmp_path / "array.gt"
+    array = np.random.default_rng(0).random((64, 33, 17))
+    serialization.write(path, array, num_threads=4, chunk_size=1000)
+    _, loaded = serialization.read(path, num_threads=3, chunk_size=1000)
+    assert np.array_equal(loaded, array)
+
+
+def test_invalid_files(tmp_path):
+    path = tmp_path / "array.gt"
+    path.write_bytes(b"not a storage")
+    with pytest.raises(ValueError, match="not a GT4Py storage file"):
+        gt4py.storage.load(path)
+
+    serialization.write(path, np.zeros(3))
+    data = bytearray(path.read_bytes())
+    data[len(serialization.MAGIC)] = serialization.FORMAT_VERSION + 1
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="newer"):
+        gt4py.storage.load(path)
+
+    serialization.write(path, np.zeros(3))
+    with pytest.raises(ValueError, match="mutually exclusive"):
+        gt4py.storage.load(path, backend="numpy", mmap_mode="r")
+    with pytest.raises(ValueError, match="Invalid shape"):
+        serialization.read(path, np.zeros(4))
+    with pytest.raises(ValueError, match="dtype"):
+        serialization.write(path, np.zeros(3, dtype=[("a", float)]))
+
+
+def test_read_into_view(tmp_path):
+    path = tmp_path / "array.gt"
+    array = np.zeros((7, 8, 5))
+    serialization.write(path, np.ones_like(array)[2:-2, 2:-2])
+
+    # the stored array has the strides of the view, but the halo of `array` must not be touched
+    serialization.read(path, array[2:-2, 2:-2])
+    assert np.array_equal(array[2:-2, 2:-2], np.ones((3, 4, 5)))
+    array[2:-2, 2:-2] = 0
+    assert not array.any()
+
+
+def test_failed_write_leaves_no_file(tmp_path):
+    path = tmp_path / "array.gt"
+    with pytest.raises(ValueError, match="dtype"):
+        serialization.write(path, np.zeros(3, dtype="datetime64[s]"))
+    assert not list(tmp_path.iterdir())
+
+    serialization.write(path, np.zeros(3))
+    with pytest.raises(ValueError, match="dtype"):
+        serialization.write(path, np.zeros(3, dtype="timedelta64[s]"))
+    assert [p.name for p in tmp_path.iterdir()] == ["array.gt"]
+    assert np.array_equal(serialization.read(path)[1], np.zeros(3))